@@ -0,0 +1,239 @@
+import asyncio
+import pytest
+from signe import signal, effect, computed, reactive, on, batch, watch_patches
+from signe.core.on import WatchedState
+from signe.core.reactive import ChangeRecord
+from signe.core.runtime import ExecutionScheduler
+
+
+def test_context_manager():
+    scheduler = ExecutionScheduler()
+    a = signal(1, scheduler=scheduler)
+    b = signal(2, scheduler=scheduler)
+    dummy = []
+
+    @effect(scheduler=scheduler)
+    def _():
+        dummy.append(a.value + b.value)
+
+    with batch(scheduler=scheduler):
+        a.value = 10
+        b.value = 20
+        assert dummy == [3]
+
+    assert dummy == [3, 30]
+
+
+def test_nested_flush_once():
+    scheduler = ExecutionScheduler()
+    a = signal(1, scheduler=scheduler)
+    b = signal(2, scheduler=scheduler)
+    dummy = []
+
+    @computed(scheduler=scheduler)
+    def total():
+        return a.value + b.value
+
+    @effect(scheduler=scheduler)
+    def _():
+        dummy.append(total.value)
+
+    with batch(scheduler=scheduler):
+
+        @batch(scheduler=scheduler)
+        def _():
+            a.value = 10
+
+        # the inner batch does not expose half of the update
+        assert dummy == [3]
+        b.value = 20
+
+    assert dummy == [3, 30]
+
+
+def test_rollback():
+    scheduler = ExecutionScheduler()
+    a = signal(1, scheduler=scheduler)
+    b = signal(2, scheduler=scheduler)
+    dummy = []
+
+    @effect(scheduler=scheduler)
+    def _():
+        dummy.append((a.value, b.value))
+
+    with pytest.raises(ValueError):
+        with batch(scheduler=scheduler, rollback=True):
+            a.value = 10
+            with batch(scheduler=scheduler, rollback=True):
+                b.value = 20
+                a.value = 30
+            raise ValueError()
+
+    assert (a.value, b.value) == (1, 2)
+
+    # without an error, writes are kept
+    with batch(scheduler=scheduler, rollback=True):
+        a.value = 5
+
+    assert dummy[-1] == (5, 2)
+
+
+def test_inner_rollback_only():
+    scheduler = ExecutionScheduler()
+    a = signal(1, scheduler=scheduler)
+    b = signal(2, scheduler=scheduler)
+
+    with batch(scheduler=scheduler):
+        a.value = 10
+        try:
+            with batch(scheduler=scheduler, rollback=True):
+                b.value = 20
+                raise KeyError()
+        except KeyError:
+            pass
+
+    assert (a.value, b.value) == (10, 2)
+
+
+def test_async_with():
+    async def main():
+        scheduler = ExecutionScheduler()
+        a = signal(1, scheduler=scheduler)
+        dummy = []
+
+        @effect(scheduler=scheduler)
+        def _():
+            dummy.append(a.value)
+
+        async with batch(scheduler=scheduler):
+            a.value = 2
+            await asyncio.sleep(0)
+            a.value = 3
+
+        assert dummy == [1, 3]
+
+    asyncio.run(main())
+
+
+def test_deep_changes_in_batch():
+    scheduler = ExecutionScheduler()
+    data = reactive({"a": [1], "b": 1}, scheduler)
+    records = []
+    patches = []
+
+    on(
+        lambda: data,
+        lambda state: records.append(state.changes),
+        deep=True,
+        onchanges=True,
+        scheduler=scheduler,
+    )
+    watch_patches(data, patches.extend, scheduler=scheduler)
+
+    with batch(scheduler=scheduler):
+        data["a"].append(2)
+        data["b"] = 2
+        del data["a"][0]
+
+    assert records == [
+        (
+            ChangeRecord("add", ("a", 1), 2),
+            ChangeRecord("replace", ("b",), 2),
+            ChangeRecord("remove", ("a", 0)),
+        )
+    ]
+    assert [p["op"] for p in patches] == ["add", "replace", "remove"]
+
+
+def test_watched_state_in_batch():
+    scheduler = ExecutionScheduler()
+    a = signal(1, scheduler=scheduler)
+    states = []
+
+    on(a, lambda state: states.append(state), onchanges=True, scheduler=scheduler)
+
+    with batch(scheduler=scheduler):
+        a.value = 2
+        a.value = 3
+
+    assert states == [WatchedState(3, 1)]
+
+
+def test_net_unchanged_writes():
+    scheduler = ExecutionScheduler()
+    a = signal(1, scheduler=scheduler)
+    runs = []
+    recomputes = []
+
+    @computed(scheduler=scheduler)
+    def double():
+        recomputes.append(a.value)
+        return a.value * 2
+
+    @effect(scheduler=scheduler)
+    def _():
+        runs.append(double.value)
+
+    with batch(scheduler=scheduler):
+        a.value = 2
+        a.value = 3
+        a.value = 1
+
+    assert runs == [2]
+    assert recomputes == [1]
+
+    with batch(scheduler=scheduler):
+        a.value = 2
+        a.value = 3
+
+    assert runs == [2, 6]
+
+
+def test_computed_read_in_batch():
+    scheduler = ExecutionScheduler()
+    a = signal(1, scheduler=scheduler)
+    runs = []
+
+    @computed(scheduler=scheduler)
+    def double():
+        return a.value * 2
+
+    @effect(scheduler=scheduler)
+    def _():
+        runs.append(double.value)
+
+    with batch(scheduler=scheduler):
+        a.value = 5
+        assert double.value == 10
+        a.value = 6
+        assert runs == [2]
+
+    assert runs == [2, 12]
+
+
+def test_rollback_concurrent_tasks():
+    async def main():
+        scheduler = ExecutionScheduler()
+        a = signal(1, scheduler=scheduler)
+        b = signal(2, scheduler=scheduler)
+        entered = asyncio.Event()
+        written = asyncio.Event()
+
+        async def rolled_back():
+            with pytest.raises(ValueError):
+                async with batch(scheduler=scheduler, rollback=True):
+                    a.value = 10
+                    entered.set()
+                    await written.wait()
+                    raise ValueError()
+
+        async def other():
+            await entered.wait()
+            b.value = 20
+            written.set()
+
+        await asyncio.gather(rolled_back(), other())
+        return a.value, b.value
+
+    # the write of the other task is not part of the rolled back batch
+    assert asyncio.run(main()) == (1, 20)
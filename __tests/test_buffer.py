@@ -0,0 +1,95 @@
+import pytest
+
+from signe import effect
+from signe.core.buffer import BufferSignal, buffer_signal
+
+
+def test_page_range_readers():
+    buf = buffer_signal(256, page_size=64)
+    header = []
+    body = []
+
+    @effect
+    def _():
+        header.append(bytes(buf[0:4]))
+
+    @effect
+    def _():
+        body.append(bytes(buf.read(100, 130)))
+
+    buf.write(200, b"\x01\x02")
+    assert len(header) == 1
+    assert len(body) == 1
+
+    # bytes 60-67 span pages 0 and 1
+    buf.write(60, b"\x05" * 8)
+    assert header == [b"\x00" * 4, b"\x00" * 4]
+    assert body == [b"\x00" * 30, b"\x00" * 30]
+
+    # same bytes, nothing changed
+    buf.write(60, b"\x05" * 8)
+    assert len(header) == 2
+    assert len(body) == 2
+
+    buf[1] = 7
+    assert header[-1] == b"\x00\x07\x00\x00"
+
+
+def test_zero_copy_views():
+    raw = bytearray(b"abcdef")
+    buf = buffer_signal(raw)
+
+    view = buf[1:3]
+    assert view.readonly
+    assert view == b"bc"
+
+    raw[1] = ord("x")
+    assert view == b"xc"
+
+    with pytest.raises(TypeError):
+        view[0] = 1
+
+    with pytest.raises(TypeError):
+        buffer_signal(b"read only")
+
+
+def test_whole_buffer_readers():
+    buf = buffer_signal(bytearray(8), page_size=2)
+    calls = []
+
+    @effect
+    def _():
+        calls.append(sum(buf.value))
+
+    buf[4:6] = b"\x01\x01"
+    assert calls == [0, 2]
+
+    buf.write(4, b"\x01")
+    assert calls == [0, 2]
+
+    with pytest.raises(ValueError):
+        buf[0:2] = b"\x01"
+
+    with pytest.raises(IndexError):
+        buf.write(7, b"\x01\x02")
+
+
+def test_from_file(tmp_path):
+    path = tmp_path / "state.bin"
+    buf = BufferSignal.from_file(path, size=8192, page_size=4096)
+    assert len(buf) == 8192
+
+    calls = []
+
+    @effect
+    def reader():
+        calls.append(bytes(buf[4096:4100]))
+
+    buf.write(0, b"skip")
+    buf.write(4096, b"data")
+    assert calls == [b"\x00" * 4, b"data"]
+
+    reader.dispose()
+    buf.flush()
+    buf.close()
+    assert path.read_bytes()[4096:4100] == b"data"
@@ -1,6 +1,8 @@
 import asyncio
+import pytest
 from . import utils
 from signe import signal, computed, effect, async_computed
+from signe.core.async_computed import ResultCache
 
 
 class Test_computed_case:
@@ -276,3 +278,190 @@ class Test_async_computed:
             assert dummy_values == [0, 100]
 
         asyncio.run(main())
+
+    def test_latest_wins(self):
+        async def main():
+            a = signal(1)
+            started = []
+            finished = []
+
+            @async_computed(a, init=0)
+            async def test():
+                value = a.value
+                started.append(value)
+                await asyncio.sleep(0.05 if value == 2 else 0.01)
+                finished.append(value)
+                return value
+
+            a.value = 2
+            await asyncio.sleep(0)
+            assert test.task is not None
+
+            # the slow evaluation of 2 is cancelled
+            a.value = 3
+            a.value = 4
+            await asyncio.sleep(0.1)
+
+            assert started == [2, 4]
+            assert finished == [4]
+            assert test.value == 4
+            assert test.task is None
+
+        asyncio.run(main())
+
+    def test_superseded_result_is_ignored(self):
+        async def main():
+            a = signal(1)
+
+            @async_computed(a, init=0, cancel_superseded=False)
+            async def test():
+                value = a.value
+                await asyncio.sleep(0.05 if value == 2 else 0.01)
+                return value
+
+            a.value = 2
+            await asyncio.sleep(0)
+            a.value = 3
+            await asyncio.sleep(0.1)
+
+            assert test.value == 3
+
+        asyncio.run(main())
+
+    def test_debounce(self):
+        async def main():
+            a = signal("")
+            evaluating = signal(False)
+            queries = []
+
+            @async_computed(a, init="", debounce=0.02, evaluating=evaluating)
+            async def test():
+                queries.append(a.value)
+                return a.value.upper()
+
+            for text in ("s", "se", "sea"):
+                a.value = text
+                await asyncio.sleep(0.005)
+
+            assert evaluating.value
+            await asyncio.sleep(0.05)
+
+            assert queries == ["sea"]
+            assert test.value == "SEA"
+            assert not evaluating.value
+
+        asyncio.run(main())
+
+    def test_cache(self):
+        async def main():
+            now = [0.0]
+            cache = ResultCache(max_size=2, ttl=10, clock=lambda: now[0])
+            a = signal(1)
+            calls = []
+
+            @async_computed(a, init=0, cache=cache)
+            async def test():
+                calls.append(a.value)
+                await asyncio.sleep(0.01)
+                return a.value * 10
+
+            a.value = 2
+            await asyncio.sleep(0.02)
+            a.value = 3
+            await asyncio.sleep(0.02)
+            assert calls == [2, 3]
+
+            # seen before, resolved without awaiting the coroutine
+            a.value = 2
+            assert test.value == 20
+            assert test.task is None
+            assert calls == [2, 3]
+
+            # evicted by the size limit
+            a.value = 4
+            await asyncio.sleep(0.02)
+            a.value = 3
+            await asyncio.sleep(0.02)
+            assert calls == [2, 3, 4, 3]
+
+            # expired
+            now[0] = 20
+            a.value = 4
+            assert test.value == 30
+            await asyncio.sleep(0.02)
+            assert calls == [2, 3, 4, 3, 4]
+
+        asyncio.run(main())
+
+    def test_cache_stale_while_revalidate(self):
+        async def main():
+            now = [0.0]
+            cache = ResultCache(ttl=10, stale_while_revalidate=True, clock=lambda: now[0])
+            a = signal(1)
+            version = [1]
+
+            @async_computed(a, init=None, cache=cache)
+            async def test():
+                await asyncio.sleep(0.01)
+                return (a.value, version[0])
+
+            a.value = 2
+            await asyncio.sleep(0.02)
+            a.value = 3
+            await asyncio.sleep(0.02)
+
+            now[0] = 20
+            version[0] = 2
+            a.value = 2
+
+            # the stale value right away, refreshed in the background
+            assert test.value == (2, 1)
+            assert test.task is not None
+            await asyncio.sleep(0.02)
+            assert test.value == (2, 2)
+
+        asyncio.run(main())
+
+    def test_cache_keys(self):
+        from signe.core.async_computed import _freeze
+
+        assert _freeze({"a": 1}) != _freeze([("a", 1)])
+        assert _freeze({"a": 1, "b": 2}) == _freeze({"b": 2, "a": 1})
+        assert _freeze([1, {2}]) == _freeze((1, frozenset({2})))
+
+        class Point:
+            pass
+
+        with pytest.raises(TypeError):
+            _freeze([Point()])
+
+    def test_cache_skips_unfreezable_sources(self):
+        class Box:
+            def __init__(self, n):
+                self.n = n
+
+        async def main():
+            cache = ResultCache()
+            box = Box(1)
+            a = signal(Box(0), is_shallow=True)
+            calls = []
+
+            @async_computed(a, init=0, cache=cache)
+            async def test():
+                calls.append(a.value.n)
+                return a.value.n
+
+            for value in (box, Box(2)):
+                a.value = value
+                await asyncio.sleep(0.01)
+
+            box.n = 3
+            a.value = box
+            await asyncio.sleep(0.01)
+
+            # the mutated instance is evaluated again, not served from the cache
+            assert calls == [1, 2, 3]
+            assert test.value == 3
+            assert len(cache) == 0
+
+        asyncio.run(main())
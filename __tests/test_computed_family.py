@@ -0,0 +1,159 @@
+import gc
+import weakref
+
+import pytest
+from signe import signal, effect, scope
+from signe.core.runtime import ExecutionScheduler
+from signe.core.computed_family import computed_family
+
+
+def test_shared_members():
+    scheduler = ExecutionScheduler()
+    prices = signal({"a": 1, "b": 2}, scheduler=scheduler)
+    calls = []
+
+    @computed_family(scheduler=scheduler)
+    def price_of(symbol):
+        calls.append(symbol)
+        return prices.value[symbol] * 10
+
+    assert price_of("a") is price_of("a")
+    assert price_of("a").value == 10
+    assert price_of("a").value == 10
+    assert calls == ["a"]
+
+    dummy = []
+
+    @effect(scheduler=scheduler)
+    def _():
+        dummy.append((price_of("a").value, price_of("b").value))
+
+    prices.value = {"a": 3, "b": 2}
+    assert dummy == [(10, 20), (30, 20)]
+    # members survive the re-run of their readers
+    assert len(price_of) == 2
+
+
+def test_lru_eviction():
+    scheduler = ExecutionScheduler()
+    num = signal(1, scheduler=scheduler)
+
+    @computed_family(max_size=2, scheduler=scheduler)
+    def mul(n):
+        return num.value * n
+
+    observed = mul(1)
+
+    @effect(scheduler=scheduler)
+    def _():
+        observed.value
+
+    evicted = mul(2)
+    evicted.value
+    assert num._dep_manager._deps_map["value"].get_callers()
+
+    mul(3).value
+
+    # mul(1) is observed, mul(2) is the least recently used unobserved member
+    assert (1,) in mul and (2,) not in mul and (3,) in mul
+    assert all(
+        caller is not None and caller._owner is not evicted
+        for caller in num._dep_manager._deps_map["value"].get_callers()
+    )
+
+    # still referenced: the member comes back instead of a new one
+    assert mul(2) is evicted
+    assert mul(2).value == 2
+    assert (3,) not in mul
+
+    num.value = 5
+    assert evicted.value == 10
+
+
+def test_evicted_member_still_referenced():
+    scheduler = ExecutionScheduler()
+    num = signal(1, scheduler=scheduler)
+
+    @computed_family(max_size=1, scheduler=scheduler)
+    def mul(n):
+        return num.value * n
+
+    held = mul(2)
+    assert held.value == 2
+
+    mul(3).value
+    assert (2,) not in mul
+
+    num.value = 4
+    assert held.value == 8
+    # reading it again brought it back into the family
+    assert (2,) in mul and mul(2) is held
+
+    last = mul(3)
+    mul.dispose()
+    with pytest.raises(RuntimeError, match="disposed"):
+        last.value
+
+
+def test_evict_unobserved_and_scope():
+    scheduler = ExecutionScheduler()
+    num = signal(1, scheduler=scheduler)
+
+    s = scope()
+
+    def build():
+        @computed_family(scheduler=scheduler)
+        def mul(n):
+            return num.value * n
+
+        return mul
+
+    mul = s.run(build)
+    for n in range(5):
+        mul(n).value
+
+    assert mul.evict_unobserved() == 5
+    assert len(mul) == 0
+
+    mul(1).value
+    s.dispose()
+    assert len(mul) == 0
+    assert not num._dep_manager._deps_map["value"].get_callers()
+
+
+def test_evicted_member_is_collected():
+    scheduler = ExecutionScheduler()
+    num = signal(1, scheduler=scheduler)
+
+    @computed_family(max_size=1, scheduler=scheduler)
+    def mul(n):
+        return num.value * n
+
+    ref = weakref.ref(mul(2))
+    ref().value
+    mul(3).value
+
+    gc.collect()
+    assert ref() is None
+    assert len(num._dep_manager._deps_map["value"].get_callers()) == 1
+    assert mul(2).value == 2
+
+
+def test_released_member_is_evicted_later():
+    scheduler = ExecutionScheduler()
+    num = signal(1, scheduler=scheduler)
+
+    @computed_family(max_size=1, scheduler=scheduler)
+    def mul(n):
+        return num.value * n
+
+    observed = mul(1)
+    reader = effect(lambda: observed.value, scheduler=scheduler)
+
+    mul(2).value
+    assert (1,) in mul and (2,) in mul
+
+    reader.dispose()
+    # set aside as observed, checked again after one more creation
+    mul(3).value
+    assert (1,) not in mul and (2,) not in mul and (3,) in mul
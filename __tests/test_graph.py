@@ -0,0 +1,137 @@
+import json
+import warnings
+
+import pytest
+from signe import signal, effect, computed, reactive, scope
+from signe.core.runtime import ExecutionScheduler
+from signe.core.graph import inspect_graph
+
+
+def test_inspect_graph():
+    scheduler = ExecutionScheduler()
+    scheduler.track_signals()
+
+    num = signal(1, debug_name="num", scheduler=scheduler)
+
+    @computed(debug_name="double", scheduler=scheduler)
+    def double():
+        return num.value * 2
+
+    @effect(debug_name="printer", scheduler=scheduler)
+    def printer():
+        double.value
+        num.value
+
+    num.value = 2
+    num.value = 3
+
+    graph = inspect_graph(scheduler)
+    nodes = {node.name: node for node in graph.nodes.values()}
+
+    assert nodes["num"].kind == "signal"
+    assert nodes["num"].fan_out == 2
+    assert nodes["num"].trigger_count == 2
+    assert nodes["double"].kind == "computed"
+    assert nodes["double"].fan_in == 1
+    assert nodes["printer"].kind == "effect"
+    assert nodes["printer"].fan_in == 2
+    assert nodes["printer"].depth == 2
+
+    assert graph.downstream(num.id) == {double.id, printer.id}
+    assert graph.hot_spots(1)[0].name == "num"
+
+    data = json.loads(graph.to_json())
+    assert len(data["edges"]) == 3
+
+    dot = graph.to_dot()
+    assert dot.startswith("digraph")
+    assert f'"{num.id}" -> "{double.id}"' in dot
+
+
+def test_inspect_scope():
+    scheduler = ExecutionScheduler()
+    outside = signal(0, debug_name="outside", scheduler=scheduler)
+
+    s = scope()
+
+    def build():
+        data = reactive({"a": 1}, scheduler)
+
+        @effect(debug_name="reader", scheduler=scheduler)
+        def reader():
+            data["a"]
+            outside.value
+
+        return reader
+
+    reader = s.run(build)  # noqa: F841
+    graph = inspect_graph(s)
+    nodes = {node.name: node for node in graph.nodes.values()}
+
+    assert nodes["reader"].fan_in == 2
+    assert nodes["outside"].fan_out == 1
+    assert any(node.kind == "reactive" for node in graph.nodes.values())
+
+
+def test_untracked_scheduler_warns():
+    scheduler = ExecutionScheduler()
+    signal(1, scheduler=scheduler)
+
+    with pytest.warns(UserWarning, match="track_signals"):
+        graph = inspect_graph(scheduler)
+    assert graph.nodes == {}
+
+    scheduler.track_signals()
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        inspect_graph(scheduler)
+
+
+def test_to_dot_escapes_names():
+    scheduler = ExecutionScheduler()
+    scheduler.track_signals()
+    num = signal(1, debug_name='say "hi" \\ bye', scheduler=scheduler)
+    effect(lambda: num.value, debug_name="reader", scheduler=scheduler)
+
+    dot = inspect_graph(scheduler).to_dot()
+    assert 'say \\"hi\\" \\\\ bye' in dot
+
+
+def test_recent_triggers():
+    scheduler = ExecutionScheduler()
+    scheduler.track_signals()
+    busy = signal(0, debug_name="busy", scheduler=scheduler)
+    quiet = signal(0, debug_name="quiet", scheduler=scheduler)
+    effect(lambda: (busy.value, quiet.value), scheduler=scheduler)
+
+    for i in range(5):
+        quiet.value = i + 1
+
+    before = inspect_graph(scheduler)
+    busy.value = 1
+    busy.value = 2
+
+    graph = inspect_graph(scheduler, since=before)
+    nodes = {node.name: node for node in graph.nodes.values()}
+    assert nodes["quiet"].trigger_count == 5
+    assert nodes["quiet"].recent_triggers == 0
+    assert nodes["busy"].recent_triggers == 2
+    assert graph.hot_spots(1)[0].name == "busy"
+    assert graph.interval is not None and graph.interval >= 0
+
+
+def test_caller_that_is_not_an_effect():
+    class Listener:
+        """A caller without the `_owner` of effects."""
+
+    scheduler = ExecutionScheduler()
+    scheduler.track_signals()
+    num = signal(1, debug_name="num", scheduler=scheduler)
+    effect(lambda: num.value, scheduler=scheduler)
+
+    listener = Listener()
+    num._dep_manager._deps_map["value"].add_caller(listener)
+
+    graph = inspect_graph(scheduler)
+    nodes = {node.name: node for node in graph.nodes.values()}
+    assert nodes["num"].fan_out == 2
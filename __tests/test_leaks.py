@@ -0,0 +1,143 @@
+import gc
+
+from signe import signal, effect, computed, scope
+from signe.core.runtime import ExecutionScheduler
+from signe.core.leaks import LeakTracker
+
+
+def test_weak_subscriptions_release_abandoned_effects():
+    scheduler = ExecutionScheduler(weak_subscriptions=True)
+    num = signal(1, scheduler=scheduler)
+    calls = []
+
+    def create():
+        effect(lambda: calls.append(num.value), scheduler=scheduler)
+
+    create()
+    gc.collect()
+
+    num.value = 2
+    assert calls == [1]
+    assert num._dep_manager._deps_map["value"]._refs == {}
+
+
+def test_weak_subscriptions_keep_referenced_effects():
+    scheduler = ExecutionScheduler(weak_subscriptions=True)
+    num = signal(1, scheduler=scheduler)
+    calls = []
+
+    @computed(scheduler=scheduler)
+    def double():
+        return num.value * 2
+
+    @effect(scheduler=scheduler)
+    def printer():
+        calls.append(double.value)
+
+    gc.collect()
+    num.value = 2
+    assert calls == [2, 4]
+
+    printer.dispose()
+    num.value = 3
+    assert calls == [2, 4]
+    assert num._dep_manager._deps_map["value"].get_callers() == (double._effect,)
+
+
+def test_leak_report():
+    num = signal(1)
+    kept = []
+
+    tracker = LeakTracker()
+    tracker.start()
+
+    s = scope()
+
+    def build():
+        effect(lambda: num.value, debug_name="released")
+        kept.append(effect(lambda: num.value, debug_name="kept"))
+
+    s.run(build)
+    s.dispose()
+
+    entries = tracker.report()
+    assert [entry.name for entry in entries] == ["kept"]
+    assert "list" in entries[0].referrers
+
+    del entries
+    kept.clear()
+    assert tracker.report() == []
+    tracker.stop()
+
+
+def test_leak_report_nested_scopes():
+    num = signal(1)
+
+    tracker = LeakTracker()
+    tracker.start()
+
+    s = scope()
+    kept = s.run(
+        lambda: scope().run(lambda: effect(lambda: num.value, debug_name="kept"))
+    )
+    s.dispose()
+
+    assert [entry.node for entry in tracker.report()] == [kept]
+    tracker.stop()
+
+
+def test_leak_report_after_teardown():
+    num = signal(1)
+
+    tracker = LeakTracker()
+    tracker.start()
+
+    s = scope()
+    kept = s.run(lambda: effect(lambda: num.value, debug_name="kept"))
+    s.teardown()
+
+    assert [entry.node for entry in tracker.report()] == [kept]
+    tracker.stop()
+    tracker.reset()
+    assert tracker.report() == []
+
+
+def test_weak_subscriptions_async_computed():
+    import asyncio
+    from signe import async_computed
+
+    async def main():
+        scheduler = ExecutionScheduler(weak_subscriptions=True)
+        num = signal(1, scheduler=scheduler)
+
+        @async_computed(num, init=0, scheduler=scheduler)
+        async def doubled():
+            return num.value * 2
+
+        gc.collect()
+        num.value = 10
+        await asyncio.sleep(0.01)
+        return doubled.value
+
+    assert asyncio.run(main()) == 20
+
+
+def test_weak_subscriptions_operators():
+    from signe.core.operators import debounced, throttled, sampled
+    from signe.core.timing import ManualClock
+
+    scheduler = ExecutionScheduler(weak_subscriptions=True)
+    clock = ManualClock()
+    num = signal(1, scheduler=scheduler)
+
+    results = [
+        debounced(num, 0.1, clock=clock, scheduler=scheduler),
+        throttled(num, 0.1, clock=clock, scheduler=scheduler),
+        sampled(num, 0.1, clock=clock, scheduler=scheduler),
+    ]
+
+    gc.collect()
+    num.value = 2
+    clock.advance(0.2)
+
+    assert [result.value for result in results] == [2, 2, 2]
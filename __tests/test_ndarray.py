@@ -0,0 +1,125 @@
+import pytest
+
+from signe import effect, batch
+
+np = pytest.importorskip("numpy")
+
+from signe.core.ndarray import array_signal  # noqa: E402
+
+
+def test_region_readers():
+    arr = array_signal(np.zeros(100), block=10)
+    head_calls = []
+    tail_calls = []
+
+    @effect
+    def _():
+        head_calls.append(float(arr[:10].sum()))
+
+    @effect
+    def _():
+        tail_calls.append(float(arr[90:].sum()))
+
+    arr[50:60] = 1.0
+    assert head_calls == [0.0]
+    assert tail_calls == [0.0]
+
+    arr[3] = 2.0
+    assert head_calls == [0.0, 2.0]
+    assert tail_calls == [0.0]
+
+    arr[[1, 95]] = 1.0
+    assert head_calls == [0.0, 2.0, 3.0]
+    assert tail_calls == [0.0, 1.0]
+
+
+def test_unchanged_write_notifies_nothing():
+    arr = array_signal(np.array([1.0, np.nan, 3.0]), block=1)
+    calls = []
+
+    @effect
+    def _():
+        calls.append(arr.value.tolist())
+
+    arr[:] = [1.0, np.nan, 3.0]
+    arr[arr.value > 2] = 3.0
+    assert len(calls) == 1
+
+    arr[0] = 5.0
+    assert len(calls) == 2
+
+
+def test_fancy_and_mask_reads():
+    arr = array_signal(np.arange(16).reshape(4, 4), block=2)
+    calls = []
+
+    @effect
+    def _():
+        calls.append(int(arr[[0, 1], [0, 1]].sum()))
+
+    arr[3, 3] = 100
+    assert calls == [5]
+
+    arr[1, 0] = 100
+    assert calls == [5, 5]
+
+    arr[1, 1] = 0
+    assert calls == [5, 5, 0]
+
+
+def test_read_only_results():
+    arr = array_signal([1, 2, 3])
+    with pytest.raises(ValueError):
+        arr.value[0] = 10
+
+    with pytest.raises(ValueError):
+        arr[:2][0] = 10
+
+
+def test_replace_value():
+    arr = array_signal(np.zeros(4), block=2)
+    calls = []
+
+    @effect
+    def _():
+        calls.append(arr[:2].tolist())
+
+    arr.value = [0.0, 0.0, 1.0, 1.0]
+    assert len(calls) == 1
+
+    arr.value = np.ones(8)
+    assert calls[-1] == [1.0, 1.0]
+
+
+def test_writes_in_batch():
+    arr = array_signal(np.zeros(10), block=1)
+    calls = []
+
+    @effect
+    def _():
+        calls.append(float(arr[:5].sum()))
+
+    @batch
+    def _():
+        for i in range(5):
+            arr[i] = 1.0
+
+    assert calls == [0.0, 5.0]
+
+
+def test_block_ids_are_not_stored_per_element():
+    arr = array_signal(np.zeros((40, 30)), block=(10, 5))
+    calls = []
+
+    @effect
+    def _():
+        calls.append(float(arr[10:20, 5:10].sum()))
+
+    # one row per axis, broadcast over the others
+    assert all(0 in ids.strides for ids in arr._axis_ids)
+
+    arr.value = np.where(np.arange(30) < 5, 1.0, 0.0) * np.ones((40, 1))
+    assert calls == [0.0]
+
+    arr[15, 7] = 2.0
+    assert calls == [0.0, 2.0]
@@ -1,9 +1,23 @@
 import asyncio
+import copy
+import pickle
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import pytest
 from signe import signal, on, computed, batch, reactive
 from signe.core.on import WatchedState
+from signe.core.reactive import ChangeRecord
+from signe.core.runtime import ExecutionScheduler
 from . import utils
 
 
+def _record_in_process(state):
+    # runs in a worker process: the arguments were pickled
+    with open(state.current["path"], "a") as file:
+        file.write(f"{type(state).__name__} {state.current['n']} {state.previous['n']}\n")
+
+
 class Test_on:
     def test_basic(self):
         dummy1 = dummy2 = None
@@ -203,6 +217,68 @@ class Test_on:
         data.values.append(30)
         assert dummy == [2, 3]
 
+    def test_deep_mode_changes(self):
+        records = []
+        data = reactive({"a": {"b": [1, 2]}, "c": 1})
+
+        @on(lambda: data, deep=True, onchanges=True)
+        def _(state: WatchedState):
+            records.append(state.changes)
+
+        data["a"]["b"].append(3)
+        assert records == [(ChangeRecord("add", ("a", "b", 2), 3),)]
+
+        data["a"]["b"].extend([4, 5])
+        assert records[1] == (
+            ChangeRecord("add", ("a", "b", 3), 4),
+            ChangeRecord("add", ("a", "b", 4), 5),
+        )
+
+        del data["a"]["b"][0]
+        assert records[2] == (ChangeRecord("remove", ("a", "b", 0)),)
+
+    def test_deep_mode_removed_child(self):
+        dummy = []
+        data = reactive({"a": {"x": 1}})
+        child = data["a"]
+
+        @on(lambda: data, deep=True, onchanges=True)
+        def _(state: WatchedState):
+            dummy.append(state.changes)
+
+        data["a"] = {"x": 2}
+        assert len(dummy) == 1
+
+        child["x"] = 99
+        assert len(dummy) == 1
+
+        data["a"]["x"] = 3
+        assert dummy[-1] == (ChangeRecord("replace", ("a", "x"), 3),)
+
+    def test_watched_state_is_read_only_and_hashable(self):
+        state = WatchedState(2, 1)
+        assert state == WatchedState(2, 1, ())
+        assert len({state, WatchedState(2, 1)}) == 1
+
+        with pytest.raises(AttributeError):
+            state.current = 3  # type: ignore
+
+        with pytest.raises(AttributeError):
+            del state.previous
+
+        assert state.current == 2
+
+    def test_watched_state_pickle_and_copy(self):
+        state = WatchedState({"a": [1]}, None, (ChangeRecord("add", ("a", 0), 1),))
+
+        for clone in (
+            pickle.loads(pickle.dumps(state)),
+            copy.copy(state),
+            copy.deepcopy(state),
+        ):
+            assert clone == state
+            assert type(clone) is WatchedState
+
     def test_watch_on_reactive_list_in_class_shallow_mode(self):
         dummy = []
 
@@ -412,3 +488,111 @@ class Test_on:
             assert value_dummy == [99, 99]
 
         asyncio.run(main())
+
+    def test_executor(self):
+        scheduler = ExecutionScheduler()
+        num = signal(0, scheduler=scheduler)
+        data = signal({"a": 1}, scheduler=scheduler)
+
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        lock = threading.Lock()
+
+        def heavy(num_state, data_state):
+            if num_state.current == 1:
+                started.set()
+                release.wait(5)
+            with lock:
+                calls.append((num_state.current, num_state.previous, data_state.current))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            on(
+                [num, data],
+                heavy,
+                onchanges=True,
+                executor=executor,
+                scheduler=scheduler,
+            )
+
+            num.value = 1
+            assert started.wait(5)
+
+            # the run in progress holds the only slot, only the latest change waits
+            num.value = 2
+            num.value = 3
+            release.set()
+
+            for _ in range(500):
+                if len(calls) == 2:
+                    break
+                time.sleep(0.01)
+
+        assert calls == [(1, 0, {"a": 1}), (3, 2, {"a": 1})]
+        # raw values, not reactive proxies
+        assert type(calls[0][2]) is dict
+
+    def test_executor_gets_snapshots(self):
+        scheduler = ExecutionScheduler()
+        data = signal({"items": [1]}, scheduler=scheduler)
+
+        started = threading.Event()
+        release = threading.Event()
+        seen = []
+
+        def heavy(state):
+            started.set()
+            release.wait(5)
+            seen.append(state.current)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            on(data, heavy, onchanges=True, executor=executor, scheduler=scheduler)
+
+            data.value = {"items": [1, 2]}
+            assert started.wait(5)
+
+            # mutated while the worker holds the previous state
+            data.value["items"].append(3)
+            release.set()
+
+        assert seen[0] == {"items": [1, 2]}
+        assert list(data.value["items"]) == [1, 2, 3]
+
+    def test_process_pool_executor(self, tmp_path):
+        path = str(tmp_path / "calls.txt")
+        data = signal({"path": path, "n": 0})
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            on(data, _record_in_process, onchanges=True, executor=executor)
+            data.value = {"path": path, "n": 1}
+
+        with open(path) as file:
+            assert file.read().splitlines() == ["WatchedState 1 0"]
+
+    def test_executor_failed_run(self):
+        num = signal(0)
+        calls = []
+        done = threading.Event()
+
+        def fn(state):
+            calls.append(state.current)
+            if state.current == 1:
+                raise ValueError()
+            done.set()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            on(num, fn, onchanges=True, executor=executor)
+            num.value = 1
+            num.value = 2
+            assert done.wait(5)
+
+        # the failure stays in its future, later changes still run
+        assert calls[-1] == 2
+
+    def test_executor_rejects_async_fn(self):
+        async def fn(state):
+            pass  # pragma: no cover
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with pytest.raises(TypeError):
+                on(signal(1), fn, executor=executor)
@@ -0,0 +1,86 @@
+from signe import reactive, signal
+from signe.core.patch import watch_patches, to_json_pointer
+
+
+def test_json_pointer():
+    assert to_json_pointer(()) == ""
+    assert to_json_pointer(("a", 0, "b/c", "d~e")) == "/a/0/b~1c/d~0e"
+
+
+def test_dict_and_list_operations():
+    patches = []
+    state = reactive({"todos": [], "title": "t"})
+
+    watch_patches(state, patches.append)
+    assert patches == []
+
+    state["title"] = "new"
+    state["todos"].append({"done": False})
+    state["todos"][0]["done"] = True
+    state["todos"].pop()
+    del state["title"]
+
+    assert patches == [
+        [{"op": "replace", "path": "/title", "value": "new"}],
+        [{"op": "add", "path": "/todos/0", "value": {"done": False}}],
+        [{"op": "replace", "path": "/todos/0/done", "value": True}],
+        [{"op": "remove", "path": "/todos/0"}],
+        [{"op": "remove", "path": "/title"}],
+    ]
+
+
+def test_added_value_is_copied():
+    patches = []
+    state = reactive({"items": []})
+
+    watch_patches(state, patches.append)
+
+    state["items"].append({"x": 1})
+    state["items"][0]["x"] = 2
+
+    assert patches[0] == [{"op": "add", "path": "/items/0", "value": {"x": 1}}]
+
+
+def test_signal_source_replaced():
+    patches = []
+    state = signal({"a": 1})
+
+    watch_patches(state, patches.append)
+
+    state.value["a"] = 2
+    state.value = {"b": 1}
+    state.value["b"] = 2
+
+    assert patches == [
+        [{"op": "replace", "path": "/a", "value": 2}],
+        [{"op": "replace", "path": "", "value": {"b": 1}}],
+        [{"op": "replace", "path": "/b", "value": 2}],
+    ]
+
+
+def test_stop():
+    patches = []
+    state = reactive({"a": 1})
+
+    effect = watch_patches(state, patches.append)
+    effect.stop()
+
+    state["a"] = 2
+    assert patches == []
+
+
+def test_shared_child():
+    patches = []
+    child = {"v": 1}
+    state = reactive({"a": child})
+    state["b"] = child
+
+    watch_patches(state, patches.append)
+    state["a"]["v"] = 2
+
+    assert patches == [
+        [
+            {"op": "replace", "path": "/a/v", "value": 2},
+            {"op": "replace", "path": "/b/v", "value": 2},
+        ]
+    ]
@@ -0,0 +1,172 @@
+import json
+
+import pytest
+
+from signe import signal, batch, to_raw
+from signe.core.runtime import ExecutionScheduler
+from signe.core.persistence import PersistentStore
+
+
+def _read_lines(path):
+    with open(path, "rb") as f:
+        return f.read().splitlines()
+
+
+def test_persist_and_rehydrate(tmp_path):
+    path = tmp_path / "state.log"
+
+    store = PersistentStore(path, scheduler=ExecutionScheduler())
+    theme = store.signal("theme", "light")
+    data = store.signal("data", {"items": []})
+
+    theme.value = "dark"
+    data.value["items"].append(1)
+    store.close()
+
+    store = PersistentStore(path, scheduler=ExecutionScheduler())
+    assert store.signal("theme", "light").value == "dark"
+    assert store.signal("data", {}).value["items"][0] == 1
+    store.close()
+
+
+def test_one_record_per_flush(tmp_path):
+    path = tmp_path / "state.log"
+    scheduler = ExecutionScheduler()
+
+    store = PersistentStore(path, scheduler=scheduler, fsync=False)
+    num = store.signal("num", 0)
+
+    def update():
+        num.value = 1
+        num.value = 2
+        num.value = 3
+
+    batch(update, scheduler)
+
+    assert _read_lines(path) == [b'"num"\t3']
+
+
+def test_compact(tmp_path):
+    path = tmp_path / "state.log"
+    scheduler = ExecutionScheduler()
+
+    store = PersistentStore(path, scheduler=scheduler, min_compact_records=10)
+    num = store.signal("num", 0)
+
+    for i in range(9):
+        num.value = i + 1
+    assert len(_read_lines(path)) == 9
+
+    num.value = 100
+    assert _read_lines(path) == [b'"num"\t100']
+
+    num.value = 101
+    assert len(_read_lines(path)) == 2
+
+
+def test_torn_last_record(tmp_path):
+    path = tmp_path / "state.log"
+    path.write_bytes(b'"num"\t1\n"num"\t2')
+
+    store = PersistentStore(path, scheduler=ExecutionScheduler())
+    num = store.signal("num", 0)
+    assert num.value == 1
+
+    num.value = 5
+    assert _read_lines(path) == [b'"num"\t1', b'"num"\t5']
+
+
+def test_requires_name(tmp_path):
+    store = PersistentStore(tmp_path / "state.log")
+
+    with pytest.raises(ValueError):
+        store.bind(signal(1))
+
+
+def test_nested_mutation_writes_the_change(tmp_path):
+    path = tmp_path / "state.log"
+    scheduler = ExecutionScheduler()
+
+    store = PersistentStore(path, scheduler=scheduler, fsync=False)
+    data = store.signal("data", {"items": [], "big": list(range(100))})
+    data.value = {"items": [], "big": list(range(100))}
+    size = path.stat().st_size
+
+    def update():
+        data.value["items"].append({"v": 1})
+        data.value["items"][0]["v"] = 2
+        del data.value["big"]
+
+    batch(update, scheduler)
+
+    assert _read_lines(path)[1:] == [
+        b'["data", "add", ["items", 0]]\t{"v": 1}',
+        b'["data", "replace", ["items", 0, "v"]]\t2',
+        b'["data", "remove", ["big"]]\t',
+    ]
+    assert path.stat().st_size - size < 200
+    store.close()
+
+    store = PersistentStore(path, scheduler=ExecutionScheduler())
+    assert to_raw(store.signal("data", {}).value) == {"items": [{"v": 2}]}
+    store.close()
+
+
+def test_nested_mutation_without_full_record(tmp_path):
+    path = tmp_path / "state.log"
+    scheduler = ExecutionScheduler()
+
+    store = PersistentStore(path, scheduler=scheduler, fsync=False)
+    data = store.signal("data", {"items": []})
+    data.value["items"].append(1)
+    store.close()
+
+    # the default value was never written, so the whole value is
+    assert _read_lines(path) == [b'"data"\t{"items": [1]}']
+
+
+def test_compact_keeps_changes_of_unbound_keys(tmp_path):
+    path = tmp_path / "state.log"
+    scheduler = ExecutionScheduler()
+
+    store = PersistentStore(path, scheduler=scheduler, fsync=False)
+    data = store.signal("data", {"n": 0})
+    data.value = {"n": 0}
+    data.value["n"] = 1
+    store.close()
+
+    store = PersistentStore(
+        path, scheduler=scheduler, fsync=False, min_compact_records=4
+    )
+    num = store.signal("num", 0)
+    num.value = 1
+    num.value = 2
+    assert _read_lines(path) == [
+        b'"data"\t{"n": 0}',
+        b'["data", "replace", ["n"]]\t1',
+        b'"num"\t2',
+    ]
+    store.close()
+
+    store = PersistentStore(path, scheduler=ExecutionScheduler())
+    assert to_raw(store.signal("data", {}).value) == {"n": 1}
+    assert store.signal("num", 0).value == 2
+    store.close()
+
+
+def test_rejects_newlines_from_dumps(tmp_path):
+    path = tmp_path / "state.log"
+    scheduler = ExecutionScheduler()
+
+    store = PersistentStore(
+        path,
+        scheduler=scheduler,
+        fsync=False,
+        dumps=lambda value: json.dumps(value, indent=2),
+    )
+    data = store.signal("data", {})
+
+    with pytest.raises(ValueError, match="newline"):
+        data.value = {"a": 1}
+
+    assert _read_lines(path) == []
@@ -0,0 +1,81 @@
+from signe import signal, effect, computed, batch
+from signe.core.runtime import ExecutionScheduler
+from signe.core.profiling import ProfileCollector, SchedulerHooks
+
+
+def test_collector():
+    scheduler = ExecutionScheduler()
+    ticks = iter(range(1000))
+    collector = ProfileCollector(clock=lambda: next(ticks)).attach(scheduler)
+
+    num = signal(1, debug_name="num", scheduler=scheduler)
+
+    @computed(debug_name="double", scheduler=scheduler)
+    def double():
+        return num.value * 2
+
+    @effect(debug_name="printer", scheduler=scheduler)
+    def _():
+        double.value
+
+    num.value = 2
+    num.value = 3
+
+    stats = {s.name: s for s in collector.report()}
+    assert stats["printer"].runs == 3
+    assert stats["printer"].kind == "effect"
+    assert stats["double"].runs == 3
+    assert stats["double"].kind == "computed"
+    assert stats["printer"].p99 > 0
+
+    assert collector.trigger_counts["num"] == 2
+    assert collector.trigger_counts["double"] == 2
+    assert collector.flush_count == 2
+
+    collector.detach()
+    assert scheduler.hooks is None
+
+    num.value = 4
+    assert stats["printer"].runs == 3
+
+
+def test_custom_hooks():
+    events = []
+
+    class Hooks(SchedulerHooks):
+        def on_flush_start(self):
+            events.append("flush_start")
+
+        def on_flush_end(self):
+            events.append("flush_end")
+
+        def on_effect_start(self, effect):
+            events.append(("start", effect.debug_name))
+
+    scheduler = ExecutionScheduler()
+    scheduler.set_hooks(Hooks())
+
+    a = signal(1, scheduler=scheduler)
+    b = signal(1, scheduler=scheduler)
+    effect(lambda: a.value + b.value, debug_name="sum", scheduler=scheduler)
+    events.clear()
+
+    def update():
+        a.value = 2
+        b.value = 2
+
+    batch(update, scheduler)
+    assert events == ["flush_start", ("start", "sum"), "flush_end"]
+
+
+def test_collector_attached_while_effect_runs():
+    scheduler = ExecutionScheduler()
+    collector = ProfileCollector()
+
+    @effect(scheduler=scheduler)
+    def _():
+        collector.attach(scheduler)
+        # the end of a run whose start the collector did not see
+        collector.on_effect_end(scheduler.get_running_caller())
+
+    assert collector.stats == {}
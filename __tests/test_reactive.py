@@ -1,5 +1,6 @@
 from copy import deepcopy
 from dataclasses import dataclass
+import pytest
 from signe import (
     reactive,
     computed,
@@ -394,6 +395,57 @@ class Test_base_case:
 
         assert dummy == ["1,2,3", "1,3"]
 
+    def test_list_del_item_empty(self):
+        data = reactive([])
+
+        with pytest.raises(IndexError):
+            del data[0]
+
+    def test_no_journal_walk_without_watchers(self, monkeypatch):
+        from weakref import WeakSet
+        from signe.core import reactive as reactive_module
+
+        # watchers left alive by other tests do not count
+        monkeypatch.setattr(reactive_module, "_watching", WeakSet())
+
+        data = reactive({"a": {"b": [1]}})
+        watcher = reactive_module.DeepWatcher()
+        watcher.watch(data)
+        data["a"]["b"].append(2)
+        assert [r.path for r in watcher.drain()] == [("a", "b", 1)]
+
+        watcher.unwatch()
+
+        def fail(*args):
+            raise AssertionError("journal walked")  # pragma: no cover
+
+        monkeypatch.setattr(reactive_module, "_resolve_keys", fail)
+        data["a"]["b"].append(3)
+
+    def test_shared_child_reports_every_path(self):
+        from signe.core import reactive as reactive_module
+
+        child = {"v": 1}
+        data = reactive({"a": child, "b": child, "items": [child, child]})
+        watcher = reactive_module.DeepWatcher()
+        watcher.watch(data)
+
+        data["a"]["v"] = 2
+        assert [r.path for r in watcher.drain()] == [
+            ("a", "v"),
+            ("b", "v"),
+            ("items", 0, "v"),
+            ("items", 1, "v"),
+        ]
+
+        del data["b"]
+        data["items"].pop(0)
+        watcher.drain()
+
+        data["a"]["v"] = 3
+        assert [r.path for r in watcher.drain()] == [("a", "v"), ("items", 0, "v")]
+        watcher.unwatch()
+
     def test_list_extend(self):
         dummy = []
 
@@ -504,6 +556,23 @@ class Test_base_case:
         assert isinstance(data.value[0], Model)
         assert data.value[0] is m
 
+    def test_instance_proxy_is_released(self):
+        import gc
+        import weakref
+
+        class Model:
+            def __init__(self) -> None:
+                self.x = 1
+
+        m = Model()
+        proxy = reactive(m)
+        assert proxy.x == 1
+
+        m_ref = weakref.ref(m)
+        del m, proxy
+        gc.collect()
+        assert m_ref() is None
+
 
 class Test_to_raw:
     def test_signal_list(self):
@@ -0,0 +1,256 @@
+import asyncio
+import socket
+import sys
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+import pytest
+from signe import signal, effect
+from signe.core.runtime import ExecutionScheduler
+from signe.core.replication import ReplicationPrimary, ReplicationReplica
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="uses a unix socket address"
+)
+
+KEY = b"secret"
+
+
+def _poll_until(replica: ReplicationReplica, seq: int):
+    for _ in range(100):
+        replica.poll(0.05)
+        if replica.seq >= seq:
+            return
+    raise AssertionError("replica did not catch up")  # pragma: no cover
+
+
+def test_replicate(tmp_path):
+    address = str(tmp_path / "primary.sock")
+
+    primary_scheduler = ExecutionScheduler()
+    flag = signal(False, debug_name="flag", scheduler=primary_scheduler)
+    config = signal({"level": 1}, debug_name="config", scheduler=primary_scheduler)
+    primary = ReplicationPrimary(
+        address, [flag, config], authkey=KEY, scheduler=primary_scheduler
+    )
+
+    replica_scheduler = ExecutionScheduler()
+    r_flag = signal(None, scheduler=replica_scheduler)
+    r_config = signal(None, scheduler=replica_scheduler)
+    replica = ReplicationReplica(
+        address,
+        {"flag": r_flag, "config": r_config},
+        authkey=KEY,
+        scheduler=replica_scheduler,
+    )
+
+    records = []
+    effect(lambda: records.append(r_flag.value), scheduler=replica_scheduler)
+
+    _poll_until(replica, 0)
+    assert r_flag.value is False
+    assert r_config.value["level"] == 1
+    assert records == [None, False]
+
+    flag.value = True
+    config.value["level"] = 2
+    _poll_until(replica, 2)
+
+    assert r_flag.value is True
+    assert r_config.value["level"] == 2
+    assert records == [None, False, True]
+
+    # resync on reconnect
+    replica.disconnect()
+    flag.value = False
+    _poll_until(replica, 3)
+    assert r_flag.value is False
+
+    replica.close()
+    primary.close()
+
+
+def test_attach_to_loop(tmp_path):
+    address = str(tmp_path / "primary.sock")
+
+    primary_scheduler = ExecutionScheduler()
+    num = signal(1, debug_name="num", scheduler=primary_scheduler)
+    primary = ReplicationPrimary(
+        address, [num], authkey=KEY, scheduler=primary_scheduler
+    )
+
+    replica_scheduler = ExecutionScheduler()
+    r_num = signal(0, scheduler=replica_scheduler)
+    replica = ReplicationReplica(
+        address, {"num": r_num}, authkey=KEY, scheduler=replica_scheduler
+    )
+
+    async def main():
+        replica.attach(asyncio.get_running_loop())
+        replica.connect()
+
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if r_num.value == 1:
+                break
+        assert r_num.value == 1
+
+        num.value = 2
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if r_num.value == 2:
+                break
+        assert r_num.value == 2
+
+    asyncio.run(main())
+    replica.close()
+    primary.close()
+
+
+def test_authkey_required(tmp_path):
+    address = str(tmp_path / "primary.sock")
+    num = signal(1, debug_name="num")
+
+    with pytest.raises(TypeError):
+        ReplicationPrimary(address, [num], authkey=None)  # type: ignore
+
+    primary = ReplicationPrimary(address, [num], authkey=KEY)
+    with pytest.raises(AuthenticationError):
+        Client(address, authkey=b"wrong")
+    primary.close()
+
+
+def test_silent_client_does_not_block_others(tmp_path):
+    address = str(tmp_path / "primary.sock")
+
+    primary_scheduler = ExecutionScheduler()
+    num = signal(1, debug_name="num", scheduler=primary_scheduler)
+    primary = ReplicationPrimary(
+        address, [num], authkey=KEY, scheduler=primary_scheduler
+    )
+
+    # connects and never answers the handshake
+    silent = socket.socket(socket.AF_UNIX)
+    silent.connect(address)
+
+    replica_scheduler = ExecutionScheduler()
+    r_num = signal(0, scheduler=replica_scheduler)
+    replica = ReplicationReplica(
+        address, {"num": r_num}, authkey=KEY, scheduler=replica_scheduler
+    )
+    _poll_until(replica, 0)
+    assert r_num.value == 1
+
+    silent.close()
+    replica.close()
+    primary.close()
+
+
+def test_slow_replica_does_not_stall_flush(tmp_path):
+    address = str(tmp_path / "primary.sock")
+
+    primary_scheduler = ExecutionScheduler()
+    num = signal(1, debug_name="num", scheduler=primary_scheduler)
+    primary = ReplicationPrimary(
+        address, [num], authkey=KEY, scheduler=primary_scheduler
+    )
+
+    replica_scheduler = ExecutionScheduler()
+    r_num = signal(0, scheduler=replica_scheduler)
+    replica = ReplicationReplica(
+        address, {"num": r_num}, authkey=KEY, scheduler=replica_scheduler
+    )
+    _poll_until(replica, 0)
+
+    release = threading.Event()
+    link = primary._links[0]
+    send = link._conn.send
+
+    def slow_send(message):
+        release.wait(5)
+        send(message)
+
+    link._conn.send = slow_send
+
+    start = time.perf_counter()
+    num.value = 2
+    assert time.perf_counter() - start < 1
+
+    release.set()
+    _poll_until(replica, 1)
+    assert r_num.value == 2
+
+    replica.close()
+    primary.close()
+
+
+def test_poll_without_primary(tmp_path):
+    address = str(tmp_path / "primary.sock")
+
+    replica_scheduler = ExecutionScheduler()
+    r_num = signal(0, scheduler=replica_scheduler)
+    replica = ReplicationReplica(
+        address, {"num": r_num}, authkey=KEY, scheduler=replica_scheduler
+    )
+
+    assert replica.poll() == 0
+    assert not replica.connected
+
+    primary_scheduler = ExecutionScheduler()
+    num = signal(1, debug_name="num", scheduler=primary_scheduler)
+    primary = ReplicationPrimary(
+        address, [num], authkey=KEY, scheduler=primary_scheduler
+    )
+
+    _poll_until(replica, 0)
+    assert r_num.value == 1
+
+    replica.close()
+    primary.close()
+
+
+def test_attached_replica_reconnects(tmp_path):
+    address = str(tmp_path / "primary.sock")
+
+    primary_scheduler = ExecutionScheduler()
+    num = signal(1, debug_name="num", scheduler=primary_scheduler)
+    primary = ReplicationPrimary(
+        address, [num], authkey=KEY, scheduler=primary_scheduler
+    )
+
+    replica_scheduler = ExecutionScheduler()
+    r_num = signal(0, scheduler=replica_scheduler)
+    replica = ReplicationReplica(
+        address,
+        {"num": r_num},
+        authkey=KEY,
+        reconnect_delay=0.02,
+        scheduler=replica_scheduler,
+    )
+
+    async def wait_for(value):
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            if r_num.value == value:
+                return
+        raise AssertionError("replica did not catch up")  # pragma: no cover
+
+    async def main():
+        nonlocal primary
+        replica.attach(asyncio.get_running_loop())
+        replica.connect()
+        await wait_for(1)
+
+        primary.close()
+        await asyncio.sleep(0.05)
+
+        num.value = 3
+        primary = ReplicationPrimary(
+            address, [num], authkey=KEY, scheduler=primary_scheduler
+        )
+        await wait_for(3)
+
+    asyncio.run(main())
+    replica.close()
+    primary.close()
@@ -1,5 +1,7 @@
-from signe import computed, effect, signal
-from signe.core.runtime import ExecutionScheduler
+import asyncio
+import pytest
+from signe import batch, computed, effect, signal
+from signe.core.runtime import ExecutionScheduler, SchedulerLoopError
 
 
 class Test_custom:
@@ -51,3 +53,246 @@ class Test_custom:
 
         data.value.insert(0, 1)
         assert dummy["count"] == 2
+
+
+class Test_loop_detection:
+    def test_runaway_effects(self):
+        cs = ExecutionScheduler(runaway_rounds=10)
+
+        x = signal(0, scheduler=cs)
+        y = signal(0, scheduler=cs)
+
+        @effect(scheduler=cs, debug_name="a")
+        def _():
+            y.value = x.value + 1
+
+        with pytest.raises(SchedulerLoopError) as exc_info:
+
+            @effect(scheduler=cs, debug_name="b")
+            def _():
+                x.value = y.value + 1
+
+        assert [e.debug_name for e in exc_info.value.effects] == ["a", "b"]
+        assert "a, b" in str(exc_info.value)
+        # aborted after about 2 * runaway_rounds rounds
+        assert x.value < 50
+
+    def test_runaway_blames_only_the_loop(self):
+        cs = ExecutionScheduler(runaway_rounds=10)
+        assert ExecutionScheduler().runaway_rounds is None
+
+        x = signal(0, scheduler=cs)
+        y = signal(0, scheduler=cs)
+        seen = []
+
+        @effect(scheduler=cs, debug_name="a")
+        def _():
+            y.value = x.value + 1
+
+        # downstream of the loop, scheduled as often as its effects
+        @effect(scheduler=cs, debug_name="reader")
+        def _():
+            seen.append(x.value)
+
+        with pytest.raises(SchedulerLoopError) as exc_info:
+
+            @effect(scheduler=cs, debug_name="b")
+            def _():
+                x.value = y.value + 1
+
+        assert [e.debug_name for e in exc_info.value.effects] == ["a", "b"]
+        assert len(seen) > 10
+
+    def test_long_chain_is_not_runaway(self):
+        cs = ExecutionScheduler(runaway_rounds=3)
+
+        signals = [signal(0, scheduler=cs) for _ in range(10)]
+
+        for src, dst in zip(signals, signals[1:]):
+
+            def make(src, dst):
+                @effect(scheduler=cs)
+                def _():
+                    dst.value = src.value
+
+            make(src, dst)
+
+        signals[0].value = 1
+        assert signals[-1].value == 1
+
+    def test_max_rounds(self):
+        cs = ExecutionScheduler(max_rounds=5)
+
+        signals = [signal(0, scheduler=cs) for _ in range(10)]
+
+        for src, dst in zip(signals, signals[1:]):
+
+            def make(src, dst):
+                @effect(scheduler=cs)
+                def _():
+                    dst.value = src.value
+
+            make(src, dst)
+
+        with pytest.raises(SchedulerLoopError):
+            signals[0].value = 1
+
+
+class Test_sliced_flush:
+    def test_run_sliced(self):
+        cs = ExecutionScheduler()
+        num = signal(0, scheduler=cs)
+        dummy = []
+
+        for i in range(20):
+
+            def make(i):
+                @effect(scheduler=cs)
+                def _():
+                    dummy.append((i, num.value))
+
+            make(i)
+
+        dummy.clear()
+
+        async def main():
+            heartbeats = []
+
+            async def heartbeat():
+                for _ in range(5):
+                    heartbeats.append(len(dummy))
+                    await asyncio.sleep(0)
+
+            def write():
+                num.value = 1
+
+            cs.pause_scheduling()
+            write()
+            cs.reset_scheduling()
+
+            await asyncio.gather(cs.run_sliced(budget=0), heartbeat())
+            return heartbeats
+
+        heartbeats = asyncio.run(main())
+
+        assert sorted(dummy) == [(i, 1) for i in range(20)]
+        # the event loop ran between the slices
+        assert 0 < heartbeats[-1] < 20
+        assert cs.sliced_stats.flushes == 1
+        assert cs.sliced_stats.slices > 1
+
+    def test_async_flush_mode(self):
+        cs = ExecutionScheduler()
+        cs.enable_async_flush(budget=0.005)
+
+        num = signal(0, scheduler=cs)
+        dummy = []
+
+        @computed(scheduler=cs)
+        def double():
+            return num.value * 2
+
+        @effect(scheduler=cs)
+        def _():
+            dummy.append(double.value)
+
+        async def main():
+            num.value = 1
+            num.value = 2
+            assert dummy == [0]
+
+            await cs.flush_task
+
+        asyncio.run(main())
+
+        assert dummy == [0, 4]
+        assert cs.flush_task is None
+        assert cs.sliced_stats.flushes == 1
+
+        # without a running loop, flushes stay synchronous
+        num.value = 3
+        assert dummy == [0, 4, 6]
+
+
+class Test_run_queue:
+    def test_effect_queued_once(self):
+        class CountingScheduler(ExecutionScheduler):
+            pushes = 0
+
+            def push_scheduler_fn(self, fn):
+                self.pushes += 1
+                super().push_scheduler_fn(fn)
+
+        cs = CountingScheduler()
+        sources = [signal(0, scheduler=cs) for _ in range(20)]
+        runs = []
+
+        @effect(scheduler=cs)
+        def eff():
+            runs.append(sum(s.value for s in sources))
+
+        def update():
+            for s in sources:
+                s.value += 1
+
+        batch(update, cs)
+
+        assert runs == [0, 20]
+        assert cs.pushes == 1
+        assert not eff._queued
+
+    def test_effect_raising_during_flush(self):
+        scheduler = ExecutionScheduler()
+        a = signal(0, scheduler=scheduler)
+        b = signal(0, scheduler=scheduler)
+        runs = []
+
+        @effect(scheduler=scheduler)
+        def failing():
+            if a.value == 1:
+                raise ValueError("boom")
+
+        @effect(scheduler=scheduler)
+        def other():
+            runs.append(b.value)
+
+        def update():
+            a.value = 1
+            b.value = 1
+
+        # queued in write order: failing, then other
+        with pytest.raises(ValueError):
+            batch(update, scheduler)
+
+        assert not other._queued
+
+        b.value = 2
+        assert runs[-1] == 2
+
+    def test_effect_raising_during_sliced_flush(self):
+        scheduler = ExecutionScheduler()
+        a = signal(0, scheduler=scheduler)
+        b = signal(0, scheduler=scheduler)
+        runs = []
+
+        @effect(scheduler=scheduler)
+        def failing():
+            if a.value == 1:
+                raise ValueError("boom")
+
+        @effect(scheduler=scheduler)
+        def other():
+            runs.append(b.value)
+
+        scheduler.pause_scheduling()
+        a.value = 1
+        b.value = 1
+        scheduler.reset_scheduling()
+
+        with pytest.raises(ValueError):
+            asyncio.run(scheduler.run_sliced(budget=1.0))
+
+        assert not other._queued
+
+        b.value = 2
+        assert runs[-1] == 2
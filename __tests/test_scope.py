@@ -197,3 +197,253 @@ def test_nested_scope():
 
     temp_run(1)
     assert computed_rc.calledTimes == 2
+
+
+class Test_pause:
+    def test_paused_effect_runs_once_on_resume(self):
+        num = signal(1)
+        calls = []
+
+        s = scope()
+
+        def build():
+            @computed
+            def double():
+                calls.append("cp")
+                return num.value * 2
+
+            @effect
+            def _():
+                calls.append(double.value)
+
+        s.run(build)
+        assert calls == ["cp", 2]
+
+        s.pause()
+        num.value = 2
+        num.value = 3
+        num.value = 4
+        assert calls == ["cp", 2]
+
+        s.resume()
+        assert calls == ["cp", 2, "cp", 8]
+
+        num.value = 5
+        assert calls == ["cp", 2, "cp", 8, "cp", 10]
+        s.dispose()
+
+    def test_paused_computed_is_fresh_when_read_outside(self):
+        num = signal(1)
+        s = scope()
+
+        double = s.run(lambda: computed(lambda: num.value * 2))
+        outside = []
+
+        @effect
+        def _():
+            outside.append(double.value)
+
+        s.pause()
+        num.value = 2
+        assert outside == [2]
+
+        # pulling the computed refreshes it and its readers outside the scope
+        assert double.value == 4
+        assert outside == [2, 4]
+
+        s.resume()
+        assert outside == [2, 4]
+        s.dispose()
+
+    def test_child_scope_waits_for_paused_parent(self):
+        num = signal(1)
+        calls = []
+
+        parent = scope()
+
+        def build():
+            child = scope()
+            child.run(lambda: effect(lambda: calls.append(num.value)))
+            return child
+
+        child = parent.run(build)
+        parent.pause()
+        child.pause()
+
+        num.value = 2
+        child.resume()
+        assert calls == [1]
+
+        parent.resume()
+        assert calls == [1, 2]
+        parent.dispose()
+
+    def test_resume_without_changes(self):
+        num = signal(1)
+        calls = []
+
+        s = scope()
+        s.run(lambda: effect(lambda: calls.append(num.value)))
+
+        s.pause()
+        assert s.paused
+        s.resume()
+        assert not s.paused
+        assert calls == [1]
+        s.dispose()
+
+
+class Test_dispose_tree:
+    def test_deep_scope_tree(self):
+        num = signal(1)
+        calls = []
+        root = scope()
+
+        def nest(depth):
+            current = root
+            for _ in range(depth):
+                current = current.run(scope)
+            current.run(lambda: effect(lambda: calls.append(num.value)))
+
+        nest(3000)
+        root.dispose()
+
+        num.value = 2
+        assert calls == [1]
+        assert num._dep_manager._deps_map["value"].get_callers() == ()
+
+    def test_order(self):
+        records = []
+        root = scope()
+
+        def build():
+            root._cleanups.append(lambda: records.append("root"))
+            for name in ("a", "b"):
+                child = scope()
+                child._cleanups.append(lambda name=name: records.append(name))
+                child.run(
+                    lambda name=name: scope()._cleanups.append(
+                        lambda: records.append(name + ".1")
+                    )
+                )
+
+        root.run(build)
+        root.dispose()
+        assert records == ["root", "a", "a.1", "b", "b.1"]
+
+
+class Test_teardown:
+    def test_unsubscribes_outside_sources(self):
+        num = signal(1)
+        calls = []
+        cleanups = []
+
+        s = scope()
+
+        def build():
+            @computed
+            def double():
+                return num.value * 2
+
+            @effect
+            def _():
+                calls.append(double.value + num.value)
+
+            child = scope()
+            child.run(lambda: effect(lambda: calls.append(double.value)))
+
+            s._cleanups.append(lambda: cleanups.append("parent"))
+            child._cleanups.append(lambda: cleanups.append("child"))
+
+        s.run(build)
+        assert sorted(calls) == [2, 3]
+
+        s.teardown()
+        assert not s.active
+        assert cleanups == ["parent", "child"]
+        assert num._dep_manager._deps_map["value"].get_callers() == ()
+
+        num.value = 2
+        assert sorted(calls) == [2, 3]
+
+    def test_outside_computed_and_reader(self):
+        num = signal(1)
+        calls = []
+
+        double = computed(lambda: num.value * 2)
+        s = scope()
+
+        def build():
+            inner = computed(lambda: double.value + 1)
+            effect(lambda: calls.append(inner.value))
+            return inner
+
+        inner = s.run(build)
+        outside = effect(lambda: calls.append(("outside", inner.value)))
+        assert calls == [3, ("outside", 3)]
+
+        s.teardown()
+        assert double._dep_manager._deps_map["value"].get_callers() == ()
+
+        num.value = 2
+        assert calls == [3, ("outside", 3)]
+        outside.dispose()
+
+    def test_sub_effects(self):
+        num = signal(1)
+        flag = signal(True)
+        calls = []
+        s = scope()
+
+        @s.run
+        def parent():
+            @effect
+            def _():
+                if flag.value:
+                    effect(lambda: calls.append(num.value))
+
+        # created on a re-run, outside of any scope
+        flag.value = False
+        flag.value = True
+        assert calls == [1, 1]
+
+        s.teardown()
+        num.value = 2
+        assert calls == [1, 1]
+        assert num._dep_manager._deps_map["value"].get_callers() == ()
+
+    def test_deep_scope_tree(self):
+        num = signal(1)
+        calls = []
+        root = scope()
+
+        current = root
+        for _ in range(3000):
+            current = current.run(scope)
+        current.run(lambda: effect(lambda: calls.append(num.value)))
+
+        root.teardown()
+
+        num.value = 2
+        assert calls == [1]
+        assert num._dep_manager._deps_map["value"].get_callers() == ()
+
+    def test_child_teardown_leaves_parent(self):
+        num = signal(1)
+        calls = []
+        parent = scope()
+
+        def build():
+            child = scope()
+            child.run(lambda: effect(lambda: calls.append(("child", num.value))))
+            effect(lambda: calls.append(("parent", num.value)))
+            return child
+
+        child = parent.run(build)
+        child.teardown()
+        assert parent._scopes == []
+
+        num.value = 2
+        assert calls[-1] == ("parent", 2)
+        assert ("child", 2) not in calls
+        parent.dispose()
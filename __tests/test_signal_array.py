@@ -0,0 +1,133 @@
+import pytest
+
+from signe import effect, on, computed, to_value
+from signe.core.signal_array import signal_array
+
+
+def test_only_observed_indices_have_deps():
+    arr = signal_array(range(1000))
+    calls = []
+
+    @effect
+    def _():
+        calls.append(arr[10] + arr[-1])
+
+    assert calls == [1009]
+    assert sorted(arr._dep_manager._deps_map) == [10, 999]
+
+    arr[11] = 0
+    assert calls == [1009]
+
+    arr[10] = 0
+    assert calls == [1009, 999]
+
+    arr[10] = 0
+    assert calls == [1009, 999]
+
+
+def test_bulk_assignment_notifies_changed_observed():
+    arr = signal_array([0] * 100, "i")
+    first = []
+    last = []
+
+    effect(lambda: first.append(arr[0]))
+    effect(lambda: last.append(arr[99]))
+
+    arr[0:50] = range(50)
+    assert first == [0]
+    assert last == [0]
+
+    arr.assign([1] * 100)
+    assert first == [0, 1]
+    assert last == [0, 1]
+
+    arr.update([0, 5], [2, 2])
+    assert first == [0, 1, 2]
+    assert last == [0, 1]
+
+    with pytest.raises(ValueError):
+        arr[0:10] = [1, 2]
+
+
+def test_whole_array_readers():
+    arr = signal_array([1.0, 2.0, 3.0])
+
+    @computed
+    def total():
+        return sum(arr.value)
+
+    assert total.value == 6.0
+
+    arr[1:3] = [2.0, 3.0]
+    assert total.value == 6.0
+
+    arr[2:3] = [5.0]
+    assert total.value == 8.0
+
+
+def test_item_handle():
+    arr = signal_array([1.0, 2.0])
+    item = arr.at(1)
+    calls = []
+
+    on(item, lambda s: calls.append((s.previous, s.current)), onchanges=True)
+
+    item.value = 3.0
+    assert calls == [(2.0, 3.0)]
+    assert to_value(item) == 3.0
+    assert arr[1] == 3.0
+
+    with pytest.raises(IndexError):
+        arr.at(2)
+
+
+class _Index:
+    """An integer type that is not an `int`, as numpy integers."""
+
+    def __init__(self, value: int) -> None:
+        self._value = value
+
+    def __index__(self) -> int:
+        return self._value
+
+
+def test_index_types():
+    arr = signal_array([0.0] * 10)
+    dummy = []
+
+    @effect
+    def _():
+        dummy.append(arr[_Index(-1)])
+
+    arr[0:10] = [1.0] * 10
+    assert dummy == [0.0, 1.0]
+
+    with pytest.raises(TypeError, match="integers or slices"):
+        arr["a"]  # type: ignore
+
+
+def test_slice_read():
+    arr = signal_array([0.0] * 10)
+    dummy = []
+
+    @effect
+    def _():
+        dummy.append(sum(arr[2:4]))
+
+    arr[5] = 1.0
+    assert dummy == [0.0]
+
+    arr[3] = 1.0
+    assert dummy == [0.0, 1.0]
+
+
+def test_list_storage():
+    arr = signal_array([1, 2, 3], typecode=None)
+    dummy = []
+
+    @effect
+    def _():
+        dummy.append(arr.value)
+
+    arr[0] = 5
+    assert dummy == [(1, 2, 3), (5, 2, 3)]
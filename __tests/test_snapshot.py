@@ -0,0 +1,172 @@
+import gc
+
+from signe import signal, effect, scope, to_raw, async_computed
+from signe.core.runtime import ExecutionScheduler
+from signe.core.snapshot import SnapshotManager
+from . import utils
+
+
+def test_snapshot_and_restore():
+    scheduler = ExecutionScheduler()
+    # signals are listed from the creation of the manager on
+    history = SnapshotManager(scheduler)
+    num = signal(1, scheduler=scheduler)
+    data = signal({"a": {"x": 1}, "b": [1, 2]}, scheduler=scheduler)
+
+    s1 = history.snapshot()
+
+    num.value = 2
+    data.value["a"]["x"] = 99
+    data.value["b"].append(3)
+    s2 = history.snapshot()
+
+    assert s1.get(num) == 1
+    assert s1.get(data) == {"a": {"x": 1}, "b": [1, 2]}
+    assert s2.get(data) == {"a": {"x": 99}, "b": [1, 2, 3]}
+
+    history.restore(s1)
+    assert num.value == 1
+    assert to_raw(data.value) == {"a": {"x": 1}, "b": [1, 2]}
+
+    history.restore(s2)
+    assert num.value == 2
+    assert to_raw(data.value["b"]) == [1, 2, 3]
+
+
+def test_structural_sharing():
+    scheduler = ExecutionScheduler()
+    history = SnapshotManager(scheduler)
+    num = signal(1, scheduler=scheduler)
+    data = signal({"a": {"x": 1}, "b": {"y": 1}}, scheduler=scheduler)
+
+    s1 = history.snapshot()
+
+    data.value["a"]["x"] = 2
+    s2 = history.snapshot()
+
+    assert s2.changed_signals == [data]
+    assert s1.get(data)["b"] is s2.get(data)["b"]
+    assert s1.get(data)["a"] is not s2.get(data)["a"]
+    assert s1.get(num) is s2.get(num)
+
+
+def test_restore_only_triggers_changed():
+    scheduler = ExecutionScheduler()
+    history = SnapshotManager(scheduler)
+    a = signal(1, scheduler=scheduler)
+    b = signal(1, scheduler=scheduler)
+
+    spy_a = utils.fn()
+    spy_b = utils.fn()
+
+    effect(lambda: spy_a(a.value), scheduler=scheduler)
+    effect(lambda: spy_b(b.value), scheduler=scheduler)
+
+    s1 = history.snapshot()
+
+    a.value = 2
+    a.value = 3
+    assert spy_a.calledTimes == 3
+
+    history.restore(s1)
+    assert a.value == 1
+    assert spy_a.calledTimes == 4
+    assert spy_b.calledTimes == 1
+
+
+def test_scope_signals():
+    scheduler = ExecutionScheduler()
+    outside = signal(1, scheduler=scheduler)
+    sc = scope()
+    history = SnapshotManager(sc)
+    inside = sc.run(lambda: signal(1, scheduler=scheduler))
+
+    s1 = history.snapshot()
+    assert inside in s1
+    assert outside not in s1
+
+    sc.dispose()
+
+
+def test_signals_created_before_the_manager():
+    scheduler = ExecutionScheduler()
+    before = signal(1, scheduler=scheduler)
+    assert scheduler.get_signals() == []
+
+    history = SnapshotManager(scheduler)
+    after = signal(1, scheduler=scheduler)
+
+    s1 = history.snapshot()
+    assert after in s1
+    assert before not in s1
+
+
+def test_tracking_ends_with_the_manager():
+    scheduler = ExecutionScheduler()
+    history = SnapshotManager(scheduler)
+    num = signal(1, scheduler=scheduler)
+    assert scheduler.get_signals() == [num]
+
+    history.close()
+    signal(1, scheduler=scheduler)
+    assert scheduler.get_signals() == []
+
+    history = SnapshotManager(scheduler)
+    del history
+    gc.collect()
+    signal(1, scheduler=scheduler)
+    assert scheduler.get_signals() == []
+
+
+def test_scope_tracking_is_per_scope():
+    scheduler = ExecutionScheduler()
+    tracked = scope()
+    other = scope()
+    history = SnapshotManager(tracked)
+
+    inside = tracked.run(lambda: scope().run(lambda: signal(1, scheduler=scheduler)))
+    other.run(lambda: signal(1, scheduler=scheduler))
+    assert tracked.get_signals() == [inside]
+    assert other.get_signals() == []
+
+    history.close()
+    tracked.run(lambda: signal(1, scheduler=scheduler))
+    assert tracked.get_signals() == [inside]
+
+    other.dispose()
+    tracked.dispose()
+
+
+def test_internal_signals_are_skipped():
+    scheduler = ExecutionScheduler()
+    history = SnapshotManager(scheduler)
+    num = signal(1, scheduler=scheduler)
+
+    @async_computed(num, init=0, scheduler=scheduler)
+    async def doubled():
+        return num.value * 2
+
+    assert scheduler.get_signals() == [num]
+    assert history.snapshot().to_dict() == {num: 1}
+    history.close()
+
+
+def test_restore_across_schedulers():
+    first = ExecutionScheduler()
+    second = ExecutionScheduler()
+    sc = scope()
+    history = SnapshotManager(sc)
+
+    a, b = sc.run(lambda: (signal(1, scheduler=first), signal(1, scheduler=second)))
+    records = []
+    effect(lambda: records.append((a.value, b.value)), scheduler=first)
+
+    s1 = history.snapshot()
+    a.value = 2
+    b.value = 2
+    records.clear()
+
+    history.restore(s1)
+    # effects run once every signal is restored
+    assert records == [(1, 1)]
+    sc.dispose()
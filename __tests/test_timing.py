@@ -0,0 +1,99 @@
+import asyncio
+from signe import signal, on
+from signe.core.runtime import ExecutionScheduler
+from signe.core.timing import ManualClock
+from signe.core.operators import debounced, throttled, sampled
+
+
+def test_on_debounce():
+    scheduler = ExecutionScheduler()
+    clock = ManualClock()
+    pos = signal(0, scheduler=scheduler)
+    calls = []
+
+    on(
+        pos,
+        lambda state: calls.append((state.current, state.previous)),
+        onchanges=True,
+        debounce=0.1,
+        clock=clock,
+        scheduler=scheduler,
+    )
+
+    pos.value = 1
+    clock.advance(0.05)
+    pos.value = 2
+    clock.advance(0.05)
+    pos.value = 3
+    assert calls == []
+
+    clock.advance(0.1)
+    # previous of the first skipped change
+    assert calls == [(3, 0)]
+
+
+def test_on_throttle():
+    scheduler = ExecutionScheduler()
+    clock = ManualClock()
+    pos = signal(0, scheduler=scheduler)
+    calls = []
+
+    on(
+        pos,
+        lambda state: calls.append(state.current),
+        onchanges=True,
+        throttle=0.1,
+        clock=clock,
+        scheduler=scheduler,
+    )
+
+    for i in range(1, 6):
+        pos.value = i
+        clock.advance(0.03)
+
+    assert calls == [1, 4]
+    clock.advance(0.1)
+    assert calls == [1, 4, 5]
+
+    clock.advance(1)
+    pos.value = 6
+    assert calls == [1, 4, 5, 6]
+
+
+def test_operators():
+    scheduler = ExecutionScheduler()
+    clock = ManualClock()
+    tick = signal(0, scheduler=scheduler)
+
+    kws = {"clock": clock, "scheduler": scheduler}
+    tick_debounced = debounced(tick, 0.1, **kws)
+    tick_throttled = throttled(tick, 0.1, **kws)
+    tick_sampled = sampled(tick, 0.1, **kws)
+
+    tick.value = 1
+    assert (tick_debounced.value, tick_throttled.value, tick_sampled.value) == (0, 1, 0)
+
+    clock.advance(0.05)
+    tick.value = 2
+    clock.advance(0.05)
+    assert (tick_debounced.value, tick_throttled.value, tick_sampled.value) == (0, 2, 2)
+
+    clock.advance(0.1)
+    assert (tick_debounced.value, tick_throttled.value, tick_sampled.value) == (2, 2, 2)
+
+
+def test_asyncio_clock():
+    async def main():
+        scheduler = ExecutionScheduler()
+        query = signal("", scheduler=scheduler)
+        settled = debounced(query, 0.02, scheduler=scheduler)
+
+        for text in ("s", "se", "sea"):
+            query.value = text
+            await asyncio.sleep(0.005)
+
+        assert settled.value == ""
+        await asyncio.sleep(0.05)
+        assert settled.value == "sea"
+
+    asyncio.run(main())
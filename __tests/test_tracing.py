@@ -0,0 +1,84 @@
+import gc
+from signe import signal, effect, computed, reactive, batch
+from signe.core.runtime import ExecutionScheduler
+from signe.core.tracing import CausalityTracer
+
+
+def test_causes():
+    scheduler = ExecutionScheduler()
+    tracer = CausalityTracer().attach(scheduler)
+
+    num = signal(1, debug_name="num", scheduler=scheduler)
+    other = signal(1, debug_name="other", scheduler=scheduler)
+
+    @computed(debug_name="double", scheduler=scheduler)
+    def double():
+        return num.value * 2
+
+    @effect(debug_name="printer", scheduler=scheduler)
+    def printer():
+        double.value
+        other.value
+
+    num.value = 2
+    assert tracer.causes(printer) == [("num", "double", "printer")]
+
+    other.value = 2
+    assert tracer.causes(printer) == [("other", "printer")]
+
+    def update():
+        num.value = 3
+        other.value = 3
+
+    batch(update, scheduler)
+    assert sorted(tracer.causes(printer)) == [
+        ("num", "double", "printer"),
+        ("other", "printer"),
+    ]
+
+    # the first run has no cause
+    assert tracer.dump_collapsed().splitlines() == [
+        "printer 1",
+        "num;double;printer 2",
+        "other;printer 2",
+    ]
+
+
+def test_reactive_key():
+    scheduler = ExecutionScheduler()
+    tracer = CausalityTracer().attach(scheduler)
+
+    data = reactive({"a": 1}, scheduler)
+
+    @effect(debug_name="reader", scheduler=scheduler)
+    def reader():
+        data["a"]
+
+    data["a"] = 2
+    ((source, name),) = tracer.causes(reader)
+    assert source.endswith("[a]")
+    assert name == "reader"
+
+    tracer.detach()
+    assert scheduler.hooks is None
+
+
+def test_effects_sharing_a_name():
+    scheduler = ExecutionScheduler()
+    tracer = CausalityTracer().attach(scheduler)
+
+    a = signal(1, debug_name="a", scheduler=scheduler)
+    b = signal(1, debug_name="b", scheduler=scheduler)
+
+    first = effect(lambda: a.value, debug_name="row", scheduler=scheduler)
+    second = effect(lambda: b.value, debug_name="row", scheduler=scheduler)
+
+    a.value = 2
+    b.value = 2
+    assert tracer.causes(first) == [("a", "row")]
+    assert tracer.causes(second) == [("b", "row")]
+
+    second.dispose()
+    del second
+    gc.collect()
+    assert len(tracer._last_runs) == 1
@@ -0,0 +1,67 @@
+"""Per-fire overhead of `on()` watchers.
+
+    python benchmarks/on_dispatch.py
+"""
+
+import timeit
+
+from signe import on, signal
+from signe.core.runtime import ExecutionScheduler
+
+
+def _bench(label: str, setup, number: int = 50_000):
+    write = setup()
+    seconds = min(timeit.repeat(write, number=number, repeat=5))
+    print(f"{label:<36} {seconds / number * 1e6:8.3f} us / fire")
+
+
+def single_source_with_state():
+    scheduler = ExecutionScheduler()
+    tick = signal(0, scheduler=scheduler)
+    on(tick, lambda state: None, onchanges=True, scheduler=scheduler)
+
+    def write():
+        tick.value += 1
+
+    return write
+
+
+def single_source_no_args():
+    scheduler = ExecutionScheduler()
+    tick = signal(0, scheduler=scheduler)
+    on(tick, lambda: None, onchanges=True, scheduler=scheduler)
+
+    def write():
+        tick.value += 1
+
+    return write
+
+
+def three_sources_with_state():
+    scheduler = ExecutionScheduler()
+    tick = signal(0, scheduler=scheduler)
+    a = signal(0, scheduler=scheduler)
+    b = signal(0, scheduler=scheduler)
+    on([tick, a, b], lambda *states: None, onchanges=True, scheduler=scheduler)
+
+    def write():
+        tick.value += 1
+
+    return write
+
+
+def signal_write_only():
+    scheduler = ExecutionScheduler()
+    tick = signal(0, scheduler=scheduler)
+
+    def write():
+        tick.value += 1
+
+    return write
+
+
+if __name__ == "__main__":
+    _bench("signal write, no watcher", signal_write_only)
+    _bench("on(source, fn(state))", single_source_with_state)
+    _bench("on(source, fn())", single_source_no_args)
+    _bench("on([3 sources], fn(*states))", three_sources_with_state)
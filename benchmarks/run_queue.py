@@ -0,0 +1,53 @@
+"""Run queue operations under wide fan-in: one effect reading many signals that are
+all written in one batch.
+
+    python benchmarks/run_queue.py
+"""
+
+import timeit
+
+from signe import batch, effect, signal
+from signe.core.runtime import ExecutionScheduler
+
+
+class CountingScheduler(ExecutionScheduler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.pushes = 0
+
+    def push_scheduler_fn(self, fn):
+        self.pushes += 1
+        super().push_scheduler_fn(fn)
+
+
+def fan_in(width: int):
+    scheduler = CountingScheduler()
+    sources = [signal(0, scheduler=scheduler) for _ in range(width)]
+    runs = []
+
+    @effect(scheduler=scheduler)
+    def _():
+        runs.append(sum(s.value for s in sources))
+
+    def write_all():
+        def update():
+            for s in sources:
+                s.value += 1
+
+        batch(update, scheduler)
+
+    return scheduler, runs, write_all
+
+
+if __name__ == "__main__":
+    for width in (20, 200, 2000):
+        scheduler, runs, write_all = fan_in(width)
+        runs.clear()
+        write_all()
+        print(
+            f"width={width:<5} queue pushes per batch: {scheduler.pushes:<5} "
+            f"effect runs: {len(runs)}"
+        )
+
+        seconds = min(timeit.repeat(write_all, number=200, repeat=5))
+        print(f"{'':11} {seconds / 200 * 1e6:10.1f} us / batch")
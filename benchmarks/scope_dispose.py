@@ -0,0 +1,67 @@
+"""Disposing a scope tree full of effects chained through computeds, wide (many
+sibling scopes) and deep (scopes nested in each other), with `Scope.dispose` and
+with `Scope.teardown`.
+
+    python benchmarks/scope_dispose.py
+"""
+
+import gc
+import time
+
+from signe import computed, effect, scope, signal
+
+
+def section(source):
+    total = computed(lambda: source.value + 1)
+    for _ in range(9):
+        effect(lambda: total.value)
+
+
+def build_wide(size: int):
+    source = signal(0)
+    page = scope()
+
+    def fill():
+        for _ in range(size // 10):
+            scope().run(lambda: section(source))
+
+    page.run(fill)
+    return source, page
+
+
+def build_deep(size: int):
+    source = signal(0)
+    page = scope()
+
+    current = page
+    for _ in range(size // 10):
+        current = current.run(scope)
+        current.run(lambda: section(source))
+
+    return source, page
+
+
+def measure(size: int, build, method: str, repeat: int = 5):
+    best = float("inf")
+    for _ in range(repeat):
+        source, page = build(size)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            getattr(page, method)()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+        del source, page
+        gc.collect()
+    return best
+
+
+if __name__ == "__main__":
+    for size in (10_000, 100_000):
+        for build in (build_wide, build_deep):
+            shape = build.__name__[len("build_") :]
+            for method in ("dispose", "teardown"):
+                took = measure(size, build, method) * 1e3
+                print(f"nodes={size:<7} {shape:<5} {method:<8} {took:8.1f} ms")
@@ -2,13 +2,26 @@ from signe.core.signal import Signal, signal
 from signe.core.mixins import to_value, is_signal
 from signe.core.effect import Effect, effect, stop
 from signe.core.computed import Computed, computed
-from signe.core.async_computed import async_computed
-from signe.core.runtime import ExecutionScheduler
+from signe.core.computed_family import computed_family
+from signe.core.signal_array import SignalArray, signal_array
+from signe.core.buffer import BufferSignal, buffer_signal
+from signe.core.async_computed import async_computed, ResultCache
+from signe.core.runtime import ExecutionScheduler, SchedulerLoopError
 from signe.core.batch import batch
 from signe.core.on import on, WatchedState
 from signe.core.cleanup import cleanup
-from signe.core.reactive import reactive, to_raw, is_reactive
+from signe.core.reactive import reactive, to_raw, is_reactive, ChangeRecord
 from signe.core.scope import scope
+from signe.core.patch import watch_patches
+from signe.core.snapshot import SnapshotManager
+from signe.core.persistence import PersistentStore
+from signe.core.replication import ReplicationPrimary, ReplicationReplica
+from signe.core.profiling import SchedulerHooks, ProfileCollector
+from signe.core.graph import inspect_graph
+from signe.core.tracing import CausalityTracer
+from signe.core.leaks import LeakTracker
+from signe.core.operators import debounced, throttled, sampled
+from signe.core.timing import ManualClock
 from signe.core.types import TMaybeSignal, TGetterSignal, TSignal, TGetter
 from .version import __version__
 
@@ -17,10 +30,17 @@ __all__ = [
     "Effect",
     "Computed",
     "async_computed",
+    "ResultCache",
     "ExecutionScheduler",
+    "SchedulerLoopError",
     "signal",
     "effect",
     "computed",
+    "computed_family",
+    "SignalArray",
+    "signal_array",
+    "BufferSignal",
+    "buffer_signal",
     "batch",
     "on",
     "to_value",
@@ -36,5 +56,27 @@ __all__ = [
     "TSignal",
     "WatchedState",
     "is_reactive",
+    "ChangeRecord",
+    "watch_patches",
+    "SnapshotManager",
+    "inspect_graph",
+    "debounced",
+    "throttled",
+    "sampled",
+    "ManualClock",
+    "PersistentStore",
+    "ReplicationPrimary",
+    "ReplicationReplica",
+    "SchedulerHooks",
+    "ProfileCollector",
+    "CausalityTracer",
+    "LeakTracker",
     "__version__",
 ]
+
+try:
+    from signe.core.ndarray import ArraySignal, array_signal
+except ImportError:  # numpy is an optional dependency
+    pass
+else:
+    __all__ += ["ArraySignal", "array_signal"]
@@ -1,17 +1,23 @@
 from __future__ import annotations
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Set
 from typing import (
     TYPE_CHECKING,
     Any,
     Generic,
+    Hashable,
     Sequence,
+    Tuple,
     TypeVar,
     Callable,
     Optional,
     Union,
     cast,
 )
-from signe.core.mixins import ReadableMixin
-from signe.core.signal import signal
+from signe.core.mixins import ReadableMixin, to_value
+from signe.core.signal import _InternalSignal
 from signe.core.context import get_default_scheduler
 from signe.core.on import on
 
@@ -21,6 +27,7 @@ from .types import TGetter, TSignal, _T_async_fn
 from .scope import Scope, ScopeSuite, _DEFAULT_SCOPE_SUITE
 
 if TYPE_CHECKING:  # pragma: no cover
+    from .effect import Effect
     from .runtime import ExecutionScheduler
 
 _T = TypeVar("_T")
@@ -29,6 +36,81 @@ _T = TypeVar("_T")
 _T_wrap_fn = Callable[[_T_async_fn], ComputedResultProtocol[_T]]
 
 
+class ResultCache:
+    """Results of an `async_computed`, keyed on the values of its sources.
+
+    Args:
+        max_size (int, optional): entries kept, least recently used are evicted first. Defaults to 128.
+        ttl (Optional[float], optional): seconds an entry stays fresh, None for ever. Defaults to None.
+        stale_while_revalidate (bool, optional): an expired entry is still used as the
+            value while the coroutine refreshes it. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 128,
+        *,
+        ttl: Optional[float] = None,
+        stale_while_revalidate=False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self._clock = clock
+        # key -> (value, stored at)
+        self._entries: OrderedDict[Hashable, Tuple[Any, float]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Tuple[Any, bool]]:
+        """Returns (value, is fresh), or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, stored_at = entry
+        fresh = self.ttl is None or self._clock() - stored_at < self.ttl
+        if not (fresh or self.stale_while_revalidate):
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value, fresh
+
+    def put(self, key: Hashable, value):
+        self._entries[key] = (value, self._clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# values used as they are in a cache key, containers are frozen recursively
+_LEAF_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _freeze(value) -> Hashable:
+    """A hashable key, equal for equal values.
+
+    Containers are tagged with their kind, so a dict and a list of pairs differ.
+    Raises TypeError for anything else (instances, arrays...): their identity would
+    not change when they are mutated.
+    """
+    if isinstance(value, _LEAF_TYPES):
+        return value
+    if isinstance(value, Mapping):
+        return ("map", frozenset((_freeze(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, Set):
+        return ("set", frozenset(_freeze(v) for v in value))
+    if isinstance(value, Sequence):
+        return ("seq", tuple(_freeze(v) for v in value))
+    raise TypeError(f"cannot use a {type(value).__name__} in a cache key.")
+
+
 def async_computed(
     source: Union[TGetter, Sequence[TGetter]],
     *,
@@ -37,16 +119,52 @@ def async_computed(
     onchanges=True,
     debug_trigger: Optional[Callable] = None,
     debug_name: Optional[str] = None,
+    debounce: float = 0,
+    cancel_superseded=True,
+    cache: Optional[ResultCache] = None,
     scope: Optional[Union[Scope, ScopeSuite]] = None,
     scheduler: Optional[ExecutionScheduler] = None,
 ) -> _T_wrap_fn[_T]:
+    """Computed whose value is produced by a coroutine, re-evaluated when `source` changes.
+
+    Only the latest evaluation sets the value: a change while an evaluation is in
+    progress cancels it (or, with `cancel_superseded=False`, lets it finish and
+    discards its result). Changes made before a scheduled evaluation starts are
+    coalesced into it.
+
+    Args:
+        debounce (float, optional): seconds without change to wait before evaluating. Defaults to 0.
+        cancel_superseded (bool, optional): cancel an evaluation made obsolete by a change. Defaults to True.
+        cache (Optional[ResultCache], optional): resolves source values seen before
+            without awaiting the coroutine. Use one cache per computed. Only plain
+            values and containers of them are cached, other sources (instances,
+            arrays...) always await the coroutine. Defaults to None.
+    """
     scheduler = scheduler or get_default_scheduler()
 
     def wrap_cp(fn: _T_async_fn):
-        current = signal(init, is_shallow=True, scheduler=scheduler)
-        evaluating_ref = evaluating or signal(False, is_shallow=True)
+        current = _InternalSignal(init, scheduler=scheduler)
+        evaluating_ref = evaluating or _InternalSignal(False, scheduler=scheduler)
         evaluating_ref.value = False
 
+        cache_key = None
+        if cache is not None:
+            sources = source if isinstance(source, Sequence) else [source]
+
+            def cache_key():
+                scheduler.pause_track()
+                try:
+                    return _freeze([to_value(s) for s in sources])
+                except TypeError:
+                    # not cached, rather than a key that may hit for another value
+                    return None
+                finally:
+                    scheduler.reset_track()
+
+        runner = _AsyncEvaluator(
+            fn, current, evaluating_ref, debounce, cancel_superseded, cache, cache_key
+        )
+
         effect_kws = {
             "debug_name": debug_name,
             "debug_trigger": debug_trigger,
@@ -59,29 +177,131 @@ def async_computed(
             scheduler=scheduler,
             scope=scope or _DEFAULT_SCOPE_SUITE,
         )
-        async def _():
-            evaluating_ref.value = True
-
-            try:
-                current.value = await fn()
-            finally:
-                evaluating_ref.value = False
+        def watcher():
+            runner.trigger()
 
-        return cast(ComputedResultProtocol[_T], AsyncComputedResult(current, fn))
+        return cast(
+            ComputedResultProtocol[_T],
+            AsyncComputedResult(current, fn, runner, watcher),
+        )
 
     return wrap_cp
 
 
+class _AsyncEvaluator(Generic[_T]):
+    def __init__(
+        self,
+        fn: _T_async_fn[_T],
+        current: TSignal[_T],
+        evaluating: TSignal[bool],
+        debounce: float,
+        cancel_superseded: bool,
+        cache: Optional[ResultCache] = None,
+        cache_key: Optional[Callable[[], Hashable]] = None,
+    ) -> None:
+        self._fn = fn
+        self._cache = cache
+        self._cache_key = cache_key
+        self._current = current
+        self._evaluating = evaluating
+        self._debounce = debounce
+        self._cancel_superseded = cancel_superseded
+
+        self._generation = 0
+        self.task: Optional[asyncio.Task] = None
+        # the task was created but did not start, it will read the latest sources
+        self._task_waiting = False
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def trigger(self):
+        self._generation += 1
+
+        key = self._cache_key() if self._cache_key is not None else None
+        if key is not None:
+            hit = self._cache.get(key)  # type: ignore
+            if hit is not None:
+                value, fresh = hit
+                self._current.value = value
+                if fresh:
+                    self._cancel()
+                    return
+
+        self._evaluating.value = True
+        loop = asyncio.get_event_loop()
+
+        if self._debounce > 0:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = loop.call_later(self._debounce, self._start)
+        else:
+            self._start()
+
+    def _cancel(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if self.task is not None and self._cancel_superseded:
+            self.task.cancel()
+        self.task = None
+        self._task_waiting = False
+        self._evaluating.value = False
+
+    def _start(self):
+        self._timer = None
+        if self.task is not None:
+            if self._task_waiting:
+                return
+            if self._cancel_superseded:
+                self.task.cancel()
+
+        self._task_waiting = True
+        self.task = asyncio.get_event_loop().create_task(self._evaluate())
+
+    async def _evaluate(self):
+        self._task_waiting = False
+        generation = self._generation
+        task = self.task
+        key = self._cache_key() if self._cache_key is not None else None
+
+        try:
+            result = await self._fn()
+            if key is not None:
+                self._cache.put(key, result)  # type: ignore
+
+            if generation == self._generation:
+                self._current.value = result
+        finally:
+            if self.task is task:
+                self.task = None
+                if self._timer is None:
+                    self._evaluating.value = False
+
+
 class AsyncComputedResult(Generic[_T], ReadableMixin[_T]):
-    __slot__ = ("_result", "_fn")
+    __slot__ = ("_result", "_fn", "_evaluator")
 
-    def __init__(self, result: TSignal[_T], fn: _T_async_fn[_T]) -> None:
+    def __init__(
+        self,
+        result: TSignal[_T],
+        fn: _T_async_fn[_T],
+        evaluator: Optional[_AsyncEvaluator[_T]] = None,
+        watcher: Optional[Effect] = None,
+    ) -> None:
         self._result = result
         self._fn = fn
+        self._evaluator = evaluator
+        # keeps the source watcher alive with weak subscriptions
+        self._watcher = watcher
 
     @property
     def value(self):
         return self._result.value
 
+    @property
+    def task(self) -> Optional[asyncio.Task]:
+        """The evaluation in progress, if any."""
+        return self._evaluator.task if self._evaluator else None
+
     def __call__(self) -> Any:
         return self._fn()
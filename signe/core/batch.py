@@ -1,28 +1,144 @@
+from __future__ import annotations
+from contextvars import ContextVar
 from typing import (
+    TYPE_CHECKING,
+    Any,
     Callable,
+    Dict,
     Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
 )
 
 from signe.core.context import get_default_scheduler
 
 from .runtime import ExecutionScheduler
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .signal import Signal
 
+_T = TypeVar("_T")
+
+# the rollback batches entered by the current thread / asyncio task, innermost last
+_ROLLBACK_BATCHES: ContextVar[Tuple[Batch, ...]] = ContextVar(
+    "signe_rollback_batches", default=()
+)
+
+
+class Batch:
+    """A transaction: effects triggered inside it run once, when the outermost batch
+    exits. Use it with `with` / `async with`, see `batch`.
+
+    Signals written inside the batch notify their subscribers at the exit, and only
+    if their final value differs from the one before the batch. Reading a computed
+    inside the batch commits the writes made so far, so it sees them.
+
+    With `rollback`, the signals written inside the batch get their previous values
+    back if the body raises. Mutations of reactive containers are not rolled back.
+    Only the writes of the task (or thread) that entered the batch are recorded, so
+    concurrent tasks sharing the scheduler are never rolled back.
+    """
+
+    def __init__(self, scheduler: ExecutionScheduler, rollback=False) -> None:
+        self._scheduler = scheduler
+        self._rollback = rollback
+        # signal -> raw value before its first write in this batch
+        self._originals: Dict[Signal, Any] = {}
+        self._token = None
+
+    def record(self, sig: Signal):
+        if sig not in self._originals:
+            self._originals[sig] = sig._raw_value
+
+    def __enter__(self) -> Batch:
+        scheduler = self._scheduler
+        scheduler.pause_scheduling()
+        scheduler._batch_depth += 1
+        if self._rollback:
+            self._token = _ROLLBACK_BATCHES.set(_ROLLBACK_BATCHES.get() + (self,))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        scheduler = self._scheduler
+        try:
+            if self._rollback:
+                _ROLLBACK_BATCHES.reset(self._token)  # type: ignore
+                self._token = None
+                if exc_type is not None:
+                    for sig, value in self._originals.items():
+                        sig.value = value
+                self._originals.clear()
+        finally:
+            scheduler._batch_depth -= 1
+            if scheduler._batch_depth == 0:
+                scheduler.commit_writes()
+            scheduler.reset_scheduling()
+            if scheduler._batch_depth == 0:
+                scheduler.run()
+
+        return False
+
+    def __call__(self, fn: Callable[[], _T]) -> _T:
+        """Runs `fn` in the batch, so `@batch(scheduler=...)` works as a decorator."""
+        with self:
+            return fn()
+
+    async def __aenter__(self) -> Batch:
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> bool:
+        return self.__exit__(exc_type, exc_value, traceback)
+
+
+@overload
 def batch(
-    fn: Callable[[], None],
+    fn: None = None,
     scheduler: Optional[ExecutionScheduler] = None,
-):
-    return api_batch(fn, scheduler or get_default_scheduler())
+    *,
+    rollback=False,
+) -> Batch: ...
+
+
+@overload
+def batch(
+    fn: Callable[[], _T],
+    scheduler: Optional[ExecutionScheduler] = None,
+    *,
+    rollback=False,
+) -> _T: ...
+
+
+def batch(
+    fn: Optional[Callable[[], _T]] = None,
+    scheduler: Optional[ExecutionScheduler] = None,
+    *,
+    rollback=False,
+) -> Union[Batch, _T]:
+    """Groups writes so that the effects they trigger run once, after the outermost batch.
+
+    ## Example
+    ```
+    @batch
+    def _():
+        a.value = 1
+        b.value = 2
+
+    with batch(rollback=True):
+        a.value = 1
+        raise ValueError()  # a gets its previous value back
+    ```
+    """
+    txn = Batch(scheduler or get_default_scheduler(), rollback)
+    if fn is None:
+        return txn
+
+    return txn(fn)
 
 
 def api_batch(
     fn: Callable[[], None],
     scheduler: ExecutionScheduler,
 ):
-    scheduler.pause_scheduling()
-
-    try:
-        fn()
-    finally:
-        scheduler.reset_scheduling()
-        scheduler.run()
+    return Batch(scheduler)(fn)
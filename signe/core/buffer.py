@@ -0,0 +1,237 @@
+from __future__ import annotations
+import mmap
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    Optional,
+    Union,
+)
+
+from signe.core.consts import EffectState
+from signe.core.context import get_default_scheduler
+from signe.core.deps import GetterDepManager
+from signe.core.id_generator import IdGen
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .runtime import ExecutionScheduler
+
+
+# dep key of the readers of the whole buffer
+_ALL = "all"
+
+
+class BufferSignal:
+    """A writable buffer (`bytearray`, `mmap`...) whose readers depend on the byte
+    ranges they read.
+
+    Reads return read-only `memoryview` slices, nothing is copied. The buffer is
+    tracked in pages of `page_size` bytes: a write notifies the readers of the pages
+    whose bytes actually changed.
+
+    ## Example
+    ```
+    frame = buffer_signal(1024, page_size=64)
+
+    @effect
+    def header():
+        print(bytes(frame[0:16]))
+
+    frame.write(512, payload)  # header does not run
+    ```
+    """
+
+    _id_gen = IdGen("BufferSignal")
+
+    def __init__(
+        self,
+        buffer: Any,
+        *,
+        page_size: int = 4096,
+        scheduler: ExecutionScheduler,
+        debug_name: Optional[str] = None,
+    ) -> None:
+        if page_size <= 0:
+            raise ValueError("page_size must be positive.")
+
+        self.__id = self._id_gen.new()
+        self._buffer = buffer
+        self._view = memoryview(buffer).cast("B")
+        if self._view.readonly:
+            raise TypeError("BufferSignal needs a writable buffer.")
+
+        self._page_size = page_size
+        self._debug_name = debug_name
+        self._dep_manager = GetterDepManager(scheduler, self)
+        self._file = None
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Union[str, os.PathLike],
+        size: Optional[int] = None,
+        *,
+        page_size: int = mmap.PAGESIZE,
+        scheduler: Optional[ExecutionScheduler] = None,
+        debug_name: Optional[str] = None,
+    ) -> BufferSignal:
+        """Maps a file into memory, extending it to `size` bytes if it is shorter.
+
+        Only the pages that are read or written are loaded by the OS. Call `close`
+        once done.
+        """
+        mode = "r+b" if os.path.exists(path) else "w+b"
+        file = open(path, mode)
+        try:
+            if size is not None and os.fstat(file.fileno()).st_size < size:
+                file.truncate(size)
+            mapped = mmap.mmap(file.fileno(), 0)
+        except BaseException:
+            file.close()
+            raise
+
+        result = cls(
+            mapped,
+            page_size=page_size,
+            scheduler=scheduler or get_default_scheduler(),
+            debug_name=debug_name,
+        )
+        result._file = file
+        return result
+
+    @property
+    def id(self):
+        return self.__id  # pragma: no cover
+
+    @property
+    def debug_name(self) -> Optional[str]:
+        return self._debug_name
+
+    @property
+    def page_size(self) -> int:
+        return self._page_size
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    @property
+    def value(self) -> memoryview:
+        """A read-only view of the whole buffer, its readers depend on every byte."""
+        self._dep_manager.tracked(_ALL)
+        return self._view.toreadonly()
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> memoryview:
+        """A read-only view of the bytes `[start, stop)`, tracking their pages."""
+        start, stop, _ = slice(start, stop).indices(len(self._view))
+        if stop > start:
+            self._track(start, stop)
+        return self._view[start:stop].toreadonly()
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            if index.step not in (None, 1):
+                raise ValueError("BufferSignal only supports contiguous slices.")
+            return self.read(index.start or 0, index.stop)
+
+        if index < 0:
+            index += len(self._view)
+        value = self._view[index]
+        self._track(index, index + 1)
+        return value
+
+    def write(self, offset: int, data: Any):
+        """Copies `data` (any bytes-like object) into the buffer at `offset`."""
+        source = memoryview(data).cast("B")
+        stop = offset + len(source)
+        if offset < 0 or stop > len(self._view):
+            raise IndexError("write out of the buffer range.")
+        if not len(source):
+            return
+
+        page_size = self._page_size
+        deps_map = self._dep_manager._deps_map
+        first, last = offset // page_size, (stop - 1) // page_size
+
+        # compare before writing, only the observed pages
+        changed: List[Any] = []
+        for page in range(first, last + 1):
+            if page not in deps_map:
+                continue
+            begin = max(page * page_size, offset)
+            end = min((page + 1) * page_size, stop)
+            if self._view[begin:end] != source[begin - offset : end - offset]:
+                changed.append(page)
+
+        whole = _ALL in deps_map and self._view[offset:stop] != source
+        self._view[offset:stop] = source
+
+        if whole or changed:
+            changed.append(_ALL)
+            self._dep_manager.triggered_keys(changed, EffectState.NEED_UPDATE)
+
+    def __setitem__(self, index: Union[int, slice], value):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self._view))
+            if step != 1:
+                raise ValueError("BufferSignal only supports contiguous slices.")
+            if len(memoryview(value).cast("B")) != stop - start:
+                raise ValueError("the slice and the data have different lengths.")
+            self.write(start, value)
+            return
+
+        if index < 0:
+            index += len(self._view)
+        self.write(index, bytes((value,)))
+
+    def flush(self):
+        """Writes the changes of a file-backed buffer to disk."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.flush()
+
+    def close(self):
+        """Releases the buffer, and the file of `from_file`. Views handed out by
+        `read` must be released first."""
+        self._view.release()
+        if self._file is not None:
+            self._buffer.close()
+            self._file.close()
+            self._file = None
+
+    def _track(self, start: int, stop: int):
+        if self._dep_manager._scheduler.get_running_caller() is None:
+            return
+
+        page_size = self._page_size
+        for page in range(start // page_size, (stop - 1) // page_size + 1):
+            self._dep_manager.tracked(page)
+
+    def __repr__(self) -> str:
+        return f"BufferSignal(id= {self.id} , name = {self._debug_name}, size={len(self)})"
+
+
+def buffer_signal(
+    buffer: Union[int, Any],
+    *,
+    page_size: int = 4096,
+    debug_name: Optional[str] = None,
+    scheduler: Optional[ExecutionScheduler] = None,
+) -> BufferSignal:
+    """Creates a `BufferSignal` over `buffer`, without copying it.
+
+    Args:
+        buffer (Union[int, Any]): a writable bytes-like object (`bytearray`, `mmap`,
+            `array`...), or a size to allocate a zeroed `bytearray`.
+        page_size (int, optional): tracking granularity in bytes. Defaults to 4096.
+
+    For a file-backed buffer, see `BufferSignal.from_file`.
+    """
+    if isinstance(buffer, int):
+        buffer = bytearray(buffer)
+
+    return BufferSignal(
+        buffer,
+        page_size=page_size,
+        scheduler=scheduler or get_default_scheduler(),
+        debug_name=debug_name,
+    )
@@ -62,7 +62,8 @@ class Computed(Generic[_T], ReadableMixin[_T]):
             debug_name=debug_name,
             capture_parent_effect=capture_parent_effect,
         )
-        self._dep_manager = GetterDepManager(scheduler)
+        self._effect._owner = self
+        self._dep_manager = GetterDepManager(scheduler, self)
 
         if isinstance(scope, Scope):
             scope.add_disposable(self)
@@ -73,6 +74,10 @@ class Computed(Generic[_T], ReadableMixin[_T]):
     def id(self):
         return self.__id  # pragma: no cover
 
+    @property
+    def debug_name(self) -> Optional[str]:
+        return self._debug_name
+
     def trigger(self, state: EffectState):
         state = EffectState.PENDING if state == EffectState.NEED_UPDATE else state
         self._effect.update_state(state)  # type: ignore
@@ -84,13 +89,30 @@ class Computed(Generic[_T], ReadableMixin[_T]):
             self._update_value()
 
     def dispose(self):
+        if self._effect is not None:
+            # detach the inner effect from its upstream deps
+            self._effect.dispose()
+        self._effect = None
+        self._value = None
+        self._dep_manager.dispose()
+
+    def _release(self):
+        # the inner effect belongs to the same scope, `Scope.teardown` releases it
         self._effect = None
         self._value = None
         self._dep_manager.dispose()
 
     @property
     def value(self):
-        if self._effect.state <= EffectState.NEED_UPDATE:  # type: ignore
+        scheduler = self._dep_manager._scheduler
+        if scheduler._pending_writes:
+            # writes deferred by a batch may invalidate this computed
+            scheduler.commit_writes()
+
+        if self._effect is None:
+            raise RuntimeError(f"Computed {self._debug_name or self.id} is disposed.")
+
+        if self._effect.state <= EffectState.NEED_UPDATE:
             self._update_value()
 
         self._dep_manager.tracked("value", computed=self)
@@ -101,11 +123,16 @@ class Computed(Generic[_T], ReadableMixin[_T]):
 
     def _update_value(self):
         new_value = self._effect.update()  # type: ignore
+        changed = has_changed(self._value, new_value)
+        # set first: readers triggered below may run right away
+        self._value = new_value
 
-        if has_changed(self._value, new_value):
+        if changed:
             self._dep_manager.triggered("value", new_value, EffectState.NEED_UPDATE)
 
-        self._value = new_value
+        hooks = self._effect._scheduler.hooks  # type: ignore
+        if hooks is not None:
+            hooks.on_computed_recompute(self, changed)
 
     def __repr__(self) -> str:
         state = self._effect.state  # type: ignore
@@ -0,0 +1,230 @@
+from __future__ import annotations
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
+from weakref import WeakValueDictionary
+
+from signe.core.computed import Computed
+from signe.core.consts import EffectState
+from signe.core.context import get_default_scheduler
+from signe.core.protocols import ComputedResultProtocol
+from .scope import Scope, ScopeSuite, _DEFAULT_SCOPE_SUITE
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .runtime import ExecutionScheduler
+
+_T = TypeVar("_T")
+
+# members are owned by their family, never by the scope active when they are created
+_FAMILY_SCOPE_SUITE = ScopeSuite()
+
+
+class ComputedFamily(Generic[_T]):
+    """One shared `Computed` per argument tuple.
+
+    At most `max_size` members are kept: when a new member is created, the least
+    recently used members that nothing observes are evicted (their effect leaves
+    its upstream deps). Observed members are never evicted, the family may then
+    grow past `max_size` until they are released.
+
+    A member found observed is set aside instead of being looked at again on every
+    creation. The set-aside members are checked again once as many members were
+    created as there are set aside, so eviction costs amortized O(1) per creation
+    and a released member may stay that long before it can be evicted.
+
+    An evicted member still referenced somewhere keeps working: its next read
+    recomputes it and brings it back into the family, as does `family(*args)`.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[..., _T],
+        *,
+        max_size: int,
+        debug_name: Optional[str],
+        scheduler: ExecutionScheduler,
+    ) -> None:
+        self._fn = fn
+        self._max_size = max_size
+        self._debug_name = debug_name
+        self._scheduler = scheduler
+        self._members: Dict[Hashable, Computed[_T]] = {}
+        # eviction candidates, least recently used first
+        self._lru: OrderedDict[Hashable, None] = OrderedDict()
+        # members found observed, left out of `_lru` until the next recheck
+        self._observed: Dict[Hashable, None] = {}
+        self._created_since_recheck = 0
+        # evicted members still referenced somewhere
+        self._evicted: WeakValueDictionary = WeakValueDictionary()
+
+    def __call__(self, *args: Hashable) -> ComputedResultProtocol[_T]:
+        member = self._members.get(args)
+        if member is not None:
+            if args in self._lru:
+                self._lru.move_to_end(args)
+            return cast(ComputedResultProtocol[_T], member)
+
+        member = self._evicted.pop(args, None)
+        if member is None:
+            member = self._create(args)
+            self._created_since_recheck += 1
+
+        self._add(args, member)
+        self._evict(self._max_size)
+        return cast(ComputedResultProtocol[_T], member)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, args) -> bool:
+        return args in self._members
+
+    def evict_unobserved(self) -> int:
+        """Disposes every member that nothing observes, returns how many were."""
+        self._recheck_observed()
+        return self._evict(0)
+
+    def dispose(self):
+        for member in self._members.values():
+            member.dispose()
+        for member in tuple(self._evicted.values()):
+            member.dispose()
+
+        self._members.clear()
+        self._lru.clear()
+        self._observed.clear()
+        self._evicted.clear()
+
+    def _create(self, args) -> Computed[_T]:
+        fn = self._fn
+        name = f"{self._debug_name}{args}" if self._debug_name else None
+
+        def getter():
+            # recomputing an evicted member means something still reads it
+            if args not in self._members:
+                self._evicted.pop(args, None)
+                self._add(args, member)
+            return fn(*args)
+
+        member = Computed(
+            getter,
+            scheduler=self._scheduler,
+            scope=_FAMILY_SCOPE_SUITE,
+            debug_name=name,
+            # readers re-running must not dispose a shared member
+            capture_parent_effect=False,
+        )
+        return member
+
+    def _add(self, args, member: Computed[_T]):
+        self._members[args] = member
+        self._lru[args] = None
+
+    def _evict(self, size: int) -> int:
+        members = self._members
+        lru = self._lru
+        evicted = 0
+
+        if (
+            len(members) > size
+            and self._observed
+            and self._created_since_recheck >= len(self._observed)
+        ):
+            self._recheck_observed()
+
+        while len(members) > size and lru:
+            args, _ = lru.popitem(last=False)
+            member = members[args]
+            if _is_observed(member):
+                self._observed[args] = None
+                continue
+
+            del members[args]
+            _detach(member)
+            self._evicted[args] = member
+            evicted += 1
+
+        return evicted
+
+    def _recheck_observed(self):
+        """Moves the set-aside members nothing observes anymore back to `_lru`."""
+        self._created_since_recheck = 0
+        for args in tuple(self._observed):
+            if not _is_observed(self._members[args]):
+                del self._observed[args]
+                self._lru[args] = None
+                self._lru.move_to_end(args, last=False)
+
+
+def _is_observed(member: Computed) -> bool:
+    return any(dep.get_callers() for dep in member._dep_manager._deps_map.values())
+
+
+def _detach(member: Computed):
+    """Removes an evicted member from its upstream deps, its next read recomputes."""
+    effect = member._effect
+    if effect is None:
+        return
+
+    effect._clear_all_deps()
+    effect._exec_cleanups()
+    effect._dispose_sub_effects()
+    effect.update_state(EffectState.NEED_UPDATE)
+
+
+def computed_family(
+    fn: Optional[Callable[..., _T]] = None,
+    *,
+    max_size: int = 1024,
+    debug_name: Optional[str] = None,
+    scope: Optional[Union[Scope, ScopeSuite]] = None,
+    scheduler: Optional[ExecutionScheduler] = None,
+) -> Union[ComputedFamily[_T], Callable[[Callable[..., _T]], ComputedFamily[_T]]]:
+    """Creates a parametrised computed: `family(*args)` returns the computed of `fn(*args)`.
+
+    ## Example
+    ```
+    @computed_family(max_size=10_000)
+    def price_of(symbol: str):
+        return prices.value[symbol] * rate.value
+
+    price_of("AAPL").value
+    ```
+    """
+
+    if fn is None:
+
+        def wrap(fn: Callable[..., _T]):
+            return computed_family(
+                fn,
+                max_size=max_size,
+                debug_name=debug_name,
+                scope=scope,
+                scheduler=scheduler,
+            )
+
+        return wrap
+
+    family = ComputedFamily(
+        fn,
+        max_size=max_size,
+        debug_name=debug_name,
+        scheduler=scheduler or get_default_scheduler(),
+    )
+
+    scope = scope or _DEFAULT_SCOPE_SUITE
+    if isinstance(scope, Scope):
+        scope.add_disposable(family)
+    else:
+        scope.mark_with_scope(family)
+
+    return family
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Any, Dict, Optional, Set, TYPE_CHECKING
+from typing import Any, Dict, Iterable, Optional, Set, TYPE_CHECKING
+from weakref import ref
 from signe.core.id_generator import IdGen
 from .consts import EffectState
 
@@ -13,11 +14,23 @@ if TYPE_CHECKING:  # pragma: no cover
 class Dep:
     _id_gen = IdGen("Dep")
 
-    def __init__(self, computed: Optional[Computed] = None) -> None:
+    def __init__(
+        self,
+        computed: Optional[Computed] = None,
+        owner: Optional[Any] = None,
+        key: Any = None,
+    ) -> None:
         self.__id = Dep._id_gen.new()
         self.computed = computed
+        self._owner_ref = None if owner is None else ref(owner)
+        self.key = key
         self._deps: Set[CallerProtocol] = set()
 
+    @property
+    def owner(self) -> Optional[Any]:
+        """The source the dep belongs to, if it is still alive."""
+        return None if self._owner_ref is None else self._owner_ref()
+
     def get_callers(self):
         return tuple(self._deps)
 
@@ -37,13 +50,58 @@ class Dep:
         return False
 
 
+class WeakDep(Dep):
+    """A `Dep` holding its callers weakly: a caller nobody else references is
+    garbage-collected, its entry is pruned the next time the dep triggers."""
+
+    def __init__(
+        self,
+        computed: Optional[Computed] = None,
+        owner: Optional[Any] = None,
+        key: Any = None,
+    ) -> None:
+        super().__init__(computed, owner, key)
+        # id(caller) -> weak reference
+        self._refs: Dict[int, ref] = {}
+
+    def get_callers(self):
+        callers = []
+        dead = []
+        for key, caller_ref in self._refs.items():
+            caller = caller_ref()
+            if caller is None:
+                dead.append(key)
+            else:
+                callers.append(caller)
+
+        for key in dead:
+            del self._refs[key]
+
+        return tuple(callers)
+
+    def add_caller(self, caller: CallerProtocol):
+        self._refs[id(caller)] = ref(caller)
+
+    def remove_caller(self, caller: CallerProtocol):
+        self._refs.pop(id(caller), None)
+
+
 class GetterDepManager:
     def __init__(
         self,
         scheduler: ExecutionScheduler,
+        owner: Optional[Any] = None,
     ) -> None:
         self._scheduler = scheduler
+        # the signal / computed / reactive container this manager belongs to, held
+        # weakly: the owner usually references its manager
+        self._owner_ref = None if owner is None else ref(owner)
         self._deps_map: Dict[str, Dep] = {}
+        self.trigger_count = 0
+
+    @property
+    def _owner(self) -> Optional[Any]:
+        return None if self._owner_ref is None else self._owner_ref()
 
     def tracked(
         self, key, value: Optional[Any] = None, computed: Optional[Computed] = None
@@ -55,7 +113,8 @@ class GetterDepManager:
 
         dep = self._deps_map.get(key)
         if not dep:
-            dep = Dep(computed)
+            dep_type = WeakDep if self._scheduler.weak_subscriptions else Dep
+            dep = dep_type(computed, self._owner, key)
             self._deps_map[key] = dep
 
         dep.add_caller(running_caller)
@@ -67,9 +126,33 @@ class GetterDepManager:
             return
 
         scheduler = self._scheduler
+        self.trigger_count += 1
+
+        hooks = scheduler.hooks
+        if hooks is None:
+            for caller in dep.get_callers():
+                caller.trigger(state)
+        else:
+            hooks.on_trigger(self._owner, key, state)
+            for caller in dep.get_callers():
+                hooks.on_caller_trigger(caller, self._owner, key, state)
+                caller.trigger(state)
 
-        for caller in dep.get_callers():
-            caller.trigger(state)
+        if scheduler.should_run:
+            scheduler.run()
+
+    def triggered_keys(self, keys: Iterable, state: EffectState):
+        """Triggers several keys, the scheduler runs once at the end."""
+        scheduler = self._scheduler
+        deps_map = self._deps_map
+
+        scheduler.pause_scheduling()
+        try:
+            for key in keys:
+                if key in deps_map:
+                    self.triggered(key, None, state)
+        finally:
+            scheduler.reset_scheduling()
 
         if scheduler.should_run:
             scheduler.run()
@@ -19,7 +19,6 @@ from signe.core.scope import Scope, ScopeSuite, _DEFAULT_SCOPE_SUITE
 
 from .consts import EffectState
 from .context import get_default_scheduler
-from functools import partial
 
 if TYPE_CHECKING:  # pragma: no cover
     from signe.core.deps import Dep
@@ -57,17 +56,25 @@ class Effect(Generic[_T]):
         self._fn = fn
         self._trigger_fn = trigger_fn
         self._scheduler_fn = scheduler_fn
+        # set while the effect waits in the run queue of the scheduler
+        self._queued = False
         self._upstream_refs: Dict[Dep, None] = {}
         self._debug_name = debug_name
         self._debug_trigger = debug_trigger
+        # the computed this effect evaluates, if any
+        self._owner: Optional[Any] = None
 
         self._state: EffectState = state or EffectState.NEED_UPDATE
         self._cleanups: List[Callable[[], None]] = []
 
+        # the scope that can pause this effect
+        self._scope: Optional[Scope] = None
         if isinstance(scope, Scope):
             scope.add_disposable(self)
+            self._scope = scope
         elif isinstance(scope, ScopeSuite):
             scope.mark_with_scope(self)
+            self._scope = scope.get_current_scope()
 
         self._sub_effects: List[Effect] = []
 
@@ -88,6 +95,10 @@ class Effect(Generic[_T]):
     def is_effect(self) -> bool:
         return True
 
+    @property
+    def debug_name(self) -> Optional[str]:
+        return self._debug_name
+
     def calc_state(self):
         if self.state == EffectState.NEED_UPDATE:
             return
@@ -116,6 +127,9 @@ class Effect(Generic[_T]):
         self._sub_effects.append(sub)
 
     def trigger(self, state: EffectState):
+        if self._record_if_paused(state):
+            return
+
         scheduler = self._scheduler
         scheduler.pause_scheduling()
         self._state = state
@@ -123,11 +137,34 @@ class Effect(Generic[_T]):
         if self._trigger_fn:
             self._trigger_fn(self)
 
-        if self._scheduler_fn:
-            self._scheduler.push_scheduler_fn(partial(self._scheduler_fn, self))
+        if self._scheduler_fn and not self._queued:
+            self._queued = True
+            scheduler.push_scheduler_fn(self._run_queued)
 
         scheduler.reset_scheduling()
 
+    def _run_queued(self):
+        # cleared first: a trigger during the run queues the effect again
+        self._queued = False
+        if self._record_if_paused(self._state):
+            return
+        self._scheduler_fn(self)  # type: ignore
+
+    def _record_if_paused(self, state: EffectState) -> bool:
+        scope = self._scope
+        if scope is None or not scope._suite._paused_count:
+            return False
+
+        paused = scope._paused_scope()
+        if paused is None:
+            return False
+
+        # a pending state must not hide a direct change recorded earlier
+        if self._state != EffectState.NEED_UPDATE:
+            self._state = state
+        paused._dirty[self] = None
+        return True
+
     def add_upstream_ref(self, dep: Dep):
         self._upstream_refs[dep] = None
 
@@ -146,7 +183,17 @@ class Effect(Generic[_T]):
             self._clear_all_deps()
 
             self._dispose_sub_effects()
-            result = self._fn()
+
+            hooks = self._scheduler.hooks
+            if hooks is not None:
+                hooks.on_effect_start(self)
+
+            try:
+                result = self._fn()
+            finally:
+                if hooks is not None:
+                    hooks.on_effect_end(self)
+
             if self._debug_trigger:
                 self._debug_trigger()
 
@@ -171,6 +218,29 @@ class Effect(Generic[_T]):
         self._exec_cleanups()
         self._dispose_sub_effects()
 
+    def _release(self):
+        """Disposes this effect as part of a `Scope.teardown`, which marks the dying
+        scopes inactive first: edges to computeds of those scopes are left alone."""
+        self._active = False
+        for dep in self._upstream_refs:
+            computed = dep.computed
+            if computed is not None:
+                effect = computed._effect
+                if effect is None or _is_dying(effect._scope):
+                    continue
+            dep.remove_caller(self)
+        self._upstream_refs.clear()
+
+        if self._cleanups:
+            self._exec_cleanups()
+
+        if self._sub_effects:
+            for sub in self._sub_effects:
+                # subs of the dying scopes are released on their own
+                if sub._active and not _is_dying(sub._scope):
+                    sub.dispose()
+            self._sub_effects.clear()
+
     def _dispose_sub_effects(self):
         for sub in self._sub_effects:
             sub.dispose()
@@ -202,6 +272,10 @@ class Effect(Generic[_T]):
         return f"Effect(id ={self.id}, name={self._debug_name})"
 
 
+def _is_dying(scope: Optional[Scope]) -> bool:
+    return scope is not None and not scope._active
+
+
 _TEffect_Fn = Callable[[Callable[..., _T]], Effect]
 
 
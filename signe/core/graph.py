@@ -0,0 +1,286 @@
+from __future__ import annotations
+import json
+import time
+import warnings
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from signe.core.computed import Computed
+from signe.core.effect import Effect
+from signe.core.profiling import node_name
+from signe.core.reactive import _get_dep_manager, is_reactive
+from signe.core.runtime import ExecutionScheduler
+from signe.core.signal import Signal
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .deps import GetterDepManager
+    from .scope import Scope
+
+
+class GraphNode:
+    __slots__ = (
+        "id",
+        "name",
+        "kind",
+        "fan_in",
+        "fan_out",
+        "depth",
+        "trigger_count",
+        "recent_triggers",
+    )
+
+    def __init__(self, node_id: str, name: str, kind: str, trigger_count: int) -> None:
+        self.id = node_id
+        self.name = name
+        self.kind = kind
+        self.fan_in = 0
+        self.fan_out = 0
+        self.depth = 0
+        self.trigger_count = trigger_count
+        # triggers since the baseline graph, see `inspect_graph`
+        self.recent_triggers = trigger_count
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __repr__(self) -> str:
+        return (
+            f"GraphNode(name={self.name}, kind={self.kind}, fan_in={self.fan_in}, "
+            f"fan_out={self.fan_out}, depth={self.depth}, triggers={self.trigger_count}, "
+            f"recent={self.recent_triggers})"
+        )
+
+
+class DependencyGraph:
+    """A snapshot of the dependency graph: sources point to their subscribers.
+
+    `trigger_count` is the number of times a source notified its subscribers since it
+    was created. `recent_triggers` counts them over the last `interval` seconds, since
+    the graph passed as `since` to `inspect_graph` (without one, since creation).
+    """
+
+    def __init__(
+        self,
+        nodes: Dict[str, GraphNode],
+        edges: List[Tuple[str, str, str]],
+        *,
+        taken_at: float,
+        interval: Optional[float] = None,
+    ) -> None:
+        self.nodes = nodes
+        self.edges = edges
+        self.taken_at = taken_at
+        self.interval = interval
+
+    def downstream(self, node_id: str) -> Set[str]:
+        """Ids of every node reachable from `node_id`."""
+        targets: Dict[str, List[str]] = {}
+        for source, target, _ in self.edges:
+            targets.setdefault(source, []).append(target)
+
+        result: Set[str] = set()
+        stack = list(targets.get(node_id, ()))
+        while stack:
+            current = stack.pop()
+            if current in result:
+                continue
+            result.add(current)
+            stack.extend(targets.get(current, ()))
+        return result
+
+    def hot_spots(self, limit: int = 10) -> List[GraphNode]:
+        """Sources whose recent writes woke up the most subscribers."""
+        sources = [node for node in self.nodes.values() if node.fan_out]
+        return sorted(
+            sources,
+            key=lambda n: (n.recent_triggers * n.fan_out, n.fan_out),
+            reverse=True,
+        )[:limit]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "interval": self.interval,
+            "nodes": [node.to_dict() for node in self.nodes.values()],
+            "edges": [
+                {"source": source, "target": target, "key": key}
+                for source, target, key in self.edges
+            ],
+        }
+
+    def to_json(self, **kws) -> str:
+        return json.dumps(self.to_dict(), **kws)
+
+    def to_dot(self) -> str:
+        lines = ["digraph signe {"]
+        for node in self.nodes.values():
+            label = (
+                f"{_dot_escape(node.name)}\\n{node.kind} in={node.fan_in} "
+                f"out={node.fan_out} triggers={node.trigger_count}"
+            )
+            lines.append(f'  "{_dot_escape(node.id)}" [label="{label}"];')
+
+        for source, target, key in self.edges:
+            lines.append(
+                f'  "{_dot_escape(source)}" -> "{_dot_escape(target)}" '
+                f'[label="{_dot_escape(key)}"];'
+            )
+
+        lines.append("}")
+        return "\n".join(lines)
+
+
+def _dot_escape(text: str) -> str:
+    """Escapes `text` for a double-quoted DOT string."""
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _kind(obj) -> str:
+    if isinstance(obj, Signal):
+        return "signal"
+    if isinstance(obj, Computed):
+        return "computed"
+    if isinstance(obj, Effect):
+        return "effect"
+    return "reactive"
+
+
+def _node_id(obj) -> str:
+    if isinstance(obj, (Signal, Computed, Effect)):
+        return obj.id
+    return f"{type(obj).__name__}_{id(obj)}"
+
+
+def _dep_manager_of(obj) -> Optional[GetterDepManager]:
+    if isinstance(obj, (Signal, Computed)):
+        return obj._dep_manager
+    if is_reactive(obj):
+        return _get_dep_manager(obj)
+    return None
+
+
+def _effect_of(obj) -> Optional[Effect]:
+    if isinstance(obj, Computed):
+        return obj._effect
+    if isinstance(obj, Effect):
+        return obj
+    return None
+
+
+def _seeds(source: Union[ExecutionScheduler, Scope]) -> List[Any]:
+    seeds: List[Any] = list(source.get_signals())
+    if isinstance(source, ExecutionScheduler):
+        return seeds
+
+    stack = [source]
+    while stack:
+        current = stack.pop()
+        seeds.extend(current._disposables)
+        stack.extend(current._scopes)
+    return seeds
+
+
+def inspect_graph(
+    source: Union[ExecutionScheduler, Scope],
+    *,
+    since: Optional[DependencyGraph] = None,
+) -> DependencyGraph:
+    """Walks the live graph reachable from the signals of a scheduler, or from the
+    signals, effects and computeds of a scope (child scopes included).
+
+    With `since`, an earlier graph, `recent_triggers` only counts the triggers that
+    happened after it.
+
+    Signals are only listed while `track_signals` is on for the scheduler (or the
+    scope), turn it on before creating them. A scheduler without it has nothing to
+    start from, a warning is issued instead of returning an empty graph silently.
+    """
+    if isinstance(source, ExecutionScheduler) and source._signals is None:
+        warnings.warn(
+            "inspect_graph: the scheduler does not track its signals, call "
+            "`track_signals()` on it before creating them."
+        )
+
+    objects: Dict[int, Any] = {}
+    edges: Dict[Tuple[int, int, str], None] = {}
+    stack = _seeds(source)
+
+    while stack:
+        obj = stack.pop()
+        if id(obj) in objects:
+            continue
+        objects[id(obj)] = obj
+
+        manager = _dep_manager_of(obj)
+        if manager is not None:
+            for key, dep in manager._deps_map.items():
+                for caller in dep.get_callers():
+                    # a computed is represented by itself, not by its inner effect
+                    target = getattr(caller, "_owner", None) or caller
+                    edges[(id(obj), id(target), str(key))] = None
+                    stack.append(target)
+
+        effect = _effect_of(obj)
+        if effect is not None:
+            for dep in effect._upstream_refs:
+                if dep.owner is not None:
+                    edges[(id(dep.owner), id(obj), str(dep.key))] = None
+                    stack.append(dep.owner)
+
+        if isinstance(obj, Signal) and is_reactive(obj._value):
+            stack.append(obj._value)
+
+    nodes: Dict[int, GraphNode] = {}
+    for key, obj in objects.items():
+        manager = _dep_manager_of(obj)
+        nodes[key] = GraphNode(
+            _node_id(obj),
+            node_name(obj),
+            _kind(obj),
+            manager.trigger_count if manager is not None else 0,
+        )
+
+    sources: Dict[int, Set[int]] = {key: set() for key in nodes}
+    targets: Dict[int, Set[int]] = {key: set() for key in nodes}
+    for source_key, target_key, _ in edges:
+        targets[source_key].add(target_key)
+        sources[target_key].add(source_key)
+
+    for key, node in nodes.items():
+        node.fan_in = len(sources[key])
+        node.fan_out = len(targets[key])
+
+    # longest path from a node without sources
+    in_degree = {key: len(value) for key, value in sources.items()}
+    queue = deque(key for key, degree in in_degree.items() if degree == 0)
+    while queue:
+        key = queue.popleft()
+        for target_key in targets[key]:
+            nodes[target_key].depth = max(nodes[target_key].depth, nodes[key].depth + 1)
+            in_degree[target_key] -= 1
+            if in_degree[target_key] == 0:
+                queue.append(target_key)
+
+    taken_at = time.monotonic()
+    interval = None
+    if since is not None:
+        interval = taken_at - since.taken_at
+        for node in nodes.values():
+            before = since.nodes.get(node.id)
+            if before is not None:
+                node.recent_triggers = node.trigger_count - before.trigger_count
+
+    return DependencyGraph(
+        {node.id: node for node in nodes.values()},
+        [(nodes[s].id, nodes[t].id, k) for s, t, k in edges],
+        taken_at=taken_at,
+        interval=interval,
+    )
@@ -0,0 +1,88 @@
+from __future__ import annotations
+import gc
+from types import FrameType
+from typing import Any, List, Optional
+from weakref import WeakSet
+
+from .profiling import node_name
+from .scope import ScopeSuite, _DEFAULT_SCOPE_SUITE
+
+
+class LeakEntry:
+    """An effect (or computed) still alive after its scope was disposed, with what
+    references it."""
+
+    __slots__ = ("node", "name", "referrers")
+
+    def __init__(self, node: Any, name: str, referrers: List[str]) -> None:
+        self.node = node
+        self.name = name
+        self.referrers = referrers
+
+    def __repr__(self) -> str:
+        return f"LeakEntry(name={self.name}, referrers={self.referrers})"
+
+
+class LeakTracker:
+    """Reports the effects and computeds that outlive the scope they were created in.
+
+    ## Example
+    ```
+    tracker = LeakTracker()
+    tracker.start()
+    page.dispose()
+
+    for entry in tracker.report():
+        print(entry.name, entry.referrers)
+    ```
+    """
+
+    def __init__(self, suite: Optional[ScopeSuite] = None) -> None:
+        self._suite = suite or _DEFAULT_SCOPE_SUITE
+        self._disposed: WeakSet = WeakSet()
+
+    def start(self):
+        """Watches the scopes disposed from now on."""
+        self._suite._leak_watch = self._disposed
+
+    def stop(self):
+        if self._suite._leak_watch is self._disposed:
+            self._suite._leak_watch = None
+
+    def reset(self):
+        self._disposed.clear()
+
+    def report(self, collect=True) -> List[LeakEntry]:
+        """The watched nodes still alive, after a garbage collection if `collect`."""
+        if collect:
+            gc.collect()
+
+        alive = list(self._disposed)
+        entries = []
+        for node in alive:
+            referrers = [
+                _describe(referrer)
+                for referrer in gc.get_referrers(node)
+                if referrer is not alive
+                and not isinstance(referrer, (FrameType, LeakEntry))
+            ]
+            entries.append(LeakEntry(node, node_name(node), sorted(referrers)))
+
+        return sorted(entries, key=lambda entry: entry.name)
+
+
+def _describe(referrer: Any) -> str:
+    """`Type.attribute` of the object holding `referrer`, for containers."""
+    if isinstance(referrer, (dict, set, list, tuple)):
+        for owner in gc.get_referrers(referrer):
+            attrs = getattr(owner, "__dict__", None)
+            if not isinstance(attrs, dict):
+                continue
+
+            for attr, value in attrs.items():
+                if value is referrer:
+                    source = getattr(owner, "owner", None)
+                    suffix = f" of {node_name(source)}" if source is not None else ""
+                    return f"{type(owner).__name__}.{attr}{suffix}"
+
+    return type(referrer).__name__
@@ -0,0 +1,205 @@
+from __future__ import annotations
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from signe.core.consts import EffectState
+from signe.core.context import get_default_scheduler
+from signe.core.deps import GetterDepManager
+from signe.core.id_generator import IdGen
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .runtime import ExecutionScheduler
+
+
+TBlock = Union[int, Tuple[int, ...]]
+
+
+class ArraySignal:
+    """A NumPy array whose readers depend on the regions they read.
+
+    The array is split into blocks of `block` elements per axis. Reading `arr[idx]`
+    subscribes to the blocks `idx` touches, writing `arr[idx] = ...` notifies the
+    readers of the blocks where an element actually changed. Both work for ints,
+    slices, fancy indices and boolean masks, and are vectorised. `block=1` tracks
+    single elements.
+
+    Reading `value` subscribes to the whole array.
+
+    ## Example
+    ```
+    prices = array_signal(np.zeros(10_000), block=100)
+
+    @effect
+    def head():
+        print(prices[:10].sum())
+
+    prices[5000:] = 1.0  # head does not run
+    prices[3] = 1.0  # head runs
+    ```
+    """
+
+    _id_gen = IdGen("ArraySignal")
+
+    def __init__(
+        self,
+        data: Any,
+        *,
+        block: TBlock = 64,
+        scheduler: ExecutionScheduler,
+        debug_name: Optional[str] = None,
+    ) -> None:
+        self.__id = self._id_gen.new()
+        self._scheduler = scheduler
+        self._debug_name = debug_name
+        self._block = block
+        self._dep_manager = GetterDepManager(scheduler, self)
+        self._set_data(np.array(data))
+
+    @property
+    def id(self):
+        return self.__id  # pragma: no cover
+
+    @property
+    def debug_name(self) -> Optional[str]:
+        return self._debug_name
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self._data.shape
+
+    @property
+    def dtype(self):
+        return self._data.dtype
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def value(self) -> np.ndarray:
+        """A read-only view of the whole array."""
+        self._dep_manager.tracked("value")
+        return _read_only(self._data)
+
+    @value.setter
+    def value(self, data: Any):
+        data = np.array(data)
+        if data.shape != self._data.shape:
+            self._set_data(data)
+            self._dep_manager.triggered_keys(
+                list(self._dep_manager._deps_map.keys()), EffectState.NEED_UPDATE
+            )
+            return
+
+        changed = _changed(self._data, data)
+        self._data = data
+        # the coordinates of the changed elements, not a mask of the whole shape
+        where = np.nonzero(changed) if changed.ndim else changed
+        self._notify_changed(np.asarray(self._block_ids(where)))
+
+    def __getitem__(self, index) -> Any:
+        if self._scheduler.get_running_caller() is not None:
+            for block in np.unique(self._block_ids(index)).tolist():
+                self._dep_manager.tracked(block)
+
+        return _read_only(self._data[index])
+
+    def __setitem__(self, index, value):
+        old = np.array(self._data[index])
+        self._data[index] = value
+        changed = _changed(old, self._data[index])
+        self._notify_changed(np.asarray(self._block_ids(index))[changed])
+
+    def _set_data(self, data: np.ndarray):
+        self._data = data
+        self._axis_ids = _axis_block_ids(data.shape, self._block)
+
+    def _block_ids(self, index) -> np.ndarray:
+        """The block id of each element selected by `index`.
+
+        Computed from the per-axis ids, the memory used is the size of the selection.
+        """
+        if not self._axis_ids:
+            return np.zeros(self._data.shape, dtype=np.intp)[index]
+
+        ids = self._axis_ids[0][index]
+        for axis_ids in self._axis_ids[1:]:
+            ids = ids + axis_ids[index]
+        return ids
+
+    def _notify_changed(self, dirty: np.ndarray):
+        if dirty.size:
+            self._dep_manager.triggered_keys(
+                np.unique(dirty).tolist() + ["value"], EffectState.NEED_UPDATE
+            )
+
+    def __repr__(self) -> str:
+        return f"ArraySignal(id= {self.id} , name = {self._debug_name}, shape={self.shape})"
+
+
+def _axis_block_ids(shape: Tuple[int, ...], block: TBlock) -> List[np.ndarray]:
+    """Per axis, the share of the block id of each element, as read-only arrays of
+    `shape` that only store one row (zero strides along the other axes).
+
+    The block id of an element is the sum of its shares over the axes.
+    """
+    blocks = (block,) * len(shape) if isinstance(block, int) else tuple(block)
+    if len(blocks) != len(shape):
+        raise ValueError(f"block {block} does not match the shape {shape}.")
+
+    result: List[np.ndarray] = []
+    stride = 1
+    for axis in reversed(range(len(shape))):
+        size, step = shape[axis], max(1, blocks[axis])
+        along = np.arange(size, dtype=np.intp) // step * stride
+        view = [1] * len(shape)
+        view[axis] = size
+        result.append(np.broadcast_to(along.reshape(view), shape))
+        stride *= -(-size // step) if size else 1
+
+    return result
+
+
+def _changed(old, new) -> np.ndarray:
+    """Element-wise inequality, NaN equal to NaN."""
+    old, new = np.asarray(old), np.asarray(new)
+    changed = old != new
+    if old.dtype.kind in "fc" and new.dtype.kind in "fc":
+        changed &= ~(np.isnan(old) & np.isnan(new))
+    return changed
+
+
+def _read_only(result):
+    if isinstance(result, np.ndarray):
+        result = result.view()
+        result.flags.writeable = False
+    return result
+
+
+def array_signal(
+    data: Any,
+    *,
+    block: TBlock = 64,
+    debug_name: Optional[str] = None,
+    scheduler: Optional[ExecutionScheduler] = None,
+) -> ArraySignal:
+    """Creates an `ArraySignal` holding a copy of `data`. Needs NumPy, `pip install signe[numpy]`.
+
+    Args:
+        data (Any): anything `np.array` accepts.
+        block (Union[int, Tuple[int, ...]], optional): block size per axis, the
+            granularity of the dependencies. Defaults to 64.
+    """
+    return ArraySignal(
+        data,
+        block=block,
+        scheduler=scheduler or get_default_scheduler(),
+        debug_name=debug_name,
+    )
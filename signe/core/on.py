@@ -1,16 +1,27 @@
 import asyncio
-from dataclasses import dataclass
+import threading
+from concurrent.futures import Executor, Future
+from copy import deepcopy
 from signe.core.consts import UNIQUE_VALUE
 from signe.core.context import get_default_scheduler
 from signe.core.effect import Effect
 from signe.core.helper import has_changed, get_func_args_count
-from signe.core.reactive import is_reactive, track_all
+from signe.core.reactive import (
+    ChangeRecord,
+    DeepWatcher,
+    is_reactive,
+    to_raw,
+    track_all,
+)
 from signe.core.scope import Scope, _DEFAULT_SCOPE_SUITE, ScopeSuite
+from signe.core.timing import Clock, RateLimiter
 from typing import (
     Any,
     Dict,
     List,
     Sequence,
+    Set,
+    Tuple,
     TypeVar,
     Callable,
     Union,
@@ -30,7 +41,7 @@ T = TypeVar("T")
 
 
 class OnGetterModel(Generic[T]):
-    __slots__ = ("_ref", "_fn")
+    __slots__ = ("_ref", "_fn", "_watcher")
 
     def __init__(
         self,
@@ -39,14 +50,24 @@ class OnGetterModel(Generic[T]):
         deep=False,
     ) -> None:
         self._ref = ref
+        self._watcher = DeepWatcher() if deep else None
+
+        def track(value):
+            if self._watcher is None:
+                track_all(value, scheduler)
+            elif is_reactive(value):
+                self._watcher.watch(value, owner=scheduler.get_running_caller())
+                self._watcher.track()
+            else:
+                self._watcher.unwatch()
 
         # with track
         if is_signal(ref):
 
             def getter():
                 value = self._ref.value
-                if is_reactive(value):
-                    track_all(value, scheduler, deep)
+                if is_reactive(value) or self._watcher is not None:
+                    track(value)
                 return value
 
             self._fn = getter
@@ -54,7 +75,7 @@ class OnGetterModel(Generic[T]):
 
             def getter_reactive_fn():
                 obj = cast(Callable, ref)()
-                track_all(obj, scheduler, deep)
+                track(obj)
                 return obj
 
             self._fn = getter_reactive_fn
@@ -62,12 +83,119 @@ class OnGetterModel(Generic[T]):
     def get_value(self):
         return self._fn()
 
+    def take_changes(self) -> Tuple[ChangeRecord, ...]:
+        """Returns (and clears) the deep changes recorded since the last call."""
+        if self._watcher is None:
+            return ()
+        return tuple(self._watcher.drain())
+
 
-@dataclass(frozen=True)
 class WatchedState:
-    __slot__ = ("current", "previous")
-    current: Any
-    previous: Any
+    """The values of a source when an `on` callback fires. Read-only and hashable
+    (when its values are)."""
+
+    __slots__ = ("current", "previous", "changes")
+
+    def __init__(
+        self,
+        current: Any,
+        previous: Any,
+        # only filled in deep mode: the nested mutations since the previous call
+        changes: Tuple[ChangeRecord, ...] = (),
+    ) -> None:
+        _set_slot = object.__setattr__
+        _set_slot(self, "current", current)
+        _set_slot(self, "previous", previous)
+        _set_slot(self, "changes", changes)
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"cannot assign to field '{name}' of WatchedState")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"cannot delete field '{name}' of WatchedState")
+
+    def __reduce__(self):
+        # pickle / copy rebuild it through `__init__`, `__setattr__` is blocked
+        return (WatchedState, (self.current, self.previous, self.changes))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WatchedState):
+            return NotImplemented
+        return (self.current, self.previous, self.changes) == (
+            other.current,
+            other.previous,
+            other.changes,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.current, self.previous, self.changes))
+
+    def __repr__(self) -> str:
+        return (
+            f"WatchedState(current={self.current!r}, previous={self.previous!r}, "
+            f"changes={self.changes!r})"
+        )
+
+
+class _ExecutorDispatcher:
+    """Runs the callback of an `on` in an executor, latest trigger wins.
+
+    A new trigger cancels the runs that did not start yet. When `max_concurrency`
+    runs are in progress, only the most recent arguments wait for a free slot.
+    """
+
+    def __init__(self, executor: Executor, fn: Callable, max_concurrency: int) -> None:
+        self._executor = executor
+        self._fn = fn
+        self._max_concurrency = max_concurrency
+        # done callbacks may run synchronously, from `cancel` or `submit`
+        self._lock = threading.RLock()
+        self._running: Set[Future] = set()
+        self._waiting: Optional[Tuple] = None
+        # the waiting arguments are dropped once the effect is disposed
+        self.effect: Optional[Effect] = None
+
+    def dispatch(self, args: Tuple):
+        with self._lock:
+            self._waiting = None
+            for future in tuple(self._running):
+                if future.cancel():
+                    self._running.discard(future)
+
+            if len(self._running) >= self._max_concurrency:
+                self._waiting = args
+            else:
+                self._submit(args)
+
+    def _submit(self, args: Tuple):
+        future = self._executor.submit(self._fn, *args)
+        self._running.add(future)
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future: Future):
+        with self._lock:
+            self._running.discard(future)
+            if (
+                (self.effect is None or self.effect._active)
+                and self._waiting is not None
+                and len(self._running) < self._max_concurrency
+            ):
+                args, self._waiting = self._waiting, None
+                self._submit(args)
+
+
+def _snapshot(value):
+    """A copy of `value` that the scheduler thread will not mutate."""
+    return deepcopy(to_raw(value))
+
+
+def _merge_states(
+    old: Tuple[WatchedState, ...], new: Tuple[WatchedState, ...]
+) -> Tuple[WatchedState, ...]:
+    return tuple(
+        WatchedState(n.current, o.previous, o.changes + n.changes)
+        for o, n in zip(old, new)
+    )
 
 
 @overload
@@ -78,6 +206,11 @@ def on(
     onchanges=False,
     effect_kws: Optional[Dict[str, Any]] = None,
     deep=False,
+    executor: Optional[Executor] = None,
+    max_concurrency: int = 1,
+    debounce: Optional[float] = None,
+    throttle: Optional[float] = None,
+    clock: Optional[Clock] = None,
     scope: Optional[Union[Scope, ScopeSuite]] = None,
     scheduler: Optional[ExecutionScheduler] = None,
 ): ...
@@ -90,6 +223,11 @@ def on(
     *,
     onchanges=False,
     deep=False,
+    executor: Optional[Executor] = None,
+    max_concurrency: int = 1,
+    debounce: Optional[float] = None,
+    throttle: Optional[float] = None,
+    clock: Optional[Clock] = None,
     scope: Optional[Union[Scope, ScopeSuite]] = None,
     scheduler: Optional[ExecutionScheduler] = None,
 ): ...
@@ -102,13 +240,44 @@ def on(
     onchanges=False,
     effect_kws: Optional[Dict[str, Any]] = None,
     deep=False,
+    executor: Optional[Executor] = None,
+    max_concurrency: int = 1,
+    debounce: Optional[float] = None,
+    throttle: Optional[float] = None,
+    clock: Optional[Clock] = None,
     scope: Optional[Union[Scope, ScopeSuite]] = None,
     scheduler: Optional[ExecutionScheduler] = None,
 ):
+    """Calls `fn` when the values of `source` change.
+
+    Args:
+        executor (Optional[Executor], optional): runs `fn` in this `concurrent.futures`
+            executor instead of on the scheduler thread. Dependencies are still tracked
+            on the scheduler thread, `fn` receives `WatchedState`s holding deep copies
+            of the raw (not reactive) values, so later writes do not race with it. A
+            new change cancels the runs that did not start yet. `fn` cannot be a
+            coroutine function. Defaults to None.
+        max_concurrency (int, optional): with an `executor`, the number of runs in
+            progress at once. Further changes wait, only the latest is kept. Defaults to 1.
+        debounce (Optional[float], optional): calls `fn` once the changes stop for this
+            many seconds. Defaults to None.
+        throttle (Optional[float], optional): calls `fn` at most once per this many
+            seconds, with the latest values. Defaults to None.
+        clock (Optional[Clock], optional): time source of `debounce` / `throttle`,
+            the asyncio event loop by default. Defaults to None.
+
+        When calls are rate limited, `fn` receives the `previous` value of the first
+        skipped change and the `changes` of all of them.
+    """
     call_kws = {
         "onchanges": onchanges,
         "effect_kws": effect_kws,
         "deep": deep,
+        "executor": executor,
+        "max_concurrency": max_concurrency,
+        "debounce": debounce,
+        "throttle": throttle,
+        "clock": clock,
         "scheduler": scheduler or get_default_scheduler(),
     }
 
@@ -120,6 +289,9 @@ def on(
         return wrap_cp
 
     if asyncio.iscoroutinefunction(fn):
+        if executor is not None:
+            raise TypeError("`executor` cannot run a coroutine function.")
+
         base_fn = fn
 
         def wrap_fn(*args, **kws):  # type: ignore
@@ -127,17 +299,52 @@ def on(
 
         fn = wrap_fn
 
+    dispatcher: Optional[_ExecutorDispatcher] = None
+    deliver = fn
+    if executor is not None:
+        dispatcher = _ExecutorDispatcher(executor, fn, max_concurrency)
+
+        def deliver(*states: WatchedState):
+            dispatcher.dispatch(
+                tuple(
+                    WatchedState(_snapshot(s.current), _snapshot(s.previous), s.changes)
+                    for s in states
+                )
+            )
+
+    limiter: Optional[RateLimiter] = None
+    if debounce is not None or throttle is not None:
+
+        def limited(*states: WatchedState):
+            if effect._active:
+                deliver(*states)
+
+        limiter = RateLimiter(
+            limited,
+            debounce=debounce,
+            throttle=throttle,
+            clock=clock,
+            scheduler=call_kws["scheduler"],
+            merge=_merge_states,
+        )
+
     getters: List[OnGetterModel] = []
     if isinstance(source, Sequence):
         getters = [OnGetterModel(g, call_kws["scheduler"], deep) for g in source]  # type: ignore
     else:
         getters = [OnGetterModel(source, call_kws["scheduler"], deep)]  # type: ignore
 
-    def getter():
-        return [g.get_value() for g in getters]
+    single = len(getters) == 1
+    if single:
+        # one source, the most common case: no lists per run
+        getter = getters[0].get_value
+    else:
+
+        def getter():
+            return [g.get_value() for g in getters]
 
     args_count = get_func_args_count(fn)
-    prev_values = [UNIQUE_VALUE] * len(getters)
+    prev_values: Any = UNIQUE_VALUE if single else [UNIQUE_VALUE] * len(getters)
 
     def scheduler_fn(effect: Effect):
         nonlocal prev_values
@@ -145,15 +352,42 @@ def on(
             return
 
         new_values = effect.update()
-        if deep or any(has_changed(n, v) for n, v in zip(new_values, prev_values)):
-            if args_count == 0:
-                fn()
+        changes = [g.take_changes() for g in getters] if deep else None
+
+        if single:
+            changed = has_changed(new_values, prev_values)
+        else:
+            changed = False
+            for new, prev in zip(new_values, prev_values):
+                if has_changed(new, prev):
+                    changed = True
+                    break
+
+        if changed or (changes and any(changes)):
+            args: Tuple[WatchedState, ...] = ()
+            if args_count > 0:
+                if single:
+                    args = (
+                        WatchedState(
+                            new_values,
+                            None if prev_values is UNIQUE_VALUE else prev_values,
+                            changes[0] if changes else (),
+                        ),
+                    )
+                else:
+                    args = tuple(
+                        WatchedState(
+                            cur,
+                            None if prev is UNIQUE_VALUE else prev,
+                            changes[idx] if changes else (),
+                        )
+                        for idx, (cur, prev) in enumerate(zip(new_values, prev_values))
+                    )
+
+            if limiter is None:
+                deliver(*args)
             else:
-                states = (
-                    WatchedState(cur, None if prev is UNIQUE_VALUE else prev)
-                    for cur, prev in zip(new_values, prev_values or new_values)
-                )
-                fn(*states)
+                limiter.submit(args)
 
         prev_values = new_values
 
@@ -165,7 +399,14 @@ def on(
         scope=scope or _DEFAULT_SCOPE_SUITE,
     )
 
+    if dispatcher is not None:
+        dispatcher.effect = effect
+
     if onchanges:
         prev_values = effect.update()
+        for g in getters:
+            g.take_changes()
     else:
         scheduler_fn(effect)
+
+    return effect
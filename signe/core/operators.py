@@ -0,0 +1,120 @@
+from __future__ import annotations
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from signe.core.context import get_default_scheduler
+from signe.core.mixins import to_value
+from signe.core.on import WatchedState, on
+from signe.core.signal import Signal
+from signe.core.timing import Clock, RateLimiter
+from .scope import Scope, ScopeSuite
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .effect import Effect
+    from .protocols import SignalResultProtocol
+    from .runtime import ExecutionScheduler
+    from .types import TGetter
+
+
+_T = TypeVar("_T")
+
+
+class _DerivedSignal(Signal[_T]):
+    """A signal fed by a watcher, kept alive as long as the signal is (weak
+    subscriptions hold nothing else)."""
+
+    __slots__ = ("_watcher",)
+
+    def __init__(self, value: _T, *, is_shallow: bool, scheduler: ExecutionScheduler):
+        super().__init__(value, scheduler=scheduler, is_shallow=is_shallow)
+        self._watcher: Optional[Effect] = None
+
+
+def _rate_limited(
+    source: TGetter[_T],
+    *,
+    debounce: Optional[float] = None,
+    throttle: Optional[float] = None,
+    sample: Optional[float] = None,
+    clock: Optional[Clock],
+    scope: Optional[Union[Scope, ScopeSuite]],
+    scheduler: Optional[ExecutionScheduler],
+) -> SignalResultProtocol[_T]:
+    scheduler = scheduler or get_default_scheduler()
+    result = _DerivedSignal(to_value(source), is_shallow=True, scheduler=scheduler)
+
+    def update(value: _T):
+        result.value = value
+
+    limiter = RateLimiter(
+        update,
+        debounce=debounce,
+        throttle=throttle,
+        sample=sample,
+        clock=clock,
+        scheduler=scheduler,
+    )
+
+    def on_change(state: WatchedState):
+        limiter.submit((state.current,))
+
+    result._watcher = on(
+        source, on_change, onchanges=True, scope=scope, scheduler=scheduler
+    )
+    return cast("SignalResultProtocol[_T]", result)
+
+
+def debounced(
+    source: TGetter[_T],
+    wait: float,
+    *,
+    clock: Optional[Clock] = None,
+    scope: Optional[Union[Scope, ScopeSuite]] = None,
+    scheduler: Optional[ExecutionScheduler] = None,
+) -> SignalResultProtocol[_T]:
+    """A signal following `source` once it stays unchanged for `wait` seconds.
+
+    ## Example
+    ```
+    query = signal("")
+    settled_query = debounced(query, 0.3)
+    ```
+    """
+    return _rate_limited(
+        source, debounce=wait, clock=clock, scope=scope, scheduler=scheduler
+    )
+
+
+def throttled(
+    source: TGetter[_T],
+    interval: float,
+    *,
+    clock: Optional[Clock] = None,
+    scope: Optional[Union[Scope, ScopeSuite]] = None,
+    scheduler: Optional[ExecutionScheduler] = None,
+) -> SignalResultProtocol[_T]:
+    """A signal following `source` at most once per `interval` seconds: the first
+    change passes at once, the latest of the following ones at the end of the interval."""
+    return _rate_limited(
+        source, throttle=interval, clock=clock, scope=scope, scheduler=scheduler
+    )
+
+
+def sampled(
+    source: TGetter[_T],
+    interval: float,
+    *,
+    clock: Optional[Clock] = None,
+    scope: Optional[Union[Scope, ScopeSuite]] = None,
+    scheduler: Optional[ExecutionScheduler] = None,
+) -> SignalResultProtocol[_T]:
+    """A signal taking the latest value of `source` every `interval` seconds, while
+    `source` changes."""
+    return _rate_limited(
+        source, sample=interval, clock=clock, scope=scope, scheduler=scheduler
+    )
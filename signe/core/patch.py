@@ -0,0 +1,115 @@
+from __future__ import annotations
+from copy import deepcopy
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+
+from signe.core.context import get_default_scheduler
+from signe.core.effect import Effect
+from signe.core.mixins import to_value
+from signe.core.reactive import ChangeRecord, DeepWatcher, is_reactive, to_raw
+from signe.core.scope import Scope, ScopeSuite, _DEFAULT_SCOPE_SUITE
+
+from .types import TGetter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .runtime import ExecutionScheduler
+
+
+TPatchOperation = Dict[str, Any]
+
+
+def to_json_pointer(path: Iterable[Any]) -> str:
+    """Converts a change path to a RFC 6901 JSON pointer.
+
+    ## Example
+    ```
+    to_json_pointer(("a", 0, "b/c"))  #    --> "/a/0/b~1c"
+    ```
+    """
+    return "".join(
+        "/" + str(key).replace("~", "~0").replace("/", "~1") for key in path
+    )
+
+
+def to_patch_operation(record: ChangeRecord) -> TPatchOperation:
+    """Converts a change record to a RFC 6902 patch operation."""
+    operation: TPatchOperation = {"op": record.op, "path": to_json_pointer(record.path)}
+    if record.op != "remove":
+        operation["value"] = record.value
+    return operation
+
+
+def watch_patches(
+    source: Union[Any, TGetter],
+    fn: Callable[[List[TPatchOperation]], None],
+    *,
+    scope: Optional[Union[Scope, ScopeSuite]] = None,
+    scheduler: Optional[ExecutionScheduler] = None,
+) -> Effect:
+    """Streams the mutations of a reactive container as JSON patch operations.
+
+    `fn` is called once per scheduler flush (so once per `batch`) with the list of
+    operations applied since the previous call. When the source signal is set to a
+    different object, a single "replace" of the whole document is emitted.
+
+    Args:
+        source: a reactive container, or a signal / getter returning one.
+        fn (Callable[[List[TPatchOperation]], None]): receives the patch operations.
+
+    ## Example
+    ```
+    state = reactive({"todos": []})
+    watch_patches(state, lambda ops: print(ops))
+
+    state["todos"].append("x")
+    # [{'op': 'add', 'path': '/todos/0', 'value': 'x'}]
+    ```
+    """
+    scheduler = scheduler or get_default_scheduler()
+    watcher = DeepWatcher(copy_values=True)
+    root = None
+
+    def getter():
+        value = source if is_reactive(source) else to_value(source)
+        if is_reactive(value):
+            watcher.watch(value, owner=effect)
+            watcher.track()
+        else:
+            watcher.unwatch()
+        return value
+
+    def scheduler_fn(effect: Effect):
+        nonlocal root
+        if not effect.is_need_update():
+            return
+
+        value = effect.update()
+        records = watcher.drain()
+
+        if value is not root:
+            root = value
+            operations = [{"op": "replace", "path": "", "value": deepcopy(to_raw(value))}]
+        else:
+            operations = [to_patch_operation(record) for record in records]
+
+        if operations:
+            fn(operations)
+
+    effect = Effect(
+        getter,
+        scheduler=scheduler,
+        scheduler_fn=scheduler_fn,
+        scope=scope or _DEFAULT_SCOPE_SUITE,
+    )
+
+    root = effect.update()
+    watcher.drain()
+    return effect
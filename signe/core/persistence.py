@@ -0,0 +1,323 @@
+from __future__ import annotations
+import json
+import os
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from signe.core.context import get_default_scheduler
+from signe.core.effect import Effect
+from signe.core.reactive import ChangeRecord, DeepWatcher, is_reactive
+from signe.core.scope import _DEFAULT_SCOPE_SUITE
+from signe.core.signal import Signal, signal
+from signe.core.snapshot import _apply_records
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .runtime import ExecutionScheduler
+    from .protocols import SignalResultProtocol
+
+
+_T = TypeVar("_T")
+
+
+class PersistentStore:
+    """Append-only journal of signal values, keyed by the signal `debug_name`.
+
+    Every write of a bound signal is appended to the log once per scheduler flush
+    (several writes of the same signal in a flush produce a single record). A nested
+    mutation of a reactive value appends only the changed path, not the whole value.
+    The log is rewritten with only the latest values when it grows past
+    `compact_ratio` times the number of keys.
+
+    Records are newline-delimited, `dumps` must not emit newlines (`json.dumps`
+    without `indent` does not).
+
+    Values are rehydrated lazily: opening the store only indexes the log, a value
+    is decoded when its signal is bound.
+
+    ## Example
+    ```
+    store = PersistentStore("state.log")
+    theme = store.signal("theme", "light")
+    theme.value = "dark"   # appended to state.log
+    ```
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        *,
+        compact_ratio: float = 2.0,
+        min_compact_records: int = 1000,
+        fsync: bool = True,
+        dumps: Callable[[Any], str] = json.dumps,
+        loads: Callable[[str], Any] = json.loads,
+        scheduler: Optional[ExecutionScheduler] = None,
+    ) -> None:
+        self._path = os.fspath(path)
+        self._compact_ratio = compact_ratio
+        self._min_compact_records = min_compact_records
+        self._fsync = fsync
+        self._dumps = dumps
+        self._loads = loads
+        self._scheduler = scheduler or get_default_scheduler()
+
+        # name -> (offset, length) of the latest full record, followed by the change
+        # records written after it; built on first use
+        self._index: Optional[Dict[str, List[Tuple[int, int]]]] = None
+        self._record_count = 0
+        self._bound: Dict[str, Signal] = {}
+        self._watchers: List[Effect] = []
+        # name -> changes since the last flush, None when the whole value is written
+        self._pending: Dict[str, Optional[List[ChangeRecord]]] = {}
+        self._file = None
+
+    def signal(self, name: str, default: _T, **kws) -> SignalResultProtocol[_T]:
+        """Creates a signal named `name`, holding the persisted value if there is one."""
+        kws.setdefault("scheduler", self._scheduler)
+        return self.bind(signal(default, debug_name=name, **kws))
+
+    def bind(self, sig: SignalResultProtocol[_T]) -> SignalResultProtocol[_T]:
+        """Restores the persisted value of `sig` (if any) and journals its writes."""
+        assert isinstance(sig, Signal)
+        name = sig.debug_name
+        if name is None:
+            raise ValueError("only signals with a `debug_name` can be persisted.")
+
+        if name in self._bound:
+            raise ValueError(f"a signal named {name!r} is already bound.")
+
+        index = self._get_index()
+        if name in index:
+            sig.value = self._read_value(index[name])
+
+        self._bound[name] = sig
+        self._watchers.append(self._watch(name, sig))
+        return sig
+
+    def flush(self):
+        """Writes the pending values to the log."""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        index = self._get_index()
+
+        # encoded first: a failing `dumps` leaves the log untouched
+        encoded: List[Tuple[str, bool, bytes]] = []
+        for name, records in pending.items():
+            lines = None
+            if records is not None and name in index:
+                lines = self._encode_changes(name, records)
+
+            if lines is None:
+                encoded.append((name, True, self._encode(name, self._raw(name))))
+            else:
+                encoded.extend((name, False, line) for line in lines)
+
+        file = self._open()
+        offset = file.seek(0, os.SEEK_END)
+        for name, full, line in encoded:
+            if full:
+                index[name] = [(offset, len(line))]
+            else:
+                index[name].append((offset, len(line)))
+            offset += len(line)
+
+        file.write(b"".join(line for _, _, line in encoded))
+        self._sync(file)
+        self._record_count += len(encoded)
+
+        if self._record_count >= max(
+            self._min_compact_records, self._compact_ratio * len(index)
+        ):
+            self.compact()
+
+    def compact(self):
+        """Rewrites the log with one record per key."""
+        index = self._get_index()
+        file = self._open()
+        tmp_path = self._path + ".compact"
+
+        new_index: Dict[str, List[Tuple[int, int]]] = {}
+        count = 0
+        offset = 0
+        with open(tmp_path, "wb") as tmp:
+            for name, segments in index.items():
+                if name in self._bound:
+                    lines = [self._encode(name, self._raw(name))]
+                else:
+                    lines = []
+                    for record_offset, length in segments:
+                        file.seek(record_offset)
+                        lines.append(file.read(length))
+
+                new_index[name] = []
+                for line in lines:
+                    tmp.write(line)
+                    new_index[name].append((offset, len(line)))
+                    offset += len(line)
+                count += len(lines)
+
+            self._sync(tmp)
+
+        file.close()
+        os.replace(tmp_path, self._path)
+        self._file = None
+        self._index = new_index
+        self._record_count = count
+
+    def close(self):
+        for watcher in self._watchers:
+            watcher.stop()
+        self._watchers.clear()
+
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _watch(self, name: str, sig: Signal) -> Effect:
+        watcher = DeepWatcher(copy_values=True)
+        root = None
+
+        def getter():
+            value = sig.value
+            if is_reactive(value):
+                watcher.watch(value, owner=effect)
+                watcher.track()
+            else:
+                watcher.unwatch()
+            return value
+
+        def scheduler_fn(effect: Effect):
+            nonlocal root
+            if not effect.is_need_update():
+                return
+
+            value = effect.update()
+            records = watcher.drain()
+            pending = self._pending
+
+            if value is not root or not is_reactive(value):
+                root = value
+                pending[name] = None
+            elif name not in pending:
+                pending[name] = records
+            elif pending[name] is not None:
+                pending[name].extend(records)  # type: ignore
+
+            sig._scheduler.call_after_flush(self.flush)
+
+        effect = Effect(
+            getter,
+            scheduler=sig._scheduler,
+            scheduler_fn=scheduler_fn,
+            scope=_DEFAULT_SCOPE_SUITE,
+        )
+        root = effect.update()
+        watcher.drain()
+        return effect
+
+    def _raw(self, name: str):
+        return self._bound[name]._raw_value
+
+    def _encode(self, name: str, value) -> bytes:
+        return self._line(json.dumps(name), value)
+
+    def _encode_changes(
+        self, name: str, records: List[ChangeRecord]
+    ) -> Optional[List[bytes]]:
+        """One line per change, None if a change can only be stored as the whole value."""
+        lines = []
+        for record in records:
+            if not record.path:
+                return None
+
+            try:
+                header = json.dumps([name, record.op, list(record.path)])
+            except TypeError:
+                # a key JSON cannot hold
+                return None
+
+            if record.op == "remove":
+                lines.append(f"{header}\t\n".encode("utf-8"))
+            else:
+                lines.append(self._line(header, record.value))
+        return lines
+
+    def _line(self, header: str, value) -> bytes:
+        text = self._dumps(value)
+        if "\n" in text:
+            raise ValueError(
+                f"`dumps` returned a newline for {header}, records are newline-delimited."
+            )
+        return f"{header}\t{text}\n".encode("utf-8")
+
+    def _read_value(self, segments: List[Tuple[int, int]]):
+        file = self._open()
+        value = None
+        records = []
+
+        for offset, length in segments:
+            file.seek(offset)
+            header, text = file.read(length).decode("utf-8")[:-1].split("\t", 1)
+            key = json.loads(header)
+            if isinstance(key, str):
+                value = self._loads(text)
+                continue
+
+            _, op, path = key
+            change_value = None if op == "remove" else self._loads(text)
+            records.append(ChangeRecord(op, tuple(path), change_value))
+
+        return _apply_records(value, records) if records else value
+
+    def _sync(self, file):
+        file.flush()
+        if self._fsync:
+            os.fsync(file.fileno())
+
+    def _open(self):
+        if self._file is None:
+            mode = "r+b" if os.path.exists(self._path) else "w+b"
+            self._file = open(self._path, mode)
+        return self._file
+
+    def _get_index(self) -> Dict[str, List[Tuple[int, int]]]:
+        if self._index is not None:
+            return self._index
+
+        file = self._open()
+        file.seek(0)
+        index: Dict[str, List[Tuple[int, int]]] = {}
+        offset = 0
+        count = 0
+
+        for line in file:
+            if not line.endswith(b"\n"):
+                # torn write of the last record
+                break
+
+            header, _ = line.split(b"\t", 1)
+            key = json.loads(header)
+            if isinstance(key, str):
+                index[key] = [(offset, len(line))]
+            elif key[0] in index:
+                index[key[0]].append((offset, len(line)))
+
+            offset += len(line)
+            count += 1
+
+        file.truncate(offset)
+        self._index = index
+        self._record_count = count
+        return index
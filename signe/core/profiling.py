@@ -0,0 +1,222 @@
+from __future__ import annotations
+import math
+import time
+from collections import defaultdict, deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+from .consts import EffectState
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .computed import Computed
+    from .effect import Effect
+    from .runtime import ExecutionScheduler
+
+
+class SchedulerHooks:
+    """Instrumentation hooks of an `ExecutionScheduler`.
+
+    Install with `scheduler.set_hooks(hooks)`. Every method is a no-op, override the
+    ones you need. With no hooks installed the scheduler only pays a `None` check.
+    """
+
+    def on_flush_start(self):
+        ...
+
+    def on_flush_end(self):
+        ...
+
+    def on_effect_start(self, effect: Effect):
+        """Called before the function of an effect (or of a computed) runs."""
+        ...
+
+    def on_effect_end(self, effect: Effect):
+        ...
+
+    def on_computed_recompute(self, computed: Computed, changed: bool):
+        ...
+
+    def on_trigger(self, source: Any, key: Any, state: EffectState):
+        """Called when `source` (signal, computed or reactive container) notifies the
+        subscribers of `key`. `state` is PENDING when a computed only may have changed."""
+        ...
+
+    def on_caller_trigger(
+        self, caller: Effect, source: Any, key: Any, state: EffectState
+    ):
+        """Called for each subscriber woken up by `on_trigger`, before it is scheduled."""
+        ...
+
+
+class CompositeHooks(SchedulerHooks):
+    """Forwards every event to several hooks."""
+
+    def __init__(self, *hooks: SchedulerHooks) -> None:
+        self._hooks = hooks
+
+    def on_flush_start(self):
+        for hooks in self._hooks:
+            hooks.on_flush_start()
+
+    def on_flush_end(self):
+        for hooks in self._hooks:
+            hooks.on_flush_end()
+
+    def on_effect_start(self, effect: Effect):
+        for hooks in self._hooks:
+            hooks.on_effect_start(effect)
+
+    def on_effect_end(self, effect: Effect):
+        for hooks in self._hooks:
+            hooks.on_effect_end(effect)
+
+    def on_computed_recompute(self, computed: Computed, changed: bool):
+        for hooks in self._hooks:
+            hooks.on_computed_recompute(computed, changed)
+
+    def on_trigger(self, source: Any, key: Any, state: EffectState):
+        for hooks in self._hooks:
+            hooks.on_trigger(source, key, state)
+
+    def on_caller_trigger(
+        self, caller: Effect, source: Any, key: Any, state: EffectState
+    ):
+        for hooks in self._hooks:
+            hooks.on_caller_trigger(caller, source, key, state)
+
+
+def node_name(node: Any) -> str:
+    """The `debug_name` of a signal / computed / effect, falling back to its id."""
+    name = getattr(node, "debug_name", None) if node is not None else None
+    if name:
+        return name
+
+    node_id = getattr(node, "id", None)
+    return node_id if isinstance(node_id, str) else f"{type(node).__name__}_{id(node)}"
+
+
+class ProfileStats:
+    __slots__ = ("name", "kind", "runs", "total_time", "_samples")
+
+    def __init__(self, name: str, kind: str, max_samples: int) -> None:
+        self.name = name
+        self.kind = kind
+        self.runs = 0
+        self.total_time = 0.0
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+
+    def add(self, duration: float):
+        self.runs += 1
+        self.total_time += duration
+        self._samples.append(duration)
+
+    def percentile(self, q: float) -> float:
+        """Percentile of the most recent run times, `q` in [0, 100]."""
+        if not self._samples:
+            return 0.0
+        samples = sorted(self._samples)
+        return samples[max(math.ceil(q / 100 * len(samples)) - 1, 0)]
+
+    @property
+    def p99(self) -> float:
+        return self.percentile(99)
+
+    def __repr__(self) -> str:
+        return (
+            f"ProfileStats(name={self.name}, kind={self.kind}, runs={self.runs}, "
+            f"total_time={self.total_time:.6f}, p99={self.p99:.6f})"
+        )
+
+
+class ProfileCollector(SchedulerHooks):
+    """Aggregates run counts and run times per `debug_name`, and the number of value
+    changes notified by each source.
+
+    ## Example
+    ```
+    collector = ProfileCollector().attach(scheduler)
+    ...
+    for stats in collector.report()[:10]:
+        print(stats)
+    ```
+    """
+
+    def __init__(
+        self,
+        *,
+        max_samples: int = 1000,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._max_samples = max_samples
+        self._clock = clock
+        self._scheduler: Optional[ExecutionScheduler] = None
+        self.stats: Dict[str, ProfileStats] = {}
+        self.trigger_counts: Dict[str, int] = defaultdict(int)
+        self.flush_count = 0
+        self.flush_time = 0.0
+        self._running: List[Tuple[Effect, float]] = []
+        self._flush_start = 0.0
+        self._computed_names: set = set()
+
+    def attach(self, scheduler: ExecutionScheduler) -> ProfileCollector:
+        self._scheduler = scheduler
+        scheduler.set_hooks(self)
+        return self
+
+    def detach(self):
+        if self._scheduler is not None and self._scheduler.hooks is self:
+            self._scheduler.set_hooks(None)
+        self._scheduler = None
+
+    def reset(self):
+        self.stats.clear()
+        self.trigger_counts.clear()
+        self.flush_count = 0
+        self.flush_time = 0.0
+
+    def report(self) -> List[ProfileStats]:
+        """Stats sorted by cumulative run time, slowest first."""
+        return sorted(self.stats.values(), key=lambda s: s.total_time, reverse=True)
+
+    def on_flush_start(self):
+        self._flush_start = self._clock()
+
+    def on_flush_end(self):
+        self.flush_count += 1
+        self.flush_time += self._clock() - self._flush_start
+
+    def on_effect_start(self, effect: Effect):
+        self._running.append((effect, self._clock()))
+
+    def on_effect_end(self, effect: Effect):
+        end = self._clock()
+        if not self._running or self._running[-1][0] is not effect:
+            # started before the collector was attached
+            return
+        _, start = self._running.pop()
+
+        name = node_name(effect)
+        stats = self.stats.get(name)
+        if stats is None:
+            kind = "computed" if name in self._computed_names else "effect"
+            stats = self.stats[name] = ProfileStats(name, kind, self._max_samples)
+        stats.add(end - start)
+
+    def on_computed_recompute(self, computed: Computed, changed: bool):
+        # the run time was recorded under the inner effect
+        name = node_name(computed._effect)
+        if name not in self._computed_names:
+            self._computed_names.add(name)
+            if name in self.stats:
+                self.stats[name].kind = "computed"
+
+    def on_trigger(self, source: Any, key: Any, state: EffectState):
+        if state == EffectState.NEED_UPDATE:
+            self.trigger_counts[node_name(source)] += 1
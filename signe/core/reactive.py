@@ -1,5 +1,6 @@
 from __future__ import annotations
 from collections import UserDict, UserList
+from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -8,6 +9,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Tuple,
     TypeVar,
     cast,
     Iterable,
@@ -19,7 +21,8 @@ from signe.core.helper import has_changed, is_object
 from signe.core.mixins import is_signal
 from signe.core.protocols import RawableProtocol
 from .batch import batch
-from weakref import WeakKeyDictionary, WeakValueDictionary
+from copy import deepcopy
+from weakref import WeakKeyDictionary, WeakValueDictionary, WeakSet, ref
 from functools import partial
 
 
@@ -114,7 +117,14 @@ def is_reactive(obj: object) -> bool:
     return _is_proxy(obj)
 
 
+# skip the (slow) runtime protocol check for the values written most often
+_PLAIN_TYPES = frozenset((int, float, str, bool, bytes, type(None)))
+
+
 def to_raw(obj: T) -> T:
+    if type(obj) in _PLAIN_TYPES:
+        return obj
+
     if isinstance(obj, RawableProtocol):
         return obj.to_raw()
 
@@ -127,6 +137,259 @@ def _is_proxy(obj):
     return isinstance(obj, (DictProxy, ListProxy, InstanceProxy))
 
 
+_DEEP_KEY = "__deep__"
+
+
+@dataclass(frozen=True)
+class ChangeRecord:
+    """A mutation of a reactive container.
+
+    `path` is relative to the container being watched. `op` is one of
+    "add", "replace" or "remove"; `value` is the raw value written (None for "remove").
+    """
+
+    op: str
+    path: Tuple[Any, ...]
+    value: Any = None
+
+
+class _Journal:
+    __slots__ = ("parents", "children", "watchers")
+
+    def __init__(self) -> None:
+        # parent proxy -> keys of this container in the parent (as a dict, ordered)
+        self.parents: WeakKeyDictionary = WeakKeyDictionary()
+        # keeps linked child proxies alive, `_proxy_maps` only holds them weakly
+        self.children: set = set()
+        self.watchers: WeakSet[DeepWatcher] = WeakSet()
+
+
+_journals: WeakKeyDictionary = WeakKeyDictionary()
+# the `DeepWatcher`s watching a root, mutations skip the journals while it is empty
+_watching: WeakSet = WeakSet()
+
+
+def _get_journal(proxy) -> _Journal:
+    journal = _journals.get(proxy)
+    if journal is None:
+        journal = _Journal()
+        _journals[proxy] = journal
+    return journal
+
+
+def _get_dep_manager(proxy) -> GetterDepManager:
+    if isinstance(proxy, InstanceProxy):
+        return _instance_dep_maps[proxy]
+    return proxy._dep_manager
+
+
+def _iter_children(proxy):
+    if isinstance(proxy, DictProxy):
+        return proxy.data.items()
+
+    if isinstance(proxy, ListProxy):
+        return enumerate(proxy.data)
+
+    ins = _instance_proxy_maps.get(proxy)
+    return ((key, getattr(ins, key)) for key in _get_data_fields(proxy))
+
+
+def _link_subtree(proxy):
+    """Links every nested container below `proxy` to its parent in the change journal."""
+    scheduler = _get_dep_manager(proxy)._scheduler
+    stack = [proxy]
+    seen = set()
+
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+
+        for key, value in _iter_children(current):
+            if not is_object(value):
+                continue
+
+            child = reactive(value, scheduler)
+            if _is_proxy(child):
+                _attach(current, key, child)
+                stack.append(child)
+
+
+def _link_child(proxy, key, value):
+    """Called after `value` is stored under `key`; only containers already in a journal link."""
+    if proxy not in _journals or not is_object(value):
+        return
+
+    child = reactive(value, _get_dep_manager(proxy)._scheduler)
+    if _is_proxy(child):
+        _attach(proxy, key, child)
+        _link_subtree(child)
+
+
+def _attach(parent, key, child):
+    parents = _get_journal(child).parents
+    keys = parents.get(parent)
+    if keys is None:
+        parents[parent] = {key: None}
+    else:
+        keys[key] = None
+    _get_journal(parent).children.add(child)
+
+
+def _raw_of(proxy):
+    if isinstance(proxy, InstanceProxy):
+        return _instance_proxy_maps.get(proxy)
+    return proxy.data
+
+
+def _resolve_keys(parent, keys: dict, child) -> dict:
+    """Returns the current keys of `child` in `parent`, empty if it was removed."""
+    raw = _raw_of(child)
+
+    if isinstance(parent, ListProxy):
+        data = parent.data
+        size = len(data)
+        if all(isinstance(key, int) and key < size and data[key] is raw for key in keys):
+            return keys
+
+        # indexes shift after insert / remove / sort
+        return {idx: None for idx, item in enumerate(data) if item is raw}
+
+    if isinstance(parent, DictProxy):
+        data = parent.data
+        return {key: None for key in keys if key in data and data[key] is raw}
+
+    ins = _raw_of(parent)
+    return {key: None for key in keys if getattr(ins, key, None) is raw}
+
+
+def _record_change(proxy, op: str, path: Tuple[Any, ...], value: Any = None):
+    """Bubbles a mutation of `proxy` to the watchers of it and of its ancestors.
+
+    A container stored under several keys reports the change once per path.
+    """
+    if not _watching or proxy not in _journals:
+        return
+
+    # the ids along each path, a container nested in itself is not followed again
+    stack = [(proxy, path, (id(proxy),))]
+    notified = set()
+
+    while stack:
+        current, current_path, ancestors = stack.pop()
+
+        journal = _journals.get(current)
+        if journal is None:
+            continue
+
+        if journal.watchers:
+            record = ChangeRecord(op, current_path, value)
+            for watcher in tuple(journal.watchers):
+                if watcher.alive:
+                    watcher._append(record)
+                else:
+                    journal.watchers.discard(watcher)
+                    _watching.discard(watcher)
+
+            if id(current) not in notified:
+                notified.add(id(current))
+                _get_dep_manager(current).triggered(
+                    _DEEP_KEY, None, EffectState.NEED_UPDATE
+                )
+
+        upward = []
+        for parent, keys in tuple(journal.parents.items()):
+            keys = _resolve_keys(parent, keys, current)
+            if not keys:
+                del journal.parents[parent]
+                _get_journal(parent).children.discard(current)
+                continue
+
+            journal.parents[parent] = keys
+            if id(parent) not in ancestors:
+                parent_ancestors = ancestors + (id(parent),)
+                upward.extend(
+                    (parent, (key,) + current_path, parent_ancestors) for key in keys
+                )
+
+        # pushed in reverse, the paths come out in link and key order
+        stack.extend(reversed(upward))
+
+
+class DeepWatcher:
+    """Subscribes to the change journal of a reactive container.
+
+    Nested containers are linked once on `watch`, after that every mutation below
+    the root is delivered as a `ChangeRecord`, without walking the structure again.
+    """
+
+    def __init__(self, copy_values=False) -> None:
+        """
+        Args:
+            copy_values (bool, optional): store a deep copy of the written values, so the
+                records still describe the state at write time after later mutations.
+                Defaults to False.
+        """
+        self._root = None
+        self._owner = None
+        self._copy_values = copy_values
+        self._records: List[ChangeRecord] = []
+
+    @property
+    def root(self):
+        return self._root
+
+    @property
+    def alive(self) -> bool:
+        if self._owner is None:
+            return True
+
+        owner = self._owner()
+        return owner is not None and getattr(owner, "_active", True)
+
+    def watch(self, proxy, owner=None):
+        """Subscribes to `proxy`, if not already.
+
+        Args:
+            proxy: reactive container to watch.
+            owner (optional): the records are dropped once `owner` is gone or inactive.
+        """
+        if proxy is not self._root:
+            self.unwatch()
+            self._root = proxy
+            _get_journal(proxy).watchers.add(self)
+            _watching.add(self)
+            _link_subtree(proxy)
+
+        if owner is not None:
+            self._owner = ref(owner)
+
+    def track(self):
+        """Makes the running caller depend on any change below the root."""
+        if self._root is not None:
+            _get_dep_manager(self._root).tracked(_DEEP_KEY)
+
+    def unwatch(self):
+        if self._root is not None:
+            journal = _journals.get(self._root)
+            if journal is not None:
+                journal.watchers.discard(self)
+            _watching.discard(self)
+
+        self._root = None
+        self._records = []
+
+    def _append(self, record: ChangeRecord):
+        if self._copy_values and record.value is not None:
+            record = ChangeRecord(record.op, record.path, deepcopy(record.value))
+        self._records.append(record)
+
+    def drain(self) -> List[ChangeRecord]:
+        records, self._records = self._records, []
+        return records
+
+
 class DictProxy(UserDict):
     def __init__(
         self,
@@ -135,7 +398,7 @@ class DictProxy(UserDict):
     ):
         super().__init__()
         self.data = data
-        self._dep_manager = GetterDepManager(scheduler)
+        self._dep_manager = GetterDepManager(scheduler, self)
         self.__nested = set()
         self._scheduler = scheduler
         self.__batch = partial(batch, scheduler=scheduler)
@@ -160,6 +423,8 @@ class DictProxy(UserDict):
                 )
 
                 self._dep_manager.triggered("__iter__", None, EffectState.NEED_UPDATE)
+                _link_child(self, key, item)
+                _record_change(self, "add", (key,), item)
 
             else:
                 org_value = self.data[key]
@@ -170,6 +435,8 @@ class DictProxy(UserDict):
                     self._dep_manager.triggered(
                         "__iter__", None, EffectState.NEED_UPDATE
                     )
+                    _link_child(self, key, item)
+                    _record_change(self, "replace", (key,), item)
 
     def __iter__(self) -> Iterator:
         self._dep_manager.tracked("__iter__")
@@ -192,6 +459,7 @@ class DictProxy(UserDict):
         def _():
             self._dep_manager.triggered("len", len(self.data), EffectState.NEED_UPDATE)
             self._dep_manager.triggered("__iter__", None, EffectState.NEED_UPDATE)
+            _record_change(self, "remove", (key,))
 
     def clear(self) -> None:
         super().clear()
@@ -221,7 +489,7 @@ class ListProxy(UserList):
     ):
         super().__init__()
         self.data = initlist
-        self._dep_manager = GetterDepManager(scheduler)
+        self._dep_manager = GetterDepManager(scheduler, self)
         self.__nested = set()
         self._scheduler = scheduler
         self.__batch = partial(batch, scheduler=scheduler)
@@ -249,6 +517,15 @@ class ListProxy(UserList):
                 self._dep_manager.triggered(i, item, EffectState.NEED_UPDATE)
                 self._dep_manager.triggered("__iter__", None, EffectState.NEED_UPDATE)
 
+                if isinstance(i, slice):
+                    for idx, value in enumerate(self.data):
+                        _link_child(self, idx, value)
+                    _record_change(self, "replace", (), self.data)
+                else:
+                    idx = i % len(self.data)
+                    _link_child(self, idx, item)
+                    _record_change(self, "replace", (idx,), item)
+
     def __iter__(self) -> Iterator:
         self._dep_manager.tracked("__iter__")
         return super().__iter__()
@@ -259,28 +536,40 @@ class ListProxy(UserList):
         return len(self.data)
 
     def append(self, item: Any) -> None:
-        super().append(to_raw(item))
+        item = to_raw(item)
+        super().append(item)
 
         @self.__batch
         def _():
             self._dep_manager.triggered("len", len(self.data), EffectState.NEED_UPDATE)
             self._dep_manager.triggered("__iter__", None, EffectState.NEED_UPDATE)
+            idx = len(self.data) - 1
+            _link_child(self, idx, item)
+            _record_change(self, "add", (idx,), item)
 
     def insert(self, i: int, item: Any) -> None:
-        super().insert(i, to_raw(item))
+        item = to_raw(item)
+        idx = min(i, len(self.data)) if i >= 0 else max(len(self.data) + i, 0)
+        super().insert(i, item)
 
         @self.__batch
         def _():
             self._dep_manager.triggered("len", len(self.data), EffectState.NEED_UPDATE)
             self._dep_manager.triggered("__iter__", None, EffectState.NEED_UPDATE)
+            _link_child(self, idx, item)
+            _record_change(self, "add", (idx,), item)
 
     def extend(self, other: Iterable) -> None:
+        start = len(self.data)
         super().extend((to_raw(o) for o in other))
 
         @self.__batch
         def _():
             self._dep_manager.triggered("len", len(self.data), EffectState.NEED_UPDATE)
             self._dep_manager.triggered("__iter__", None, EffectState.NEED_UPDATE)
+            for idx in range(start, len(self.data)):
+                _link_child(self, idx, self.data[idx])
+                _record_change(self, "add", (idx,), self.data[idx])
 
     def sort(self, /, *args, **kwds):
         org_data = self.data.copy()
@@ -292,6 +581,7 @@ class ListProxy(UserList):
             for idx, (org, new_value) in enumerate(zip(org_data, self.data)):
                 if has_changed(org, new_value):
                     self._dep_manager.triggered(idx, new_value, EffectState.NEED_UPDATE)
+            _record_change(self, "replace", (), self.data)
 
     def reverse(self) -> None:
         org_data = self.data.copy()
@@ -303,22 +593,27 @@ class ListProxy(UserList):
             for idx, (org, new_value) in enumerate(zip(org_data, self.data)):
                 if has_changed(org, new_value):
                     self._dep_manager.triggered(idx, new_value, EffectState.NEED_UPDATE)
+            _record_change(self, "replace", (), self.data)
 
     def remove(self, item: Any) -> None:
-        super().remove(to_raw(item))
+        idx = self.data.index(to_raw(item))
+        del self.data[idx]
 
         @self.__batch
         def _():
             self._dep_manager.triggered("len", len(self.data), EffectState.NEED_UPDATE)
             self._dep_manager.triggered("__iter__", None, EffectState.NEED_UPDATE)
+            _record_change(self, "remove", (idx,))
 
     def pop(self, i: int = -1) -> Any:
+        idx = i % len(self.data) if self.data else i
         value = super().pop(i)
 
         @self.__batch
         def _():
             self._dep_manager.triggered("len", len(self.data), EffectState.NEED_UPDATE)
             self._dep_manager.triggered("__iter__", None, EffectState.NEED_UPDATE)
+            _record_change(self, "remove", (idx,))
 
         return value
 
@@ -329,6 +624,7 @@ class ListProxy(UserList):
         def _():
             self._dep_manager.triggered("len", len(self.data), EffectState.NEED_UPDATE)
             self._dep_manager.triggered("__iter__", None, EffectState.NEED_UPDATE)
+            _record_change(self, "replace", (), self.data)
 
     def __contains__(self, item) -> bool:
         result = to_raw(item) in self.data
@@ -349,12 +645,17 @@ class ListProxy(UserList):
         return False
 
     def __delitem__(self, i: slice) -> None:
+        idx = i if isinstance(i, slice) or not self.data else i % len(self.data)
         super().__delitem__(i)
 
         @self.__batch
         def _():
             self._dep_manager.triggered("len", len(self.data), EffectState.NEED_UPDATE)
             self._dep_manager.triggered("__iter__", None, EffectState.NEED_UPDATE)
+            if isinstance(idx, slice):
+                _record_change(self, "replace", (), self.data)
+            else:
+                _record_change(self, "remove", (idx,))
 
     def to_raw(self):
         return self.data
@@ -377,7 +678,7 @@ def _register_ins(
     scheduler: ExecutionScheduler,
 ):
     _instance_proxy_maps[proxy] = ins
-    _instance_dep_maps[proxy] = GetterDepManager(scheduler)
+    _instance_dep_maps[proxy] = GetterDepManager(scheduler, proxy)
 
 
 def _is_instance_method(obj, key: str):
@@ -419,9 +720,25 @@ def _trigger_ins(proxy: InstanceProxy, key, value):
     assert ins
     assert dep_manager
 
+    is_new = not hasattr(ins, key)
+    org_value = None if is_new else getattr(ins, key)
     setattr(ins, key, value)
+
+    batch(
+        lambda: _trigger_ins_changed(proxy, dep_manager, key, value, is_new, org_value),
+        dep_manager._scheduler,
+    )
+
+
+def _trigger_ins_changed(
+    proxy: InstanceProxy, dep_manager: GetterDepManager, key, value, is_new, org_value
+):
     dep_manager.triggered(key, value, EffectState.NEED_UPDATE)
 
+    if is_new or has_changed(org_value, value):
+        _link_child(proxy, key, value)
+        _record_change(proxy, "add" if is_new else "replace", (key,), value)
+
 
 def _get_data_fields(proxy: InstanceProxy):
     ins = _instance_proxy_maps.get(proxy)
@@ -0,0 +1,355 @@
+from __future__ import annotations
+import pickle
+import queue
+import threading
+from multiprocessing.connection import (
+    Client,
+    Connection,
+    Listener,
+    answer_challenge,
+    deliver_challenge,
+)
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from signe.core.batch import batch
+from signe.core.context import get_default_scheduler
+from signe.core.effect import Effect
+from signe.core.on import on
+from signe.core.signal import Signal
+
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncio
+    from .runtime import ExecutionScheduler
+
+
+TSignals = Union[Mapping[str, Signal], Iterable[Signal]]
+
+# message kinds
+_HELLO = "hello"
+_SNAPSHOT = "snapshot"
+_DELTA = "delta"
+
+
+def _named_signals(signals: TSignals) -> Dict[str, Signal]:
+    if isinstance(signals, Mapping):
+        return dict(signals)
+
+    result = {}
+    for sig in signals:
+        if sig.debug_name is None:
+            raise ValueError("only signals with a `debug_name` can be replicated.")
+        result[sig.debug_name] = sig
+    return result
+
+
+class _ReplicaLink:
+    """A connected replica, fed by its own writer thread so that a slow replica
+    delays neither the primary's flushes nor the other replicas."""
+
+    def __init__(self, conn: Connection, on_lost) -> None:
+        self._conn = conn
+        self._on_lost = on_lost
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+    def send(self, message: Tuple):
+        self._queue.put(message)
+
+    def close(self):
+        self._queue.put(None)
+
+    def _write_loop(self):
+        try:
+            while True:
+                message = self._queue.get()
+                if message is None:
+                    return
+                self._conn.send(message)
+        except OSError:
+            self._on_lost(self)
+        finally:
+            self._conn.close()
+
+
+class ReplicationPrimary:
+    """Publishes the values of named signals to `ReplicationReplica` processes.
+
+    Changes are sent once per scheduler flush as one message with a sequence number.
+    A replica that connects (or reconnects) first receives the whole state.
+
+    Values are pickled: only peers knowing `authkey` can connect, both sides
+    authenticate each other before any message is exchanged.
+
+    Args:
+        address: a Unix socket path, a Windows named pipe, or a (host, port) tuple.
+        signals: signals by name, or signals with a `debug_name`.
+        authkey (bytes): the secret shared with the replicas.
+        handshake_timeout (float, optional): seconds a new replica has to say hello.
+            Defaults to 5.
+    """
+
+    def __init__(
+        self,
+        address,
+        signals: TSignals,
+        *,
+        authkey: bytes,
+        handshake_timeout: float = 5.0,
+        scheduler: Optional[ExecutionScheduler] = None,
+    ) -> None:
+        if not isinstance(authkey, bytes) or not authkey:
+            raise TypeError("authkey must be a non-empty bytes string.")
+
+        self._signals = _named_signals(signals)
+        self._scheduler = scheduler or get_default_scheduler()
+        self._authkey = authkey
+        self._handshake_timeout = handshake_timeout
+        self._lock = threading.Lock()
+        self._links: List[_ReplicaLink] = []
+        self._pending: Dict[str, Signal] = {}
+        self._seq = 0
+
+        # name -> pickled value, what a new replica receives
+        self._state = {
+            name: pickle.dumps(sig._raw_value) for name, sig in self._signals.items()
+        }
+
+        self._watchers: List[Effect] = [
+            on(
+                sig,
+                self._make_on_change(name, sig),
+                onchanges=True,
+                deep=True,
+                scheduler=self._scheduler,
+            )
+            for name, sig in self._signals.items()
+        ]
+
+        # authentication happens in `_handshake`, off the accept thread
+        self._listener = Listener(address)
+        self._closed = False
+        self._accept_thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._accept_thread.start()
+
+    @property
+    def address(self):
+        return self._listener.address
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    def _make_on_change(self, name: str, sig: Signal):
+        def on_change():
+            self._pending[name] = sig
+            self._scheduler.call_after_flush(self._publish)
+
+        return on_change
+
+    def _publish(self):
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+        values = {name: pickle.dumps(sig._raw_value) for name, sig in pending.items()}
+
+        with self._lock:
+            self._seq += 1
+            self._state.update(values)
+            message = (_DELTA, self._seq, values)
+            for link in self._links:
+                link.send(message)
+
+    def _remove_link(self, link: _ReplicaLink):
+        with self._lock:
+            if link in self._links:
+                self._links.remove(link)
+
+    def _accept_loop(self):
+        while not self._closed:
+            try:
+                conn = self._listener.accept()
+            except OSError:
+                return
+
+            threading.Thread(target=self._handshake, args=(conn,), daemon=True).start()
+
+    def _handshake(self, conn: Connection):
+        try:
+            deliver_challenge(conn, self._authkey)
+            answer_challenge(conn, self._authkey)
+
+            if not conn.poll(self._handshake_timeout):
+                raise EOFError("no hello from the replica.")
+            kind, _ = conn.recv()
+            if kind != _HELLO:
+                raise EOFError(f"unexpected {kind!r} message from the replica.")
+
+            with self._lock:
+                if self._closed:
+                    raise EOFError("closed.")
+                link = _ReplicaLink(conn, self._remove_link)
+                # queued before any delta published after this snapshot
+                link.send((_SNAPSHOT, self._seq, dict(self._state)))
+                self._links.append(link)
+        except Exception:
+            conn.close()
+
+    def close(self):
+        for watcher in self._watchers:
+            watcher.stop()
+
+        self._closed = True
+        self._listener.close()
+
+        with self._lock:
+            for link in self._links:
+                link.close()
+            self._links.clear()
+
+
+class ReplicationReplica:
+    """Mirrors the signals published by a `ReplicationPrimary`.
+
+    Received values are applied by `poll`, as one batch, on the thread that calls
+    it (signals are not thread-safe). With asyncio, `attach` applies them as soon as
+    they arrive. A gap in the sequence numbers, or a lost connection, triggers a
+    reconnect that resynchronises the whole state; attached replicas retry every
+    `reconnect_delay` seconds until the primary is back.
+    """
+
+    def __init__(
+        self,
+        address,
+        signals: TSignals,
+        *,
+        authkey: bytes,
+        reconnect_delay: float = 1.0,
+        scheduler: Optional[ExecutionScheduler] = None,
+    ) -> None:
+        if not isinstance(authkey, bytes) or not authkey:
+            raise TypeError("authkey must be a non-empty bytes string.")
+
+        self._address = address
+        self._reconnect_delay = reconnect_delay
+        self._reconnect_timer: Optional[asyncio.TimerHandle] = None
+        self._authkey = authkey
+        self._signals = _named_signals(signals)
+        self._scheduler = scheduler or get_default_scheduler()
+        self._conn: Optional[Connection] = None
+        self._seq = -1
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    @property
+    def connected(self) -> bool:
+        return self._conn is not None
+
+    def connect(self):
+        self.disconnect()
+        self._conn = Client(self._address, authkey=self._authkey)
+        self._conn.send((_HELLO, self._seq))
+
+        if self._loop is not None:
+            self._loop.add_reader(self._conn.fileno(), self.poll)
+
+    def disconnect(self):
+        if self._reconnect_timer is not None:
+            self._reconnect_timer.cancel()
+            self._reconnect_timer = None
+
+        if self._conn is None:
+            return
+
+        if self._loop is not None:
+            self._loop.remove_reader(self._conn.fileno())
+
+        self._conn.close()
+        self._conn = None
+
+    def attach(self, loop: asyncio.AbstractEventLoop):
+        """Applies received values from the event loop as soon as they arrive."""
+        self._loop = loop
+        if self._conn is not None:
+            loop.add_reader(self._conn.fileno(), self.poll)
+
+    def poll(self, timeout: float = 0) -> int:
+        """Applies every message received so far.
+
+        Args:
+            timeout (float, optional): seconds to wait for the first message. Defaults to 0.
+
+        Returns:
+            int: the number of messages applied, 0 while the primary cannot be
+                reached (the next call tries to connect again).
+        """
+        values: Dict[str, bytes] = {}
+        count = 0
+
+        try:
+            if self._conn is None:
+                self.connect()
+
+            conn = self._conn
+            assert conn is not None
+
+            while conn.poll(timeout if count == 0 else 0):
+                kind, seq, message_values = conn.recv()
+
+                if kind == _DELTA and seq != self._seq + 1:
+                    # lost a message, start over with a full snapshot
+                    self.connect()
+                    return count + self.poll(timeout)
+
+                if kind == _SNAPSHOT:
+                    values.clear()
+
+                values.update(message_values)
+                self._seq = seq
+                count += 1
+        except (OSError, EOFError):
+            self.disconnect()
+            self._schedule_reconnect()
+
+        if values:
+            self._apply(values)
+        return count
+
+    def _schedule_reconnect(self):
+        if self._loop is not None and self._reconnect_timer is None:
+            self._reconnect_timer = self._loop.call_later(
+                self._reconnect_delay, self._reconnect
+            )
+
+    def _reconnect(self):
+        self._reconnect_timer = None
+        try:
+            self.connect()
+        except OSError:
+            self._schedule_reconnect()
+
+    def _apply(self, values: Dict[str, bytes]):
+        def apply():
+            for name, payload in values.items():
+                sig = self._signals.get(name)
+                if sig is not None:
+                    sig.value = pickle.loads(payload)
+
+        batch(apply, self._scheduler)
+
+    def close(self):
+        self.disconnect()
+        self._loop = None
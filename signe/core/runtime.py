@@ -1,9 +1,18 @@
 from __future__ import annotations
-from typing import Callable, Dict
+import asyncio
+import time
+from collections import Counter, deque
+from typing import Any, Callable, Dict, List, Optional, Set, TYPE_CHECKING
+from weakref import WeakSet
 
 
 from .collections import Stack
 from .protocols import CallerProtocol
+from .profiling import node_name
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .signal import Signal
+    from .profiling import SchedulerHooks
 
 
 # def _defatul_executor_builder():
@@ -48,14 +57,107 @@ from .protocols import CallerProtocol
 #         return self._caller_running_stack.get_current()
 
 
-class ExecutionScheduler:
+class SchedulerLoopError(Exception):
+    """Raised when a flush does not settle, `effects` are the callers that kept being
+    scheduled (typically an effect writing a signal it reads)."""
+
+    def __init__(self, message: str, effects: List[Any]) -> None:
+        names = ", ".join(node_name(effect) for effect in effects)
+        super().__init__(f"{message} effects: [{names}]")
+        self.effects = effects
+
+
+class SlicedFlushStats:
+    """Metrics of the time-sliced flushes of a scheduler.
+
+    `latency` is the time from the flush request (or the call of `run_sliced`) to the
+    end of the flush.
+    """
+
+    __slots__ = ("flushes", "slices", "total_latency", "max_latency", "max_slice_time")
+
     def __init__(self) -> None:
+        self.flushes = 0
+        self.slices = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.max_slice_time = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"SlicedFlushStats(flushes={self.flushes}, slices={self.slices}, "
+            f"max_latency={self.max_latency:.6f}, max_slice_time={self.max_slice_time:.6f})"
+        )
+
+
+class ExecutionScheduler:
+    """
+    Args:
+        max_rounds (int, optional): execution rounds a flush may take. Defaults to 10000.
+        runaway_rounds (Optional[int], optional): an effect scheduled in more rounds
+            than this during one flush aborts it. Only the effects that keep scheduling
+            others are blamed. Defaults to None, no check.
+        weak_subscriptions (bool, optional): sources hold their subscribers weakly, an
+            effect or computed is then kept alive only by the references you keep to
+            it. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_rounds: int = 10000,
+        runaway_rounds: Optional[int] = None,
+        weak_subscriptions: bool = False,
+    ) -> None:
         self._caller_running_stack = Stack[CallerProtocol]()
         self._pause_track_count = 0
 
-        self._scheduler_fns: Dict[Callable[[], None], None] = {}
+        # effects queue themselves at most once per round, see `Effect.trigger`
+        self._scheduler_fns: List[Callable[[], None]] = []
+        self._post_flush_fns: Dict[Callable[[], None], None] = {}
         self.__running = 0
         self.pause_should_run_stack = 0
+        # nesting of `batch`, only the outermost one flushes
+        self._batch_depth = 0
+        # signal -> raw value before its first write in the current batch
+        self._pending_writes: Dict[Signal, Any] = {}
+        # live signals, only registered while `track_signals` is on
+        self._signals: Optional[WeakSet[Signal]] = None
+        self._signal_trackers = 0
+        self.hooks: Optional[SchedulerHooks] = None
+        self.max_rounds = max_rounds
+        self.runaway_rounds = runaway_rounds
+        self.weak_subscriptions = weak_subscriptions
+        self.sliced_stats = SlicedFlushStats()
+        self._async_budget: Optional[float] = None
+        self._async_task: Optional[asyncio.Task] = None
+
+    def set_hooks(self, hooks: Optional[SchedulerHooks]):
+        """Installs instrumentation hooks; `None` disables them."""
+        self.hooks = hooks
+
+    def track_signals(self):
+        """Registers the signals created with this scheduler from now on, see
+        `get_signals`, until the matching `untrack_signals`. Off by default, a
+        `SnapshotManager` turns it on until it is closed."""
+        self._signal_trackers += 1
+        if self._signals is None:
+            self._signals = WeakSet()
+
+    def untrack_signals(self):
+        """Undoes one `track_signals` call, the last one forgets the signals."""
+        if self._signal_trackers == 0:
+            return
+
+        self._signal_trackers -= 1
+        if self._signal_trackers == 0:
+            self._signals = None
+
+    def get_signals(self) -> List[Signal]:
+        """Returns the live signals created with this scheduler since `track_signals`."""
+        if self._signals is None:
+            return []
+        return list(self._signals)
 
     def pause_track(self):
         self._pause_track_count += 1  # pragma: no cover
@@ -86,28 +188,260 @@ class ExecutionScheduler:
         self.pause_should_run_stack -= 1
 
     def push_scheduler_fn(self, fn: Callable[[], None]):
-        self._scheduler_fns[fn] = None
+        self._scheduler_fns.append(fn)
+
+    def defer_write(self, signal: Signal, original):
+        if signal not in self._pending_writes:
+            self._pending_writes[signal] = original
+
+    def commit_writes(self):
+        """Triggers the signals written in the current batch whose value differs from
+        the one they had before it. Net-unchanged writes trigger nothing."""
+        while self._pending_writes:
+            writes, self._pending_writes = self._pending_writes, {}
+            for signal, original in writes.items():
+                signal._commit_write(original)
+
+    def call_after_flush(self, fn: Callable[[], None]):
+        """Calls `fn` once, after the current (or next) flush has run every effect.
+
+        Registering the same function several times during a flush only calls it once.
+        """
+        self._post_flush_fns[fn] = None
+
+    def enable_async_flush(self, budget: float = 0.005):
+        """Flushes with `run_sliced` on the running event loop instead of synchronously.
+
+        Writes made from the event loop only schedule the flush, effects run later in
+        slices of at most about `budget` seconds. Without a running loop the scheduler
+        keeps flushing synchronously.
+        """
+        self._async_budget = budget
+
+    def disable_async_flush(self):
+        self._async_budget = None
+
+    @property
+    def flush_task(self) -> Optional[asyncio.Task]:
+        """The pending async flush, if any. Await it to wait for the effects."""
+        return self._async_task
 
     def run(self):
+        if self._async_budget is not None and self.__running == 0:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+
+            if loop is not None:
+                if self._async_task is None and (
+                    self._scheduler_fns or self._post_flush_fns
+                ):
+                    self._async_task = loop.create_task(
+                        self._run_async(self._async_budget, time.perf_counter())
+                    )
+                return
+
         count = 0
         self.__running += 1
 
+        hooks = self.hooks
+        if hooks is not None and self.__running == 1 and self._scheduler_fns:
+            hooks.on_flush_start()
+        else:
+            hooks = None
+
+        # rounds each caller was scheduled in, see `_check_round`
+        watch: Optional[_RunawayWatch] = None
+
         try:
-            while self._scheduler_fns:
-                self._run_scheduler_fns()
+            while self._scheduler_fns or (
+                self.__running == 1 and self._post_flush_fns
+            ):
+                if not self._scheduler_fns:
+                    self._run_post_flush_fns()
+                    continue
 
                 count += 1
-                if count >= 10000:  # pragma: no cover
-                    raise Exception("exceeded the maximum number of execution rounds.")
+                watch = self._check_round(count, watch)
+                self._run_scheduler_fns(watch)
         finally:
             self.__running -= 1
+            if hooks is not None:
+                hooks.on_flush_end()
+
+    async def run_sliced(self, budget: float = 0.005):
+        """Runs the queued effects like `run`, yielding to the event loop whenever a
+        slice has taken `budget` seconds.
+
+        Effects keep running in order: writes made from other tasks between two
+        slices are queued into this flush, and computeds are pulled fresh when an
+        effect reads them, so no effect observes half-propagated state.
+        """
+        await self._run_sliced(budget, time.perf_counter())
+
+    async def _run_async(self, budget: float, requested: float):
+        try:
+            await self._run_sliced(budget, requested)
+        finally:
+            self._async_task = None
+
+    async def _run_sliced(self, budget: float, requested: float):
+        clock = time.perf_counter
+        stats = self.sliced_stats
+        self.__running += 1
+
+        hooks = self.hooks
+        if hooks is not None and self._scheduler_fns:
+            hooks.on_flush_start()
+        else:
+            hooks = None
+
+        count = 0
+        watch: Optional[_RunawayWatch] = None
+        # the rest of the current round
+        pending: deque = deque()
 
-    def _run_scheduler_fns(self):
-        fns = tuple(self._scheduler_fns.keys())
-        self._scheduler_fns.clear()
+        try:
+            while True:
+                slice_start = clock()
+                deadline = slice_start + budget
+                stats.slices += 1
+
+                # at least one function per slice, whatever the budget
+                while True:
+                    if not pending:
+                        if not self._scheduler_fns:
+                            if not self._post_flush_fns:
+                                break
+                            self._run_post_flush_fns()
+                            continue
+
+                        count += 1
+                        watch = self._check_round(count, watch)
+                        pending.extend(self._scheduler_fns)
+                        self._scheduler_fns = []
+
+                    fn = pending.popleft()
+                    try:
+                        if watch is None:
+                            fn()
+                        else:
+                            watch.run(self, fn)
+                    except BaseException:
+                        _release_queued(pending)
+                        raise
+
+                    if clock() >= deadline:
+                        break
+
+                stats.max_slice_time = max(stats.max_slice_time, clock() - slice_start)
+
+                if not (pending or self._scheduler_fns or self._post_flush_fns):
+                    break
+
+                await asyncio.sleep(0)
+        finally:
+            self.__running -= 1
+            if hooks is not None:
+                hooks.on_flush_end()
+
+        latency = clock() - requested
+        stats.flushes += 1
+        stats.total_latency += latency
+        stats.max_latency = max(stats.max_latency, latency)
+
+    def _check_round(self, count: int, watch: Optional[_RunawayWatch]):
+        """Enforces the loop budget before round `count` runs.
+
+        Callers are only counted once the flush is longer than `runaway_rounds`, no
+        caller can exceed the limit before.
+        """
+        runaway_rounds = self.runaway_rounds
+        if runaway_rounds is not None and count > runaway_rounds:
+            if watch is None:
+                watch = _RunawayWatch()
+            scheduled = watch.scheduled
+            scheduled.update(_callers_of(self._scheduler_fns))
+
+            if scheduled and max(scheduled.values()) > runaway_rounds:
+                threshold = runaway_rounds // 2
+                looping = {c for c, n in scheduled.items() if n >= threshold}
+                # effects only reading the looping signals are not to blame
+                self._abort(
+                    "runaway effects detected.",
+                    (looping & watch.producers) or looping,
+                )
+
+        if count > self.max_rounds:
+            self._abort(
+                "exceeded the maximum number of execution rounds.",
+                _callers_of(self._scheduler_fns),
+            )
+
+        return watch
+
+    def _abort(self, message: str, callers: Set[Any]):
+        _release_queued(self._scheduler_fns)
+        self._scheduler_fns = []
+        raise SchedulerLoopError(message, sorted(callers, key=node_name))
+
+    def _run_post_flush_fns(self):
+        fns = tuple(self._post_flush_fns.keys())
+        self._post_flush_fns.clear()
         for fn in fns:
             fn()
 
+    def _run_scheduler_fns(self, watch: Optional[_RunawayWatch] = None):
+        fns = self._scheduler_fns
+        self._scheduler_fns = []
+        index = 0
+        try:
+            if watch is None:
+                for index, fn in enumerate(fns):
+                    fn()
+            else:
+                for index, fn in enumerate(fns):
+                    watch.run(self, fn)
+        except BaseException:
+            # the effects that did not run can be queued again
+            _release_queued(fns[index + 1 :])
+            raise
+
+
+class _RunawayWatch:
+    """What `_check_round` records once a flush is longer than `runaway_rounds`."""
+
+    __slots__ = ("scheduled", "producers")
+
+    def __init__(self) -> None:
+        # caller -> rounds it was scheduled in
+        self.scheduled: Counter = Counter()
+        # callers whose runs scheduled other callers
+        self.producers: Set[Any] = set()
+
+    def run(self, scheduler: ExecutionScheduler, fn: Callable[[], None]):
+        queued = len(scheduler._scheduler_fns)
+        fn()
+        if len(scheduler._scheduler_fns) > queued:
+            self.producers.update(_callers_of((fn,)))
+
+
+def _release_queued(fns):
+    """Clears the queued flag of the effects behind `fns`, dropped from the queue."""
+    for caller in _callers_of(fns):
+        caller._queued = False
+
+
+def _callers_of(fns) -> Set[Any]:
+    """The effects behind queued functions (`Effect._run_queued` bound methods)."""
+    callers = set()
+    for fn in fns:
+        caller = getattr(fn, "__self__", None)
+        if caller is not None and hasattr(caller, "_queued"):
+            callers.add(caller)
+    return callers
+
 
 # class BatchExecutionScheduler(ExecutionScheduler):
 #     def __init__(self) -> None:
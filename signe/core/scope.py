@@ -1,11 +1,14 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Callable, List, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeVar, Union
 
 from weakref import WeakSet
 import warnings
 
+from .consts import EffectState
+
 if TYPE_CHECKING:  # pragma: no cover
     from .protocols import DisposableProtocol
+    from .signal import Signal
 
 
 _T = TypeVar("_T")
@@ -17,9 +20,15 @@ class Scope:
         self._active = True
         self._detached = detached
         self._disposables: WeakSet[DisposableProtocol] = WeakSet()
+        self._signals: WeakSet[Signal] = WeakSet()
+        # pending `track_signals` calls on this scope
+        self._track_signals = 0
         self._cleanups: List[Callable[[], None]] = []
         self._parent: Optional[Scope] = None
         self._scopes: List[Scope] = []
+        self._paused = False
+        # effects triggered while this scope was paused
+        self._dirty: Dict[Any, None] = {}
 
         # child scope's index in parent's `self._scopes`
         self._index = -1
@@ -33,6 +42,56 @@ class Scope:
     def active(self):
         return self._active
 
+    @property
+    def paused(self):
+        """Whether this scope or one of its (non-detached) ancestors is paused."""
+        return self._paused_scope() is not None
+
+    def _paused_scope(self) -> Optional[Scope]:
+        scope: Optional[Scope] = self
+        while scope is not None:
+            if scope._paused:
+                return scope
+            if scope._detached:
+                return None
+            scope = scope._parent
+        return None
+
+    def pause(self):
+        """Suspends the effects and computeds of this scope and its child scopes.
+
+        While paused, a write only marks them dirty. `resume` runs each dirty effect
+        once, however many writes happened in between.
+
+        ## Example
+        ```
+        tab = scope()
+        tab.run(build_tab)
+        tab.pause()
+        count.value += 1  # effects of the tab do not run
+        tab.resume()  # they run once here
+        ```
+        """
+        if self._active and not self._paused:
+            self._paused = True
+            self._suite._paused_count += 1
+
+    def resume(self):
+        if not self._paused:
+            return
+
+        self._paused = False
+        self._suite._paused_count -= 1
+        dirty, self._dirty = self._dirty, {}
+
+        outer = None if self._detached or not self._parent else self._parent._paused_scope()
+        if outer is not None:
+            # still suspended by an ancestor
+            outer._dirty.update(dirty)
+            return
+
+        _trigger_dirty(dirty)
+
     def run(self, fn: Callable[[], _T]) -> Union[_T, None]:
         if self.active:
             current_scope = self._suite._ACTIVE_SCOPE
@@ -59,32 +118,141 @@ class Scope:
     def add_disposable(self, disposable: DisposableProtocol):
         self._disposables.add(disposable)
 
+    def add_signal(self, signal: Signal):
+        self._signals.add(signal)
+
+    def track_signals(self):
+        """Records the signals created in this scope and its child scopes from now on,
+        see `get_signals`, until the matching `untrack_signals`. Off by default, a
+        `SnapshotManager` turns it on until it is closed."""
+        self._track_signals += 1
+        self._suite._tracking_scopes += 1
+
+    def untrack_signals(self):
+        """Undoes one `track_signals` call."""
+        if self._track_signals == 0:
+            return
+
+        self._track_signals -= 1
+        self._suite._tracking_scopes -= 1
+
+    def get_signals(self) -> List[Signal]:
+        """Returns the live signals created in this scope and its child scopes while
+        `track_signals` was on."""
+        result: List[Signal] = []
+        stack = [self]
+        while stack:
+            current = stack.pop()
+            result.extend(current._signals)
+            stack.extend(current._scopes)
+        return result
+
     def dispose(self, from_parent=False):
-        if self._active:
-            for effect in self._disposables:
-                effect.dispose()
+        if not self._active:
+            return
+
+        if not from_parent:
+            self._detach_from_parent()
+
+        # walked iteratively, so deep nesting is fine
+        stack = [self]
+        while stack:
+            current = stack.pop()
+            if current._active:
+                current._dispose_self()
+                stack.extend(reversed(current._scopes))
+
+    def teardown(self):
+        """Disposes this scope and all its child scopes, for the case where everything
+        created in the tree dies together.
 
-            for cleanup in self._cleanups:
+        Only the subscriptions to sources outside the tree are removed one by one, the
+        edges between its own effects and computeds are dropped with them. Scope
+        cleanups run after every node of the tree is released.
+        """
+        if not self._active:
+            return
+
+        self._detach_from_parent()
+
+        scopes: List[Scope] = []
+        stack = [self]
+        while stack:
+            current = stack.pop()
+            if current._active:
+                # inactive from here on, effects read it to tell interior edges apart
+                current._active = False
+                scopes.append(current)
+                stack.extend(reversed(current._scopes))
+
+        # held strongly until the weak sets are cleared, so nodes do not die mid-way;
+        # read from the underlying set of references, iterating a `WeakSet` is slow
+        nodes = [
+            node
+            for current in scopes
+            for node_ref in current._disposables.data
+            if (node := node_ref()) is not None
+        ]
+        for node in nodes:
+            release = getattr(node, "_release", None)
+            if release is None:
+                node.dispose()
+            else:
+                release()
+
+        leak_watch = self._suite._leak_watch
+        if leak_watch is not None:
+            leak_watch.update(nodes)
+
+        for current in scopes:
+            if current._paused:
+                current._paused = False
+                current._suite._paused_count -= 1
+                current._dirty.clear()
+
+            for cleanup in current._cleanups:
                 cleanup()
 
-            for child_scope in self._scopes:
-                child_scope.dispose(True)
-
-            if (
-                (not self._detached)
-                and self._parent
-                and (not from_parent)
-                and self._parent._scopes
-            ):
-                last = self._parent._scopes.pop()
-                if last is not self:
-                    # swap position with the last element
-                    self._parent._scopes[self._index] = last
-                    last._index = self._index
-
-            self._disposables.clear()
-            self._parent = None
-            self._active = False
+            current._stop_tracking_signals()
+            current._disposables.clear()
+            current._signals.clear()
+            current._scopes = []
+            current._parent = None
+
+    def _dispose_self(self):
+        """Disposes what this scope owns, its child scopes are left to the caller."""
+        if self._paused:
+            self._paused = False
+            self._suite._paused_count -= 1
+            self._dirty.clear()
+
+        for effect in self._disposables:
+            effect.dispose()
+
+        for cleanup in self._cleanups:
+            cleanup()
+
+        leak_watch = self._suite._leak_watch
+        if leak_watch is not None:
+            leak_watch.update(self._disposables)
+
+        self._stop_tracking_signals()
+        self._disposables.clear()
+        self._signals.clear()
+        self._parent = None
+        self._active = False
+
+    def _stop_tracking_signals(self):
+        self._suite._tracking_scopes -= self._track_signals
+        self._track_signals = 0
+
+    def _detach_from_parent(self):
+        if (not self._detached) and self._parent and self._parent._scopes:
+            last = self._parent._scopes.pop()
+            if last is not self:
+                # swap position with the last element
+                self._parent._scopes[self._index] = last
+                last._index = self._index
 
     # def mark_with_scope(self, effect: DisposableProtocol):
     #     scope = scope or self._suite._ACTIVE_SCOPE
@@ -92,9 +260,38 @@ class Scope:
     #         scope._add_disposable(effect)
 
 
+def _trigger_dirty(dirty: Dict[Any, None]):
+    """Triggers the effects recorded by a paused scope, one flush per scheduler."""
+    schedulers: Dict[Any, None] = {}
+    try:
+        for effect in dirty:
+            # effects brought up to date while paused (e.g. a computed pulled from
+            # outside the scope) have nothing left to do
+            if not effect._active or effect.state > EffectState.NEED_UPDATE:
+                continue
+
+            scheduler = effect._scheduler
+            if scheduler not in schedulers:
+                scheduler.pause_scheduling()
+                schedulers[scheduler] = None
+
+            effect.trigger(effect.state)
+    finally:
+        for scheduler in schedulers:
+            scheduler.reset_scheduling()
+            if scheduler.should_run:
+                scheduler.run()
+
+
 class ScopeSuite:
     def __init__(self) -> None:
         self._ACTIVE_SCOPE: Optional[Scope] = None
+        # number of paused scopes, effects skip the pause check while it is 0
+        self._paused_count = 0
+        # disposed nodes watched by a `LeakTracker`
+        self._leak_watch: Optional[WeakSet] = None
+        # pending `Scope.track_signals` calls, new signals skip the scopes while it is 0
+        self._tracking_scopes = 0
 
     def scope(self, detached=False):
         return Scope(self, detached)
@@ -103,6 +300,18 @@ class ScopeSuite:
         if self._ACTIVE_SCOPE:
             self._ACTIVE_SCOPE.add_disposable(effect)
 
+    def mark_signal(self, signal: Signal):
+        """Records `signal` in the active scope if it, or an ancestor it is listed
+        by, tracks signals."""
+        scope = self._ACTIVE_SCOPE
+        while scope is not None:
+            if scope._track_signals:
+                self._ACTIVE_SCOPE.add_signal(signal)  # type: ignore
+                return
+            if scope._detached:
+                return
+            scope = scope._parent
+
     def get_current_scope(
         self,
     ):
@@ -16,7 +16,9 @@ from signe.core.id_generator import IdGen
 
 from signe.core.deps import GetterDepManager
 from signe.core.protocols import SignalResultProtocol
+from .batch import _ROLLBACK_BATCHES
 from .context import get_default_scheduler
+from .scope import _DEFAULT_SCOPE_SUITE
 from .types import TMaybeSignal
 from collections.abc import Hashable
 import operator
@@ -85,16 +87,30 @@ class Signal(Generic[_T], ReadableMixin[_T]):
         self._value = value if is_shallow else to_reactive(value, self._scheduler)
         self._raw_value = value if is_shallow else to_raw(value)
 
-        self._dep_manager = GetterDepManager(self._scheduler)
+        self._dep_manager = GetterDepManager(self._scheduler, self)
 
         self.option = option or SignalOption[_T]()
         self.__debug_name = debug_name
         self._option_comp = cast(Callable[[_T, _T], bool], self.option.comp)
 
+        self._register()
+
+    def _register(self):
+        # only registered for the features that list signals, see `track_signals`
+        signals = self._scheduler._signals
+        if signals is not None:
+            signals.add(self)
+        if _DEFAULT_SCOPE_SUITE._tracking_scopes:
+            _DEFAULT_SCOPE_SUITE.mark_signal(self)
+
     @property
     def id(self):
         return self.__id  # pragma: no cover
 
+    @property
+    def debug_name(self) -> Optional[str]:
+        return self.__debug_name
+
     @property
     def value(self):
         self._dep_manager.tracked("value")
@@ -116,17 +132,47 @@ class Signal(Generic[_T], ReadableMixin[_T]):
         if self._option_comp(self._raw_value, new_value):  # type: ignore
             return
 
+        scheduler = self._scheduler
+        rollback_batches = _ROLLBACK_BATCHES.get()
+        if rollback_batches:
+            for txn in rollback_batches:
+                if txn._scheduler is scheduler:
+                    txn.record(self)
+
+        if scheduler._batch_depth:
+            # compared with the pre-batch value when the batch commits
+            scheduler.defer_write(self, self._raw_value)
+
         self._raw_value = new_value
-        self._value = (
-            new_value if use_direct else to_reactive(new_value, self._scheduler)
-        )
+        self._value = new_value if use_direct else to_reactive(new_value, scheduler)
 
-        self._dep_manager.triggered("value", new_value, EffectState.NEED_UPDATE)
+        if not scheduler._batch_depth:
+            self._dep_manager.triggered("value", new_value, EffectState.NEED_UPDATE)
+
+    def _commit_write(self, original):
+        """Notifies the subscribers if the value differs from `original`."""
+        if not self._option_comp(original, self._raw_value):  # type: ignore
+            self._dep_manager.triggered(
+                "value", self._raw_value, EffectState.NEED_UPDATE
+            )
 
     def __repr__(self) -> str:
         return f"Signal(id= {self.id} , name = {self.__debug_name})"
 
 
+class _InternalSignal(Signal[_T]):
+    """A signal that belongs to the machinery of another node: `get_signals` does
+    not list it, so snapshots neither capture nor restore it."""
+
+    __slots__ = ()
+
+    def __init__(self, value: _T, *, scheduler: ExecutionScheduler):
+        super().__init__(value, scheduler=scheduler, is_shallow=True)
+
+    def _register(self):
+        pass
+
+
 @overload
 def signal(
     value: SignalResultProtocol[_T],
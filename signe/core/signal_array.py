@@ -0,0 +1,231 @@
+from __future__ import annotations
+import operator
+from array import array
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from signe.core.consts import EffectState
+from signe.core.context import get_default_scheduler
+from signe.core.deps import GetterDepManager
+from signe.core.helper import has_changed
+from signe.core.id_generator import IdGen
+from signe.core.mixins import ReadableMixin
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .runtime import ExecutionScheduler
+
+
+_T = TypeVar("_T")
+
+# dep key of the readers of the whole array
+_ALL = "all"
+
+
+class SignalArray:
+    """Many scalar signals stored in one flat buffer.
+
+    Values live in an `array.array` (or any sequence passed with `typecode=None`,
+    e.g. a NumPy array). A dependency is only created for an index once an effect
+    or computed reads it, so unobserved elements cost nothing but their storage.
+    Reading a slice depends on each element of the slice.
+
+    ## Example
+    ```
+    readings = signal_array([0.0] * 2_000_000)
+
+    @effect
+    def watch():
+        print(readings[42])
+
+    readings[0:1000] = new_values  # watch runs only if readings[42] changed
+    ```
+    """
+
+    _id_gen = IdGen("SignalArray")
+
+    def __init__(
+        self,
+        values: Iterable,
+        *,
+        typecode: Optional[str] = "d",
+        scheduler: ExecutionScheduler,
+        debug_name: Optional[str] = None,
+    ) -> None:
+        self.__id = self._id_gen.new()
+        self._data: Any = values if typecode is None else array(typecode, values)
+        self._debug_name = debug_name
+        try:
+            memoryview(self._data)
+            self._is_buffer = True
+        except TypeError:
+            self._is_buffer = False
+        self._dep_manager = GetterDepManager(scheduler, self)
+
+    @property
+    def id(self):
+        return self.__id  # pragma: no cover
+
+    @property
+    def debug_name(self) -> Optional[str]:
+        return self._debug_name
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def value(self) -> Union[memoryview, tuple]:
+        """All the values, its readers depend on every element.
+
+        A read-only view when the storage is a buffer (`array.array`, NumPy...), a
+        tuple copy otherwise (e.g. a list passed with `typecode=None`).
+        """
+        self._dep_manager.tracked(_ALL)
+        if self._is_buffer:
+            return memoryview(self._data).toreadonly()
+        return tuple(self._data)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            if self._dep_manager._scheduler.get_running_caller() is not None:
+                for i in range(*index.indices(len(self._data))):
+                    self._dep_manager.tracked(i)
+            return self._data[index]
+
+        index = self._normalize(index)
+        self._dep_manager.tracked(index)
+        return self._data[index]
+
+    def __setitem__(self, index: Union[int, slice], value):
+        if isinstance(index, slice):
+            self._assign(index, value)
+            return
+
+        index = self._normalize(index)
+        old = self._data[index]
+        self._data[index] = value
+
+        if has_changed(old, self._data[index]):
+            self._dep_manager.triggered_keys((index, _ALL), EffectState.NEED_UPDATE)
+
+    def at(self, index: int) -> SignalArrayItem:
+        """A signal-like handle on one element, usable with `on`, `to_value`..."""
+        return SignalArrayItem(self, self._normalize(index))
+
+    def assign(self, values: Iterable):
+        """Replaces all the values, the length must not change."""
+        self._assign(slice(None), values)
+
+    def update(self, indices: Iterable[int], values: Iterable):
+        """Writes `values` at scattered `indices`, notifying once."""
+        data = self._data
+        changed: List[Any] = []
+        for index, value in zip(indices, values):
+            index = self._normalize(index)
+            old = data[index]
+            data[index] = value
+            if has_changed(old, data[index]):
+                changed.append(index)
+
+        if changed:
+            changed.append(_ALL)
+            self._dep_manager.triggered_keys(changed, EffectState.NEED_UPDATE)
+
+    def _assign(self, index: slice, values):
+        data = self._data
+        span = range(*index.indices(len(data)))
+        if isinstance(data, array) and not isinstance(values, array):
+            values = array(data.typecode, values)
+        if len(values) != len(span):
+            raise ValueError(
+                f"cannot assign {len(values)} values to {len(span)} elements."
+            )
+
+        deps_map = self._dep_manager._deps_map
+        # only the observed indices are compared one by one
+        if len(deps_map) < len(span):
+            observed = [key for key in deps_map if isinstance(key, int) and key in span]
+        else:
+            observed = [i for i in span if i in deps_map]
+        olds = [data[i] for i in observed]
+
+        any_changed = _ALL in deps_map and has_changed(data[index], values)
+        data[index] = values
+
+        changed: List[Any] = [
+            i for i, old in zip(observed, olds) if has_changed(old, data[i])
+        ]
+        if any_changed or changed:
+            changed.append(_ALL)
+            self._dep_manager.triggered_keys(changed, EffectState.NEED_UPDATE)
+
+    def _normalize(self, index: int) -> int:
+        # numpy integers included, dep keys are always plain ints
+        try:
+            index = operator.index(index)
+        except TypeError:
+            raise TypeError(
+                f"SignalArray indices must be integers or slices, not {type(index).__name__}"
+            ) from None
+
+        if index < 0:
+            index += len(self._data)
+        if not 0 <= index < len(self._data):
+            raise IndexError("SignalArray index out of range")
+        return index
+
+    def __repr__(self) -> str:
+        return f"SignalArray(id= {self.id} , name = {self._debug_name}, size={len(self)})"
+
+
+class SignalArrayItem(Generic[_T], ReadableMixin[_T]):
+    """One element of a `SignalArray`, created on demand."""
+
+    __slots__ = ("_array", "_index")
+
+    def __init__(self, source: SignalArray, index: int) -> None:
+        self._array = source
+        self._index = index
+
+    @property
+    def value(self) -> _T:
+        return self._array[self._index]
+
+    @value.setter
+    def value(self, value: _T):
+        self._array[self._index] = value
+
+    def set_value(self, value: _T):
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"SignalArrayItem(array={self._array.id}, index={self._index})"
+
+
+def signal_array(
+    values: Iterable,
+    typecode: Optional[str] = "d",
+    *,
+    debug_name: Optional[str] = None,
+    scheduler: Optional[ExecutionScheduler] = None,
+) -> SignalArray:
+    """Creates a `SignalArray`.
+
+    Args:
+        values (Iterable): the initial values.
+        typecode (Optional[str], optional): `array.array` typecode of the storage,
+            `None` keeps `values` itself as the storage. Defaults to "d".
+    """
+    return SignalArray(
+        values,
+        typecode=typecode,
+        scheduler=scheduler or get_default_scheduler(),
+        debug_name=debug_name,
+    )
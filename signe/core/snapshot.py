@@ -0,0 +1,255 @@
+from __future__ import annotations
+from contextlib import ExitStack
+from copy import copy, deepcopy
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from weakref import WeakKeyDictionary, finalize
+
+from signe.core.batch import batch
+from signe.core.helper import has_changed
+from signe.core.reactive import ChangeRecord, DeepWatcher, is_reactive
+from signe.core.runtime import ExecutionScheduler
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .scope import Scope
+    from .signal import Signal
+
+
+# a snapshot is flattened after this many deltas, which bounds the lookup cost
+_MAX_CHAIN_DEPTH = 32
+
+
+class Snapshot:
+    """Immutable capture of signal values.
+
+    A snapshot only stores the signals that changed since the previous snapshot of the
+    same `SnapshotManager`, and unchanged containers are shared between snapshots.
+    Values must be treated as read-only.
+    """
+
+    __slots__ = ("_parent", "_delta", "_depth")
+
+    def __init__(self, parent: Optional[Snapshot], delta: Dict[Signal, Any]) -> None:
+        self._parent = parent
+        self._delta = delta
+        self._depth = 0 if parent is None else parent._depth + 1
+
+        if self._depth >= _MAX_CHAIN_DEPTH:
+            self._delta = self.to_dict()
+            self._parent = None
+            self._depth = 0
+
+    def get(self, signal: Signal, default: Any = None) -> Any:
+        node: Optional[Snapshot] = self
+        while node is not None:
+            if signal in node._delta:
+                return node._delta[signal]
+            node = node._parent
+        return default
+
+    def __contains__(self, signal: Signal) -> bool:
+        node: Optional[Snapshot] = self
+        while node is not None:
+            if signal in node._delta:
+                return True
+            node = node._parent
+        return False
+
+    def to_dict(self) -> Dict[Signal, Any]:
+        deltas = []
+        node: Optional[Snapshot] = self
+        while node is not None:
+            deltas.append(node._delta)
+            node = node._parent
+
+        result: Dict[Signal, Any] = {}
+        for delta in reversed(deltas):
+            result.update(delta)
+        return result
+
+    @property
+    def changed_signals(self) -> List[Signal]:
+        """Signals whose value was captured by this snapshot rather than shared."""
+        return list(self._delta)
+
+
+class _Tracked:
+    __slots__ = ("raw", "frozen", "watcher")
+
+    def __init__(self, raw, frozen, watcher: Optional[DeepWatcher]) -> None:
+        self.raw = raw
+        self.frozen = frozen
+        self.watcher = watcher
+
+
+class SnapshotManager:
+    """Takes snapshots of the signals of a scheduler or a scope, and restores them.
+
+    Nested reactive values are followed through their change journal, so a snapshot
+    only copies the containers on the paths that were mutated.
+
+    Signals are only listed while a manager of their scheduler (or scope) is open:
+    create it before the signals to capture. `close` (or dropping the manager) stops
+    the listing, signals that belong to other nodes (such as the state signals of an
+    `async_computed`) are never listed.
+
+    ## Example
+    ```
+    history = SnapshotManager(get_default_scheduler())
+    s1 = history.snapshot()
+    ...
+    history.restore(s1)
+    history.close()
+    ```
+    """
+
+    def __init__(self, source: Union[ExecutionScheduler, Scope]) -> None:
+        self._source = source
+        source.track_signals()
+        # the listing stops with the manager, even if it is never closed
+        self._finalizer = finalize(self, source.untrack_signals)
+
+        self._tracked: WeakKeyDictionary = WeakKeyDictionary()
+        self._last: Optional[Snapshot] = None
+
+    def close(self):
+        """Stops listing the signals of the source for this manager."""
+        self._finalizer()
+
+    def snapshot(self) -> Snapshot:
+        delta: Dict[Signal, Any] = {}
+
+        for signal in self._source.get_signals():
+            frozen, changed = self._capture(signal)
+            if changed:
+                delta[signal] = frozen
+
+        self._last = Snapshot(self._last, delta)
+        return self._last
+
+    def restore(self, snapshot: Snapshot):
+        """Writes back the values of `snapshot` in one batch.
+
+        Only signals whose current value differs from the snapshot are written.
+        """
+        changed: List[Tuple[Signal, Any]] = []
+
+        for signal, frozen in snapshot.to_dict().items():
+            current, _ = self._capture(signal)
+            if current is not frozen and has_changed(current, frozen):
+                changed.append((signal, frozen))
+
+        if not changed:
+            return
+
+        with ExitStack() as stack:
+            # one batch per scheduler, effects run once every signal is restored
+            for scheduler in {signal._scheduler: None for signal, _ in changed}:
+                stack.enter_context(batch(scheduler=scheduler))
+
+            for signal, frozen in changed:
+                signal.value = frozen if signal._is_shallow else deepcopy(frozen)
+
+                tracked = self._tracked[signal]
+                tracked.raw = signal._raw_value
+                tracked.frozen = frozen
+                self._watch(signal, tracked)
+
+    def _capture(self, signal: Signal) -> Tuple[Any, bool]:
+        tracked: Optional[_Tracked] = self._tracked.get(signal)
+        raw = signal._raw_value
+
+        if tracked is not None and tracked.raw is raw:
+            if tracked.watcher is None:
+                return tracked.frozen, False
+
+            records = tracked.watcher.drain()
+            if not records:
+                return tracked.frozen, False
+
+            tracked.frozen = _apply_records(tracked.frozen, records)
+            return tracked.frozen, True
+
+        frozen = raw if signal._is_shallow else deepcopy(raw)
+        if tracked is None:
+            tracked = _Tracked(raw, frozen, None)
+            self._tracked[signal] = tracked
+        else:
+            tracked.raw = raw
+            tracked.frozen = frozen
+
+        self._watch(signal, tracked)
+        return frozen, True
+
+    def _watch(self, signal: Signal, tracked: _Tracked):
+        value = signal._value
+        if not is_reactive(value):
+            if tracked.watcher is not None:
+                tracked.watcher.unwatch()
+            tracked.watcher = None
+            return
+
+        if tracked.watcher is None:
+            tracked.watcher = DeepWatcher(copy_values=True)
+
+        tracked.watcher.watch(value)
+        tracked.watcher.drain()
+
+
+def _get_child(node, key):
+    if isinstance(node, (dict, list)):
+        return node[key]
+    return getattr(node, key)
+
+
+def _set_child(node, key, value):
+    if isinstance(node, (dict, list)):
+        node[key] = value
+    else:
+        setattr(node, key, value)
+
+
+def _apply_records(root, records: List[ChangeRecord]):
+    """Path copying: only the containers along the changed paths are copied."""
+    copied = set()
+
+    def writable(node):
+        if id(node) in copied:
+            return node
+        node = copy(node)
+        copied.add(id(node))
+        return node
+
+    for record in records:
+        if not record.path:
+            # the values of the records already are private copies
+            root = record.value
+            copied.add(id(root))
+            continue
+
+        root = writable(root)
+        node = root
+        for key in record.path[:-1]:
+            child = writable(_get_child(node, key))
+            _set_child(node, key, child)
+            node = child
+
+        key = record.path[-1]
+        if record.op == "add" and isinstance(node, list):
+            node.insert(key, record.value)
+        elif record.op == "remove":
+            if isinstance(node, (dict, list)):
+                del node[key]
+            else:
+                delattr(node, key)
+        else:
+            _set_child(node, key, record.value)
+
+    return root
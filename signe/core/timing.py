@@ -0,0 +1,176 @@
+from __future__ import annotations
+import asyncio
+import heapq
+import itertools
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+)
+
+from signe.core.batch import api_batch
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .runtime import ExecutionScheduler
+
+
+class TimerHandle(Protocol):
+    def cancel(self): ...
+
+
+class Clock(Protocol):
+    """Time source of the rate-limiting operators."""
+
+    def now(self) -> float: ...
+
+    def call_later(self, delay: float, fn: Callable[[], None]) -> TimerHandle: ...
+
+
+class AsyncioClock:
+    """Timers of the asyncio event loop (the running one, or the current one)."""
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def call_later(self, delay: float, fn: Callable[[], None]) -> TimerHandle:
+        return asyncio.get_event_loop().call_later(delay, fn)
+
+
+class _ManualTimer:
+    __slots__ = ("cancelled",)
+
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class ManualClock:
+    """A clock that only moves with `advance`, for tests and simulations.
+
+    ## Example
+    ```
+    clock = ManualClock()
+    on(pos, fn, debounce=0.1, clock=clock)
+    pos.value = 1
+    clock.advance(0.1)  # fn runs here
+    ```
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = start
+        self._counter = itertools.count()
+        self._timers: List[Tuple[float, int, _ManualTimer, Callable[[], None]]] = []
+
+    def now(self) -> float:
+        return self._now
+
+    def call_later(self, delay: float, fn: Callable[[], None]) -> TimerHandle:
+        timer = _ManualTimer()
+        heapq.heappush(
+            self._timers, (self._now + delay, next(self._counter), timer, fn)
+        )
+        return timer
+
+    def advance(self, seconds: float):
+        """Moves the time forward, firing the due timers in order."""
+        target = self._now + seconds
+        while self._timers and self._timers[0][0] <= target:
+            when, _, timer, fn = heapq.heappop(self._timers)
+            self._now = when
+            if not timer.cancelled:
+                fn()
+        self._now = target
+
+
+_default_clock = AsyncioClock()
+
+
+def get_default_clock() -> Clock:
+    return _default_clock
+
+
+class RateLimiter:
+    """Delivers the calls submitted to it at a limited rate.
+
+    - `debounce`: calls once the submissions stop for `debounce` seconds.
+    - `throttle`: calls at once, then at most once per `throttle` seconds with the
+      latest submission.
+    - `sample`: calls once per `sample` seconds with the latest submission, if any.
+
+    Submissions arriving between two calls are combined with `merge` (by default the
+    latest wins). Delayed calls run in a batch of `scheduler`.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[..., None],
+        *,
+        debounce: Optional[float] = None,
+        throttle: Optional[float] = None,
+        sample: Optional[float] = None,
+        clock: Optional[Clock] = None,
+        scheduler: ExecutionScheduler,
+        merge: Optional[Callable[[Tuple, Tuple], Tuple]] = None,
+    ) -> None:
+        if sum(x is not None for x in (debounce, throttle, sample)) != 1:
+            raise ValueError("exactly one of debounce, throttle or sample is required.")
+
+        self._fn = fn
+        self._debounce = debounce
+        self._throttle = throttle
+        self._interval: float = debounce or throttle or sample or 0.0
+        self._clock = clock or get_default_clock()
+        self._scheduler = scheduler
+        self._merge = merge
+        self._pending: Optional[Tuple] = None
+        self._timer: Optional[TimerHandle] = None
+
+    def submit(self, args: Tuple = ()):
+        if self._debounce is not None:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._add_pending(args)
+            self._timer = self._clock.call_later(self._interval, self._fire)
+            return
+
+        if self._timer is None and self._throttle is not None:
+            # leading call
+            self._fn(*args)
+            self._timer = self._clock.call_later(self._interval, self._fire)
+            return
+
+        self._add_pending(args)
+        if self._timer is None:
+            self._timer = self._clock.call_later(self._interval, self._fire)
+
+    def cancel(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self._pending = None
+
+    def _add_pending(self, args: Tuple):
+        if self._pending is not None and self._merge is not None:
+            args = self._merge(self._pending, args)
+        self._pending = args
+
+    def _fire(self):
+        self._timer = None
+        if self._pending is None:
+            return
+
+        args: Any = self._pending
+        self._pending = None
+
+        if self._throttle is not None:
+            # keep throttling until a whole interval passes without submission
+            self._timer = self._clock.call_later(self._interval, self._fire)
+
+        api_batch(lambda: self._fn(*args), self._scheduler)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+from collections import Counter, deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from weakref import WeakKeyDictionary
+
+from .computed import Computed
+from .consts import EffectState
+from .profiling import SchedulerHooks, node_name
+from .signal import Signal
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .effect import Effect
+    from .runtime import ExecutionScheduler
+
+
+TCausePath = Tuple[str, ...]
+
+
+class EffectRun:
+    """One run of an effect, with every write → computed → effect path that caused it."""
+
+    __slots__ = ("name", "paths")
+
+    def __init__(self, name: str, paths: List[TCausePath]) -> None:
+        self.name = name
+        self.paths = paths
+
+    def __repr__(self) -> str:
+        return f"EffectRun(name={self.name}, paths={self.paths})"
+
+
+class CausalityTracer(SchedulerHooks):
+    """Records why each effect runs.
+
+    Every time a source wakes up a subscriber the (source, key) is remembered; when
+    an effect runs, the causes are followed back through the computeds to the
+    written signals (or reactive keys). Runs are grouped by flush, the latest
+    `max_flushes` flushes are kept.
+
+    ## Example
+    ```
+    tracer = CausalityTracer().attach(scheduler)
+    num.value = 2
+    tracer.causes(printer)  # [("num", "double", "printer")]
+    print(tracer.dump_collapsed())
+    ```
+    """
+
+    def __init__(self, *, max_flushes: int = 100) -> None:
+        self._scheduler: Optional[ExecutionScheduler] = None
+        self.flushes: Deque[List[EffectRun]] = deque(maxlen=max_flushes)
+        self._current: List[EffectRun] = []
+        # caller -> {(id(source), key): (source, key)}, reset after each flush
+        self._causes: Dict[Effect, Dict[Tuple[int, Any], Tuple[Any, Any]]] = {}
+        # effect -> its latest run, dropped with the effect
+        self._last_runs: WeakKeyDictionary[Effect, EffectRun] = WeakKeyDictionary()
+
+    def attach(self, scheduler: ExecutionScheduler) -> CausalityTracer:
+        self._scheduler = scheduler
+        scheduler.set_hooks(self)
+        return self
+
+    def detach(self):
+        if self._scheduler is not None and self._scheduler.hooks is self:
+            self._scheduler.set_hooks(None)
+        self._scheduler = None
+
+    def reset(self):
+        self.flushes.clear()
+        self._current = []
+        self._causes.clear()
+        self._last_runs.clear()
+
+    def causes(self, effect: Effect) -> List[TCausePath]:
+        """Cause paths of the latest recorded run of `effect`."""
+        run = self._last_runs.get(effect)
+        return list(run.paths) if run else []
+
+    def dump_collapsed(self) -> str:
+        """The recorded runs in the collapsed stack format of flame graph tools,
+        one `source;computed;...;effect count` line per path."""
+        counter: Counter = Counter()
+        for runs in self.flushes:
+            for run in runs:
+                for path in run.paths:
+                    counter[";".join(path)] += 1
+
+        return "\n".join(f"{stack} {count}" for stack, count in counter.items())
+
+    def on_caller_trigger(
+        self, caller: Effect, source: Any, key: Any, state: EffectState
+    ):
+        self._causes.setdefault(caller, {})[(id(source), key)] = (source, key)
+
+    def on_effect_start(self, effect: Effect):
+        if effect._owner is not None:
+            # a computed evaluating, its causes are reported by the effects reading it
+            return
+
+        run = EffectRun(node_name(effect), self._expand(effect, set()))
+        self._causes.pop(effect, None)
+        self._current.append(run)
+        self._last_runs[effect] = run
+
+    def on_flush_end(self):
+        if self._current:
+            self.flushes.append(self._current)
+            self._current = []
+        self._causes.clear()
+
+    def _expand(self, caller: Effect, visiting: set) -> List[TCausePath]:
+        name = node_name(caller._owner or caller)
+        causes = self._causes.get(caller)
+        if not causes or caller in visiting:
+            return [(name,)]
+
+        visiting.add(caller)
+        paths: List[TCausePath] = []
+        for source, key in causes.values():
+            if isinstance(source, Computed) and source._effect is not None:
+                for path in self._expand(source._effect, visiting):
+                    paths.append(path + (name,))
+            else:
+                paths.append((_source_name(source, key), name))
+        visiting.discard(caller)
+
+        return paths
+
+
+def _source_name(source: Any, key: Any) -> str:
+    name = node_name(source)
+    if isinstance(source, Signal):
+        return name
+    return f"{name}[{key}]"